@@ -0,0 +1,10 @@
+from .api_key_cache import ApiKeyVerifier, api_key_verifier
+from .device_cache import CachedDevice, DeviceCache, device_cache
+
+__all__ = [
+    "ApiKeyVerifier",
+    "api_key_verifier",
+    "CachedDevice",
+    "DeviceCache",
+    "device_cache",
+]
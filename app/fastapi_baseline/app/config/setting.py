@@ -96,6 +96,30 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    # ------------------------------
+    # Device auth cache
+    # ------------------------------
+    device_cache_size: int = Field(
+        default=100_000,
+        ge=0,
+        alias="DEVICE_CACHE_SIZE",
+        description="Max devices kept in the per-worker auth cache (0 disables).",
+    )
+
+    device_cache_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        alias="DEVICE_CACHE_TTL",
+        description="Seconds a cached device registry entry stays valid.",
+    )
+
+    device_cache_negative_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        alias="DEVICE_CACHE_NEGATIVE_TTL",
+        description="Seconds an unknown device UUID stays cached as not found.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
@@ -44,6 +44,7 @@ app.add_middleware(
     allow_credentials=False,  # no cookies for devices
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type", "x-api-key"],
+    expose_headers=["X-Next-Cursor", "Link"],  # listing pagination
 )
 
 # ====================
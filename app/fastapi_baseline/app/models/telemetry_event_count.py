@@ -0,0 +1,46 @@
+# app/models/telemetry_event_count.py
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class TelemetryEventCount(Base):
+    """
+    Sharded running count of telemetry_event rows, maintained by
+    statement-level triggers. The total is the sum over all shards.
+    """
+
+    __tablename__ = "telemetry_event_count"
+    __table_args__ = {"schema": "app"}
+
+    shard: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        doc="Counter shard (backend pid modulo shard count).",
+    )
+
+    row_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        doc="Rows counted by this shard; may be negative after deletes.",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Timestamp when this shard was last updated.",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TelemetryEventCount shard={self.shard} "
+            f"row_count={self.row_count} updated_at={self.updated_at}>"
+        )
@@ -1,10 +1,15 @@
 # app/routers/telemetry.py
 from __future__ import annotations
 
-import hashlib
-import hmac
+import base64
+import binascii
+import csv
+import io
+import json
 import logging
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import UUID
 
 from fastapi import (
@@ -15,18 +20,23 @@ from fastapi import (
     Query,
     APIRouter,
     HTTPException,
+    Request,
+    Response,
     status,
 )
-from sqlalchemy import select, func
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, or_, select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import api_key_verifier, device_cache
 from ..db import get_db
-from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
+from ..models import DeviceRegistry, TelemetryEvent, TelemetryEventCount, TelemetryLatest
 from ..schemas import (
     TelemetryCreate,
     TelemetryItem,
     TelemetryCountItem,
+    TelemetryBatchItem,
     TelemetryLatestItem,
 )
 
@@ -42,22 +52,29 @@ MAX_LATEST_SECONDS = 24 * 3600      # 24 hours
 
 TELEMETRY_CACHE_TTL_SECONDS = 60    # Short TTL to limit staleness
 
+MAX_BATCH_SIZE = 500                # Max telemetry events per batch request
 
-# ============================================================
-# Helper functions
-# ============================================================
-def verify_api_key(api_key: str, stored_hash: str | None) -> bool:
-    """
-    Verify a plain-text API key against a stored SHA-256 hex digest.
-    """
-    if not stored_hash:
-        return False
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-    stored_hash = stored_hash.strip().lower()
-    candidate_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
-    return hmac.compare_digest(candidate_hash, stored_hash)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"  # cursor of the next listing page
 
+EXPORT_CHUNK_ROWS = 1000            # Rows fetched from the server-side cursor per chunk
 
+# Core INSERT ... RETURNING for the single-event ingest path. Built once at
+# import so the compiled SQL (and asyncpg's prepared statement) is reused,
+# and the stored row comes back without a post-commit SELECT.
+INSERT_TELEMETRY_STMT = insert(TelemetryEvent.__table__).returning(
+    TelemetryEvent.__table__.c.device_uuid,
+    TelemetryEvent.__table__.c.x_coord,
+    TelemetryEvent.__table__.c.y_coord,
+    TelemetryEvent.__table__.c.device_time,
+    TelemetryEvent.__table__.c.system_time_utc,
+)
+
+
+# ============================================================
+# Helper functions
+# ============================================================
 def normalize_time_window(
     start_time: datetime | None,
     end_time: datetime | None,
@@ -107,6 +124,78 @@ def normalize_time_window(
     return start_time, end_time
 
 
+def encode_cursor(system_time_utc: datetime, event_id: int) -> str:
+    """
+    Opaque listing cursor: the (system_time_utc, id) of the last item returned,
+    as "<microseconds since epoch>:<id>" in unpadded URL-safe base64.
+    """
+    micros = (system_time_utc - EPOCH) // timedelta(microseconds=1)
+    raw = f"{micros}:{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def set_next_cursor(request: Request, response: Response, next_cursor: str | None) -> None:
+    """
+    Advertise the next listing page in headers, leaving the body a plain
+    array: the cursor itself, and the page URL as `Link: <...>; rel="next"`.
+    """
+    if next_cursor is None:
+        return
+    url = request.url.include_query_params(cursor=next_cursor)
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    response.headers["Link"] = f'<{url.path}?{url.query}>; rel="next"'
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Inverse of encode_cursor.
+
+    Raises:
+        HTTPException(400): the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, event_id = raw.split(":")
+        return EPOCH + timedelta(microseconds=int(micros)), int(event_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        ) from exc
+
+
+async def load_device_registry(
+    device_uuid: UUID,
+    db: AsyncSession,
+) -> DeviceRegistry | None:
+    """
+    Load a device registry entry from Postgres.
+
+    Returns None if the device is not registered.
+    """
+    stmt = select(DeviceRegistry).where(
+        DeviceRegistry.device_uuid == device_uuid)
+
+    try:
+        result = await db.execute(stmt)
+        device = result.scalar_one_or_none()
+    except SQLAlchemyError as exc:
+        logger.exception(
+            "Database error while authenticating device",
+            extra={"device_uuid": str(device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to authenticate device.",
+        ) from exc
+
+    if device is not None:
+        # Shared across requests via device_cache: detach from this session
+        db.expunge(device)
+
+    return device
+
+
 async def get_authenticated_device(
     device_uuid: UUID = Path(
         ...,
@@ -122,7 +211,7 @@ async def get_authenticated_device(
     Authenticate a device using its UUID and API key.
 
     Steps:
-    1. Look up the device by device_uuid in DeviceRegistry.
+    1. Look up the device by device_uuid (in-process cache, then DB).
     2. Verify the provided API key against the stored hash.
     3. Return the DeviceRegistry ORM instance on success.
 
@@ -135,33 +224,26 @@ async def get_authenticated_device(
         extra={"device_uuid": str(device_uuid)},
     )
 
-    stmt = select(DeviceRegistry).where(
-        DeviceRegistry.device_uuid == device_uuid)
-
-    try:
-        result = await db.execute(stmt)
-        device = result.scalar_one_or_none()
-    except SQLAlchemyError as exc:
-        logger.exception(
-            "Database error while authenticating device",
-            extra={"device_uuid": str(device_uuid)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to authenticate device.",
-        ) from exc
+    # try in-process cache, then Postgres
+    hit, cached = device_cache.get(device_uuid)
+    if not hit:
+        device = await load_device_registry(device_uuid, db)
+        cached = device_cache.set(device_uuid, device)
 
-    if device is None:
+    if cached is None:
         logger.warning(
             "Device not found in registry",
-            extra={"device_uuid": str(device_uuid)},
+            extra={"device_uuid": str(device_uuid), "cached": hit},
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Device not found.",
         )
 
-    if not verify_api_key(api_key=api_key, stored_hash=device.api_key_hash):
+    device = cached.device
+
+    # Verify API key (memoized per device and stored hash)
+    if not api_key_verifier.verify(device_uuid, api_key, cached.stored_hash):
         logger.warning(
             "Invalid API key for device",
             extra={"device_uuid": str(device_uuid)},
@@ -197,11 +279,12 @@ async def get_telemetry_count(
     """
     logger.debug("Fetching telemetry count (total telemetry event count)")
 
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    # Trigger-maintained sharded counter: constant-time regardless of table size
+    stmt = select(func.coalesce(func.sum(TelemetryEventCount.row_count), 0))
 
     try:
         result = await db.execute(stmt)
-        telemetry_count = result.scalar_one()
+        telemetry_count = int(result.scalar_one())
     except SQLAlchemyError as exc:
         logger.exception("Database error while fetching telemetry count")
         raise HTTPException(
@@ -228,11 +311,16 @@ async def get_telemetry_count(
         "The device must authenticate using the `X-API-Key` header. The time window can "
         "be specified using `start_time` and `end_time`, or by using `latest_seconds` "
         "to request data from a recent lookback period.\n\n"
-        "Results are ordered by `system_time_utc` in descending order (most recent first)."
+        "Results are ordered by `system_time_utc` in descending order (most recent first). "
+        "When more events remain, the response carries an `X-Next-Cursor` header (and a "
+        "`Link: rel=\"next\"` URL); pass it back as `cursor` to read the next, older page "
+        "of the same window."
     ),
     response_model=list[TelemetryItem],
 )
 async def list_telemetry_for_device(
+    request: Request,
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     start_time: datetime | None = Query(
         default=None,
@@ -264,6 +352,10 @@ async def list_telemetry_for_device(
         le=5000,
         description="Maximum number of telemetry records to return.",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description="`X-Next-Cursor` of the previous page; continues after its last item.",
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> list[TelemetryItem]:
     """
@@ -271,6 +363,10 @@ async def list_telemetry_for_device(
 
     The device is authenticated via its UUID (path) and API key (header).
     Only telemetry for the authenticated device is returned.
+
+    Pages are read with a keyset seek on (system_time_utc, id) below the
+    cursor, which the (device_uuid, system_time_utc DESC) index serves
+    directly, so a deep page costs the same as the first.
     """
     # Normalize time window
     start_time, end_time = normalize_time_window(
@@ -289,14 +385,7 @@ async def list_telemetry_for_device(
         },
     )
 
-    cache_key = (
-        f"telemetry:{device.device_uuid}:"
-        f"{int(start_time.timestamp())}:"
-        f"{int(end_time.timestamp())}:"
-        f"{limit}"
-    )
-
-    # SQL statement
+    # SQL statement; one extra row tells whether another page exists
     stmt = (
         select(TelemetryEvent)
         .where(
@@ -304,10 +393,21 @@ async def list_telemetry_for_device(
             TelemetryEvent.system_time_utc >= start_time,
             TelemetryEvent.system_time_utc <= end_time,
         )
-        .order_by(TelemetryEvent.system_time_utc.desc())
-        .limit(limit)
+        .order_by(TelemetryEvent.system_time_utc.desc(), TelemetryEvent.id.desc())
+        .limit(limit + 1)
     )
 
+    if cursor is not None:
+        after_time, after_id = decode_cursor(cursor)
+        # the bare bound is the index range; the OR only filters ties
+        stmt = stmt.where(
+            TelemetryEvent.system_time_utc <= after_time,
+            or_(
+                TelemetryEvent.system_time_utc < after_time,
+                TelemetryEvent.id < after_id,
+            ),
+        )
+
     try:
         result = await db.execute(stmt)
         rows = result.scalars().all()
@@ -321,6 +421,11 @@ async def list_telemetry_for_device(
             detail="Failed to retrieve telemetry.",
         ) from exc
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].system_time_utc, rows[-1].id)
+
     # Convert ORM rows -> DTOs
     items: list[TelemetryItem] = [
         TelemetryItem.model_validate(row) for row in rows
@@ -331,12 +436,157 @@ async def list_telemetry_for_device(
         extra={
             "device_uuid": str(device.device_uuid),
             "returned_count": len(items),
+            "has_more": next_cursor is not None,
         },
     )
 
+    set_next_cursor(request, response, next_cursor)
     return items
 
 
+# ============================================================
+# GET /telemetry/{device_uuid}/export
+# ============================================================
+# Plain columns, not ORM entities: the session keeps no identity map
+# entry per exported row, so memory stays flat however long the export.
+EXPORT_COLUMNS = (
+    TelemetryEvent.__table__.c.device_uuid,
+    TelemetryEvent.__table__.c.x_coord,
+    TelemetryEvent.__table__.c.y_coord,
+    TelemetryEvent.__table__.c.device_time,
+    TelemetryEvent.__table__.c.system_time_utc,
+)
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def format_ndjson(rows: Sequence) -> str:
+    """One JSON object per row, newline-terminated."""
+    return "".join(
+        json.dumps({key: _export_value(value) for key, value in row._mapping.items()}) + "\n"
+        for row in rows
+    )
+
+
+def format_csv(rows: Sequence) -> str:
+    """CSV records (no header) for a chunk of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(_export_value(value) for value in row)
+    return buffer.getvalue()
+
+
+@router.get(
+    "/{device_uuid}/export",
+    summary="Export telemetry history for a device",
+    description=(
+        "Stream every telemetry event of a device in `[start_time, end_time]` as NDJSON "
+        "(one JSON object per line) or CSV with a header row, oldest first. The device "
+        "must authenticate using the `X-API-Key` header.\n\n"
+        "Rows are read through a server-side cursor and sent in chunks, so any range can "
+        "be exported with constant memory. A database error after the first chunk ends "
+        "the response early."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "Telemetry events, oldest first.",
+        },
+    },
+)
+async def export_telemetry_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    start_time: datetime = Query(
+        description="Start of the time range (UTC), inclusive.",
+    ),
+    end_time: datetime | None = Query(
+        default=None,
+        description="End of the time range (UTC), inclusive. Defaults to the current server time.",
+    ),
+    export_format: Literal["ndjson", "csv"] = Query(
+        default="ndjson",
+        alias="format",
+        description="Output format.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Device-facing telemetry export endpoint.
+
+    The cursor is opened before the response starts, so a failing query
+    still maps to a 500. The session is request-scoped and stays open
+    until the body has been sent.
+    """
+    start_time, end_time = normalize_time_window(
+        start_time=start_time,
+        end_time=end_time,
+        latest_seconds=DEFAULT_LATEST_SECONDS,
+    )
+
+    stmt = (
+        select(*EXPORT_COLUMNS)
+        .where(
+            TelemetryEvent.device_uuid == device.device_uuid,
+            TelemetryEvent.system_time_utc >= start_time,
+            TelemetryEvent.system_time_utc <= end_time,
+        )
+        .order_by(TelemetryEvent.system_time_utc, TelemetryEvent.id)
+        .execution_options(yield_per=EXPORT_CHUNK_ROWS)
+    )
+
+    try:
+        result = await db.stream(stmt)
+    except SQLAlchemyError as exc:
+        logger.exception(
+            "Database error while exporting telemetry",
+            extra={"device_uuid": str(device.device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export telemetry.",
+        ) from exc
+
+    formatter = format_csv if export_format == "csv" else format_ndjson
+
+    async def body() -> AsyncIterator[str]:
+        exported = 0
+        try:
+            if export_format == "csv":
+                yield ",".join(column.name for column in EXPORT_COLUMNS) + "\r\n"
+            async for rows in result.partitions():
+                exported += len(rows)
+                yield formatter(rows)
+        except SQLAlchemyError:
+            logger.exception(
+                "Database error while exporting telemetry, response truncated",
+                extra={"device_uuid": str(device.device_uuid), "exported_count": exported},
+            )
+        finally:
+            await result.close()
+
+        logger.debug(
+            "Telemetry export finished",
+            extra={"device_uuid": str(device.device_uuid), "exported_count": exported},
+        )
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"telemetry-{device.device_uuid}.{export_format}"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # ============================================================
 # POST /telemetry/{device_uuid}
 # ============================================================
@@ -370,20 +620,19 @@ async def create_telemetry_for_device(
     now_utc = datetime.now(timezone.utc)
     device_time = payload.device_time or now_utc
 
-    telemetry = TelemetryEvent(
-        device_uuid=device.device_uuid,
-        x_coord=payload.x_coord,
-        y_coord=payload.y_coord,
-        device_time=device_time,
-        system_time_utc=now_utc,
-    )
-
-    db.add(telemetry)
+    params = {
+        "device_uuid": device.device_uuid,
+        "x_coord": payload.x_coord,
+        "y_coord": payload.y_coord,
+        "device_time": device_time,
+        "system_time_utc": now_utc,
+    }
 
     # commit db
     try:
+        result = await db.execute(INSERT_TELEMETRY_STMT, params)
+        row = result.one()
         await db.commit()
-        await db.refresh(telemetry)
     except SQLAlchemyError as exc:
         await db.rollback()
         logger.exception(
@@ -399,16 +648,101 @@ async def create_telemetry_for_device(
         "Telemetry stored successfully",
         extra={
             "device_uuid": str(device.device_uuid),
-            "system_time_utc": telemetry.system_time_utc.isoformat(),
+            "system_time_utc": row.system_time_utc.isoformat(),
         },
     )
 
-    # Convert ORM
-    item = TelemetryItem.model_validate(telemetry)
+    # Row -> DTO
+    item = TelemetryItem.model_validate(row)
 
     return item
 
 
+# ============================================================
+# POST /telemetry/{device_uuid}/batch
+# ============================================================
+@router.post(
+    "/{device_uuid}/batch",
+    summary="Ingest a batch of telemetry for a device",
+    description=(
+        "Ingest multiple telemetry events for a specific device in a single request. "
+        "The device authenticates once using the `X-API-Key` header and all events "
+        "are stored in one multi-row INSERT within a single transaction. "
+        f"At most {MAX_BATCH_SIZE} events are accepted per request.\n\n"
+        "Every event in the batch is stamped with the same server-side "
+        "`system_time_utc`; events without `device_time` default to that value."
+    ),
+    response_model=TelemetryBatchItem,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_telemetry_batch_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    payload: list[TelemetryCreate] = Body(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="List of telemetry payloads containing coordinates and optional device timestamps.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> TelemetryBatchItem:
+    """
+    Ingest a batch of telemetry events for the authenticated device.
+
+    Rows are written with a Core multi-row INSERT ... RETURNING id, so the
+    whole batch costs one authentication, one statement and one commit
+    instead of one of each per event.
+    """
+    now_utc = datetime.now(timezone.utc)
+
+    rows = [
+        {
+            "device_uuid": device.device_uuid,
+            "x_coord": p.x_coord,
+            "y_coord": p.y_coord,
+            "device_time": p.device_time or now_utc,
+            "system_time_utc": now_utc,
+        }
+        for p in payload
+    ]
+
+    stmt = insert(TelemetryEvent).returning(
+        TelemetryEvent.id,
+        sort_by_parameter_order=True,
+    )
+
+    # commit db
+    try:
+        result = await db.execute(stmt, rows)
+        ids = list(result.scalars().all())
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.exception(
+            "Database error while storing telemetry batch",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "batch_size": len(rows),
+            },
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store telemetry batch.",
+        ) from exc
+
+    logger.debug(
+        "Telemetry batch stored successfully",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "inserted_count": len(ids),
+        },
+    )
+
+    return TelemetryBatchItem(
+        device_uuid=device.device_uuid,
+        inserted_count=len(ids),
+        ids=ids,
+    )
+
+
 # ============================================================
 # GET /telemetry/latest/{device_uuid}
 # ============================================================
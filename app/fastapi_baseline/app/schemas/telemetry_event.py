@@ -68,3 +68,20 @@ class TelemetryItem(ORMModel):
 class TelemetryCountItem(BaseModel):
     device_uuid: UUID
     total_events: int
+
+
+class TelemetryBatchItem(BaseModel):
+    """
+    Summary returned after a batch of telemetry events has been stored.
+    """
+
+    device_uuid: UUID = Field(
+        description="UUID of the device the batch was ingested for.",
+    )
+    inserted_count: int = Field(
+        description="Number of telemetry events stored by this request.",
+        examples=[100],
+    )
+    ids: list[int] = Field(
+        description="Database ids of the stored telemetry events, in request order.",
+    )
@@ -0,0 +1,83 @@
+# tests/test_device_cache.py
+import hashlib
+import time
+from uuid import uuid4
+
+from app.cache import ApiKeyVerifier, DeviceCache
+from app.models import DeviceRegistry
+
+
+def make_device():
+    return DeviceRegistry(device_uuid=uuid4(), api_key_hash="")
+
+
+def test_hit_and_lru_eviction():
+    """Least recently used entry is evicted once maxsize is exceeded."""
+    cache = DeviceCache(maxsize=2, ttl=60, negative_ttl=5)
+    a, b, c = make_device(), make_device(), make_device()
+
+    cache.set(a.device_uuid, a)
+    cache.set(b.device_uuid, b)
+    assert cache.get(a.device_uuid)[1].device is a     # a is now most recent
+
+    cache.set(c.device_uuid, c)
+    assert len(cache) == 2
+    assert cache.get(b.device_uuid) == (False, None)
+    assert cache.get(a.device_uuid)[1].device is a
+
+
+def test_negative_entry_and_expiry(monkeypatch):
+    """Unknown devices are cached as None and expire on their own TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = DeviceCache(maxsize=10, ttl=60, negative_ttl=5)
+    unknown = uuid4()
+
+    cache.set(unknown, None)
+    assert cache.get(unknown) == (True, None)
+
+    now[0] += 5
+    assert cache.get(unknown) == (False, None)
+
+
+def test_invalidate():
+    cache = DeviceCache(maxsize=10, ttl=60, negative_ttl=5)
+    device = make_device()
+
+    cache.set(device.device_uuid, device)
+    cache.invalidate(device.device_uuid)
+    assert cache.get(device.device_uuid) == (False, None)
+
+
+def test_stored_hash_normalized_once():
+    device = DeviceRegistry(device_uuid=uuid4(), api_key_hash="  ABCDEF \n")
+    cached = DeviceCache(maxsize=10, ttl=60, negative_ttl=5).set(device.device_uuid, device)
+    assert cached.stored_hash == "abcdef"
+
+
+def test_api_key_verifier_memoizes_success_only():
+    """Only successfully verified keys are remembered; a changed hash misses."""
+    verifier = ApiKeyVerifier(maxsize=10)
+    device_uuid = uuid4()
+    stored_hash = hashlib.sha256(b"secret").hexdigest()
+
+    assert verifier.verify(device_uuid, "wrong", stored_hash) is False
+    assert verifier.verify(device_uuid, "secret", stored_hash) is True
+    assert verifier.verify(device_uuid, "secret", stored_hash) is True
+    assert verifier.verify(device_uuid, "wrong", stored_hash) is False
+    assert (verifier.hits, verifier.misses) == (1, 3)
+
+    rotated = hashlib.sha256(b"rotated").hexdigest()
+    assert verifier.verify(device_uuid, "secret", rotated) is False
+
+
+def test_api_key_verifier_does_not_keep_plaintext():
+    """The memo holds keyed digests, never the presented key itself."""
+    verifier = ApiKeyVerifier(maxsize=10)
+    stored_hash = hashlib.sha256(b"secret").hexdigest()
+
+    assert verifier.verify(uuid4(), "secret", stored_hash) is True
+
+    (remembered,) = verifier._verified.values()
+    assert b"secret" not in remembered
+    assert remembered != hashlib.sha256(b"secret").digest()
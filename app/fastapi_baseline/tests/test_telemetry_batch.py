@@ -0,0 +1,118 @@
+# tests/test_telemetry_batch.py
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from app import main
+from app.models import DeviceRegistry
+from app.routers import telemetry
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+
+
+def get_client():
+    """build a TestClient with device authentication stubbed out."""
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    return TestClient(main.app)
+
+
+def teardown_function():
+    main.app.dependency_overrides.clear()
+
+
+def test_batch_rejects_empty_list():
+    """An empty batch is a validation error, not a no-op insert."""
+    client = get_client()
+    resp = client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=[])
+    assert resp.status_code == 422
+
+
+def test_batch_rejects_oversized_list():
+    """Batches above MAX_BATCH_SIZE are rejected before touching the DB."""
+    client = get_client()
+    payload = [{"x_coord": 1.0, "y_coord": 2.0}] * (telemetry.MAX_BATCH_SIZE + 1)
+    resp = client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=payload)
+    assert resp.status_code == 422
+
+
+class FakeSession:
+    """get_db stand-in recording the rows of the multi-row INSERT ... RETURNING id."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.rows = None
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, stmt, rows):
+        if self.error is not None:
+            raise self.error
+        self.rows = rows
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return [100 + n for n in range(len(rows))]
+
+        return Result()
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def get_db_client(session):
+    main.app.dependency_overrides[telemetry.get_db] = lambda: session
+    return get_client()
+
+
+def test_batch_inserts_every_row_in_one_statement():
+    session = FakeSession()
+    client = get_db_client(session)
+    payload = [
+        {"x_coord": 1.0, "y_coord": 2.0, "device_time": "2025-11-17T12:00:00Z"},
+        {"x_coord": 3.0, "y_coord": 4.0},
+    ]
+
+    resp = client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=payload)
+
+    assert resp.status_code == 201
+    assert resp.json() == {"device_uuid": DEVICE_UUID, "inserted_count": 2, "ids": [100, 101]}
+    assert session.committed
+    first, second = session.rows
+    assert (first["x_coord"], first["y_coord"]) == (1.0, 2.0)
+    assert first["device_uuid"] == UUID(DEVICE_UUID)
+    assert first["device_time"] == datetime(2025, 11, 17, 12, tzinfo=timezone.utc)
+    # one server timestamp for the whole batch; a missing device_time defaults to it
+    assert first["system_time_utc"] == second["system_time_utc"] == second["device_time"]
+
+
+def test_batch_accepts_max_batch_size():
+    session = FakeSession()
+    client = get_db_client(session)
+    payload = [{"x_coord": float(n), "y_coord": 0.0} for n in range(telemetry.MAX_BATCH_SIZE)]
+
+    resp = client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=payload)
+
+    assert resp.status_code == 201
+    assert resp.json()["inserted_count"] == telemetry.MAX_BATCH_SIZE
+    assert len(session.rows) == telemetry.MAX_BATCH_SIZE
+
+
+def test_batch_db_error_rolls_back_and_returns_500():
+    session = FakeSession(error=OperationalError("INSERT", {}, Exception("connection lost")))
+    client = get_db_client(session)
+
+    resp = client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=[{"x_coord": 1.0, "y_coord": 2.0}])
+
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Failed to store telemetry batch."}
+    assert session.rolled_back and not session.committed
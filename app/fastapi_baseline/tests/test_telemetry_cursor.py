@@ -0,0 +1,105 @@
+# tests/test_telemetry_cursor.py
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app import main
+from app.models import DeviceRegistry
+from app.routers import telemetry
+from app.routers.telemetry import decode_cursor, encode_cursor
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+
+
+def test_cursor_round_trip_keeps_microseconds():
+    """A cursor decodes to the exact (system_time_utc, id) it was built from."""
+    ts = datetime(2025, 11, 17, 12, 35, 0, 123456, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(ts, 987654321)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (ts, 987654321)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "bm9jb2xvbg", "YTpi"])
+def test_malformed_cursor_is_rejected(cursor):
+    """Garbage, a missing separator and non-numeric parts all map to 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+class FakeSession:
+    """get_db stand-in returning fixed rows (at most limit + 1), newest first."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, stmt):
+        rows = self.rows
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return rows
+
+        return Result()
+
+
+def _rows(count):
+    base = datetime(2025, 11, 17, 12, 0, 0, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=1000 - n, device_uuid=UUID(DEVICE_UUID), x_coord=float(n), y_coord=0.0,
+            device_time=base - timedelta(seconds=n), system_time_utc=base - timedelta(seconds=n),
+        )
+        for n in range(count)
+    ]
+
+
+def get_client(rows):
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    main.app.dependency_overrides[telemetry.get_db] = lambda: FakeSession(rows)
+    return TestClient(main.app)
+
+
+def teardown_function():
+    main.app.dependency_overrides.clear()
+
+
+def test_listing_body_stays_an_array_with_cursor_in_headers():
+    """A full page returns the plain item array; the next page is in X-Next-Cursor and Link."""
+    rows = _rows(3)
+    client = get_client(rows)
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}", params={"limit": 2, "latest_seconds": 60},
+    )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert isinstance(body, list) and len(body) == 2
+    cursor = resp.headers["X-Next-Cursor"]
+    assert decode_cursor(cursor) == (rows[1].system_time_utc, rows[1].id)
+    assert resp.headers["Link"] == (
+        f"</api/telemetry/{DEVICE_UUID}?limit=2&latest_seconds=60&cursor={cursor}>; rel=\"next\""
+    )
+
+
+def test_last_page_has_no_cursor_headers():
+    client = get_client(_rows(2))
+
+    resp = client.get(f"/api/telemetry/{DEVICE_UUID}", params={"limit": 2})
+
+    assert len(resp.json()) == 2
+    assert "X-Next-Cursor" not in resp.headers
+    assert "Link" not in resp.headers
@@ -0,0 +1,189 @@
+# tests/test_telemetry_export.py
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from app import main
+from app.models import DeviceRegistry
+from app.routers import telemetry
+from app.routers.telemetry import EXPORT_COLUMNS, format_csv, format_ndjson
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+COLUMN_NAMES = [column.name for column in EXPORT_COLUMNS]
+BASE = datetime(2025, 11, 17, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+class FakeRow(tuple):
+    """Row stand-in: iterates as a tuple, exposes `_mapping` like sqlalchemy.Row."""
+
+    @property
+    def _mapping(self):
+        return dict(zip(COLUMN_NAMES, self))
+
+
+def _rows(count, start=0):
+    return [
+        FakeRow((
+            UUID(DEVICE_UUID), float(n), -float(n),
+            BASE + timedelta(seconds=n), BASE + timedelta(seconds=n),
+        ))
+        for n in range(start, start + count)
+    ]
+
+
+class FakeStreamResult:
+    """AsyncResult stand-in yielding fixed chunks, optionally failing after them."""
+
+    def __init__(self, chunks, fail_after=False):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.closed = False
+
+    async def partitions(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.fail_after:
+            raise OperationalError("SELECT", {}, Exception("connection lost"))
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+
+    async def stream(self, stmt):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def get_client(session):
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    main.app.dependency_overrides[telemetry.get_db] = lambda: session
+    return TestClient(main.app)
+
+
+def teardown_function():
+    main.app.dependency_overrides.clear()
+
+
+def test_format_ndjson_one_object_per_line():
+    lines = format_ndjson(_rows(2)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {
+            "device_uuid": DEVICE_UUID,
+            "x_coord": float(n),
+            "y_coord": -float(n),
+            "device_time": (BASE + timedelta(seconds=n)).isoformat(),
+            "system_time_utc": (BASE + timedelta(seconds=n)).isoformat(),
+        }
+        for n in range(2)
+    ]
+
+
+def test_format_csv_has_no_header_and_iso_timestamps():
+    records = list(csv.reader(io.StringIO(format_csv(_rows(2)))))
+
+    assert records == [
+        [DEVICE_UUID, "0.0", "-0.0", BASE.isoformat(), BASE.isoformat()],
+        [DEVICE_UUID, "1.0", "-1.0"] + [(BASE + timedelta(seconds=1)).isoformat()] * 2,
+    ]
+
+
+def test_formatters_of_empty_chunk_are_empty():
+    assert format_ndjson([]) == ""
+    assert format_csv([]) == ""
+
+
+def test_export_ndjson_streams_every_chunk():
+    result = FakeStreamResult([_rows(2), _rows(1, start=2)])
+    client = get_client(FakeSession(result))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert resp.headers["content-disposition"] == (
+        f'attachment; filename="telemetry-{DEVICE_UUID}.ndjson"'
+    )
+    assert [json.loads(line)["x_coord"] for line in resp.text.splitlines()] == [0.0, 1.0, 2.0]
+    assert result.closed
+
+
+def test_export_csv_starts_with_header_row():
+    client = get_client(FakeSession(FakeStreamResult([_rows(2)])))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z", "format": "csv"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    records = list(csv.reader(io.StringIO(resp.text)))
+    assert records[0] == COLUMN_NAMES
+    assert [record[1] for record in records[1:]] == ["0.0", "1.0"]
+
+
+def test_export_csv_of_empty_range_is_only_header():
+    client = get_client(FakeSession(FakeStreamResult([])))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z", "format": "csv"},
+    )
+
+    assert resp.text == ",".join(COLUMN_NAMES) + "\r\n"
+
+
+def test_export_query_error_is_500():
+    """The cursor opens before the response starts, so a failing query is still a 500."""
+    error = OperationalError("SELECT", {}, Exception("connection refused"))
+    client = get_client(FakeSession(error=error))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z"},
+    )
+
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Failed to export telemetry."}
+
+
+def test_export_error_mid_stream_truncates_and_closes():
+    result = FakeStreamResult([_rows(2)], fail_after=True)
+    client = get_client(FakeSession(result))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z"},
+    )
+
+    assert resp.status_code == 200
+    assert len(resp.text.splitlines()) == 2
+    assert result.closed
+
+
+def test_export_rejects_unknown_format():
+    client = get_client(FakeSession(FakeStreamResult([])))
+
+    resp = client.get(
+        f"/api/telemetry/{DEVICE_UUID}/export",
+        params={"start_time": "2025-11-17T00:00:00Z", "format": "xml"},
+    )
+
+    assert resp.status_code == 422
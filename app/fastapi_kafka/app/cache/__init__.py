@@ -0,0 +1,12 @@
+from .api_key_cache import ApiKeyVerifier, api_key_verifier
+from .device_cache import CachedDevice, DeviceCache, device_cache
+from .invalidation import listen_for_invalidations
+
+__all__ = [
+    "ApiKeyVerifier",
+    "api_key_verifier",
+    "CachedDevice",
+    "DeviceCache",
+    "device_cache",
+    "listen_for_invalidations",
+]
@@ -0,0 +1,83 @@
+# cache/api_key_cache.py
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+from collections import OrderedDict
+from uuid import UUID
+
+from ..config import get_settings
+
+settings = get_settings()
+
+
+class ApiKeyVerifier:
+    """
+    Memoizes the last API key successfully verified per
+    (device_uuid, stored hash), so repeat requests from a device skip
+    SHA-256 and compare a keyed BLAKE2b tag of the presented key in
+    constant time instead.
+
+    Plaintext keys are never held: entries are tags under a per-process
+    random secret, useless outside this worker. Keys are only remembered
+    after a successful hash check, and a changed stored hash never
+    matches an old entry. Failed attempts always take the full hash path.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._secret = secrets.token_bytes(32)
+        self._verified: OrderedDict[tuple[UUID, str], bytes] = OrderedDict()
+
+    def _tag(self, presented: bytes) -> bytes:
+        return hashlib.blake2b(presented, key=self._secret, digest_size=32).digest()
+
+    def verify(self, device_uuid: UUID, api_key: str, stored_hash: str) -> bool:
+        """
+        Verify `api_key` against a normalized (stripped, lowercase)
+        SHA-256 hex digest.
+        """
+        if not stored_hash:
+            return False
+
+        key = (device_uuid, stored_hash)
+        presented = api_key.encode("utf-8")
+        tag = self._tag(presented)
+
+        remembered = self._verified.get(key)
+        if remembered is not None and hmac.compare_digest(remembered, tag):
+            self.hits += 1
+            self._verified.move_to_end(key)
+            return True
+
+        self.misses += 1
+        candidate_hash = hashlib.sha256(presented).hexdigest()
+        if not hmac.compare_digest(candidate_hash, stored_hash):
+            return False
+
+        if self.maxsize > 0:
+            self._verified[key] = tag
+            self._verified.move_to_end(key)
+            while len(self._verified) > self.maxsize:
+                self._verified.popitem(last=False)
+
+        return True
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "size": len(self._verified),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+api_key_verifier = ApiKeyVerifier(maxsize=settings.device_cache_size)
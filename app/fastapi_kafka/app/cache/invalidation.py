@@ -0,0 +1,90 @@
+# cache/invalidation.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from uuid import UUID
+
+from ..config import get_settings
+from ..db import redis_client
+from .device_cache import device_cache
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+DEVICE_REGISTRY_KEY_PREFIX = "device:registry:"
+
+# K: keyspace channel, g: DEL/EXPIRE..., x: expired, e: evicted
+KEYSPACE_EVENT_FLAGS = "Kgxe"
+# Events that mean the cached registry entry is gone. SET is left out on
+# purpose: load_device_registry fills the key on every DB miss, and acting
+# on that would evict every worker, the filler included, on each fill.
+# Anything that changes a device must DEL (or UNLINK) its registry key.
+INVALIDATING_EVENTS = frozenset({"del", "expired", "evicted"})
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+async def _enable_keyspace_events() -> None:
+    """
+    Make sure Redis publishes keyspace notifications for device keys.
+    Managed Redis may reject CONFIG; then the local TTL bounds staleness.
+    """
+    try:
+        current = (await redis_client.config_get("notify-keyspace-events")).get(
+            "notify-keyspace-events", ""
+        )
+        missing = "".join(f for f in KEYSPACE_EVENT_FLAGS if f not in current)
+        if missing and "A" not in current:
+            await redis_client.config_set("notify-keyspace-events", current + missing)
+    except Exception as exc:
+        logger.warning(
+            "Could not enable Redis keyspace notifications",
+            extra={"error": str(exc)},
+        )
+
+
+async def listen_for_invalidations() -> None:
+    """
+    Evict device_cache entries whenever their Redis registry key is
+    deleted, expires or is evicted. Runs for the lifetime of the app.
+    """
+    pattern = f"__keyspace@{settings.redis.db}__:{DEVICE_REGISTRY_KEY_PREFIX}*"
+
+    while True:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await _enable_keyspace_events()
+            await pubsub.psubscribe(pattern)
+            # Changes may have been missed while unsubscribed
+            device_cache.clear()
+            logger.info("Listening for device cache invalidations",
+                        extra={"pattern": pattern})
+
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                if message["data"] not in INVALIDATING_EVENTS:
+                    continue
+
+                key = message["channel"].split(":", 1)[1]
+                try:
+                    device_uuid = UUID(key[len(DEVICE_REGISTRY_KEY_PREFIX):])
+                except ValueError:
+                    continue
+
+                device_cache.invalidate(device_uuid)
+                logger.debug(
+                    "Device cache entry invalidated",
+                    extra={"device_uuid": str(device_uuid), "event": message["data"]},
+                )
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(
+                "Device cache invalidation listener failed, reconnecting",
+                extra={"error": str(exc)},
+            )
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+        finally:
+            await pubsub.aclose()
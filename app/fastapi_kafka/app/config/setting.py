@@ -20,6 +20,14 @@ class KafkaSettings(BaseModel):
     topic: str = "telemetry"
     # msk auth
     use_msk_auth: bool = False # turn on for aws msk
+    # delivery: "sync" awaits the broker ack per request (201),
+    # "async" returns once buffered (202) and tracks the ack in background
+    ack_mode: Literal["sync", "async"] = "sync"
+    max_in_flight: int = 1000               # async: unacked sends per worker
+    in_flight_timeout: float = 5.0          # async: seconds to wait for a slot before 503
+    dead_letter_path: str = "logs/kafka_dead_letter.jsonl"
+    # message value format; consumers decode both, switch after they are deployed
+    value_codec: Literal["json", "struct"] = "json"
 
 # ==============================
 # PostgreSQL
@@ -138,6 +146,30 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    # ------------------------------
+    # Device auth cache
+    # ------------------------------
+    device_cache_size: int = Field(
+        default=100_000,
+        ge=0,
+        alias="DEVICE_CACHE_SIZE",
+        description="Max devices kept in the per-worker auth cache (0 disables).",
+    )
+
+    device_cache_ttl: float = Field(
+        default=300.0,
+        ge=0,
+        alias="DEVICE_CACHE_TTL",
+        description="Seconds a cached device registry entry stays valid.",
+    )
+
+    device_cache_negative_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        alias="DEVICE_CACHE_NEGATIVE_TTL",
+        description="Seconds an unknown device UUID stays cached as not found.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
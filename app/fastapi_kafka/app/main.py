@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
@@ -7,8 +9,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import listen_for_invalidations
 from .config import get_settings, setup_logging
-from .mq import init_producer, close_producer
+from .mq import (
+    init_producer,
+    close_producer,
+    start_delivery_tracker,
+    stop_delivery_tracker,
+)
 from .routers import home, health, device, telemetry
 
 setup_logging()
@@ -21,8 +29,15 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_producer()
+    await start_delivery_tracker()
+    invalidation_task = asyncio.create_task(listen_for_invalidations())
     yield
+    invalidation_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await invalidation_task
+    # Flush first so pending acks (and failures) are recorded
     await close_producer()
+    await stop_delivery_tracker()
 
 
 app = FastAPI(
@@ -1,7 +1,19 @@
 from .kafka_producer import init_producer, close_producer, get_producer
+from .kafka_delivery import (
+    InFlightLimitExceeded,
+    delivery_stats,
+    publish,
+    start_delivery_tracker,
+    stop_delivery_tracker,
+)
 
 __all__ = [
     "init_producer",
     "close_producer",
-    "get_producer"
+    "get_producer",
+    "InFlightLimitExceeded",
+    "delivery_stats",
+    "publish",
+    "start_delivery_tracker",
+    "stop_delivery_tracker",
 ]
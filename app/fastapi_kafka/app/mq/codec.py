@@ -0,0 +1,129 @@
+# mq/codec.py
+"""
+Kafka value codecs for telemetry messages.
+
+json:   UTF-8 JSON object (original format, no header).
+struct: 1 version byte + fixed little-endian layout.
+        v1, 49 bytes: device_uuid (16 raw bytes), x_coord, y_coord
+        (float64), device_time, system_time_utc (int64 epoch microseconds).
+        v2, 65 bytes: v1 with event_id (16 raw bytes) after device_uuid.
+        Items without an event_id are still written as v1.
+
+decode_value() dispatches on the first byte ('{' for JSON, otherwise the
+binary version), so consumers read both formats while producers switch.
+JSON may start with whitespace; version bytes are never whitespace.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Literal
+from uuid import UUID
+
+CodecName = Literal["json", "struct"]
+
+STRUCT_V1 = 0x01
+STRUCT_V2 = 0x02
+_STRUCT_V1_LAYOUT = struct.Struct("<B16sddqq")
+_STRUCT_V2_LAYOUT = struct.Struct("<B16s16sddqq")
+_JSON_OBJECT = ord("{")
+_JSON_START = b"{"
+
+# device UUIDs repeat across messages; building a UUID is the costliest field
+UUID_CACHE_SIZE = 100_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICRO = timedelta(microseconds=1)
+
+
+def _to_micros(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MICRO
+
+
+def _from_micros(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=us)
+
+
+@lru_cache(maxsize=UUID_CACHE_SIZE)
+def _uuid_from_bytes(raw: bytes) -> UUID:
+    return UUID(bytes=raw)
+
+
+def encode_json(item: Any) -> bytes:
+    return json.dumps(item.model_dump(mode="json")).encode("utf-8")
+
+
+def encode_struct(item: Any) -> bytes:
+    event_id = getattr(item, "event_id", None)
+    if event_id is None:
+        return _STRUCT_V1_LAYOUT.pack(
+            STRUCT_V1,
+            item.device_uuid.bytes,
+            item.x_coord,
+            item.y_coord,
+            _to_micros(item.device_time),
+            _to_micros(item.system_time_utc),
+        )
+
+    return _STRUCT_V2_LAYOUT.pack(
+        STRUCT_V2,
+        item.device_uuid.bytes,
+        event_id.bytes,
+        item.x_coord,
+        item.y_coord,
+        _to_micros(item.device_time),
+        _to_micros(item.system_time_utc),
+    )
+
+
+def is_json_value(data: bytes) -> bool:
+    """True for a JSON object value, with or without leading whitespace."""
+    # lstrip() only copies when there is whitespace to strip
+    return bool(data) and (data[0] == _JSON_OBJECT or data.lstrip()[:1] == _JSON_START)
+
+
+def decode_value(data: bytes) -> dict[str, Any]:
+    """Decode a telemetry message value into a TelemetryItem-shaped dict."""
+    if not data:
+        raise ValueError("Empty telemetry message")
+
+    if is_json_value(data):
+        return json.loads(data.decode("utf-8"))
+
+    if data[0] == STRUCT_V1:
+        _, uuid_bytes, x, y, device_us, system_us = _STRUCT_V1_LAYOUT.unpack(data)
+        return {
+            "event_id": None,
+            "device_uuid": _uuid_from_bytes(uuid_bytes),
+            "x_coord": x,
+            "y_coord": y,
+            "device_time": _from_micros(device_us),
+            "system_time_utc": _from_micros(system_us),
+        }
+
+    if data[0] == STRUCT_V2:
+        _, uuid_bytes, event_bytes, x, y, device_us, system_us = _STRUCT_V2_LAYOUT.unpack(data)
+        return {
+            "event_id": UUID(bytes=event_bytes),
+            "device_uuid": _uuid_from_bytes(uuid_bytes),
+            "x_coord": x,
+            "y_coord": y,
+            "device_time": _from_micros(device_us),
+            "system_time_utc": _from_micros(system_us),
+        }
+
+    raise ValueError(f"Unknown telemetry codec version: {data[0]:#04x}")
+
+
+ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    "json": encode_json,
+    "struct": encode_struct,
+}
+
+
+def get_encoder(name: CodecName) -> Callable[[Any], bytes]:
+    return ENCODERS[name]
@@ -0,0 +1,187 @@
+# mq/kafka_delivery.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
+from aiokafka import AIOKafkaProducer
+from aiokafka.structs import RecordMetadata
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEAD_LETTER_QUEUE_SIZE = 10_000
+
+# singleton state for "async" ack mode
+_in_flight: Optional[asyncio.Semaphore] = None
+_dead_letters: Optional[asyncio.Queue[dict[str, Any]]] = None
+_writer_task: Optional[asyncio.Task] = None
+
+_stats = {
+    "in_flight": 0,
+    "sent": 0,
+    "delivered": 0,
+    "failed": 0,
+    "dead_letter_dropped": 0,
+}
+
+
+class InFlightLimitExceeded(Exception):
+    """No in-flight slot freed up within in_flight_timeout."""
+
+
+def _append_lines(path: Path, lines: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+async def _write_dead_letters(path: Path) -> None:
+    """Drain failed deliveries to a JSONL file, batching what is queued."""
+    assert _dead_letters is not None
+
+    while True:
+        records = [await _dead_letters.get()]
+        while not _dead_letters.empty():
+            records.append(_dead_letters.get_nowait())
+
+        lines = [json.dumps(r, default=str) + "\n" for r in records]
+        try:
+            await asyncio.to_thread(_append_lines, path, lines)
+        except Exception:
+            logger.exception(
+                "Failed to write Kafka dead letters",
+                extra={"path": str(path), "count": len(records)},
+            )
+
+
+def _on_delivery(
+    topic: str,
+    key: bytes | None,
+    value: Any,
+    fut: asyncio.Future,
+) -> None:
+    """Broker ack callback: free the in-flight slot and record failures."""
+    assert _in_flight is not None
+    _in_flight.release()
+    _stats["in_flight"] -= 1
+
+    exc = fut.exception() if not fut.cancelled() else asyncio.CancelledError()
+    if exc is None:
+        _stats["delivered"] += 1
+        return
+
+    _stats["failed"] += 1
+    logger.error(
+        "Kafka delivery failed",
+        extra={"topic": topic, "error": repr(exc)},
+    )
+
+    record = {
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "topic": topic,
+        "key": key.decode("utf-8") if key else None,
+        "value": value.model_dump(mode="json") if hasattr(value, "model_dump") else value,
+        "error": repr(exc),
+    }
+    try:
+        assert _dead_letters is not None
+        _dead_letters.put_nowait(record)
+    except asyncio.QueueFull:
+        _stats["dead_letter_dropped"] += 1
+
+
+async def start_delivery_tracker() -> None:
+    """Set up the in-flight window and dead-letter writer (async ack mode)."""
+    global _in_flight, _dead_letters, _writer_task
+
+    settings = get_settings()
+    if settings.kafka.ack_mode != "async" or _writer_task is not None:
+        return
+
+    _in_flight = asyncio.Semaphore(settings.kafka.max_in_flight)
+    _dead_letters = asyncio.Queue(maxsize=DEAD_LETTER_QUEUE_SIZE)
+    _writer_task = asyncio.create_task(
+        _write_dead_letters(Path(settings.kafka.dead_letter_path))
+    )
+    logger.info(
+        "Kafka async delivery enabled",
+        extra={"max_in_flight": settings.kafka.max_in_flight},
+    )
+
+
+async def stop_delivery_tracker() -> None:
+    """
+    Stop the dead-letter writer after writing what is queued.
+    Call after the producer has been flushed.
+    """
+    global _writer_task
+
+    if _writer_task is None:
+        return
+
+    assert _dead_letters is not None
+    while not _dead_letters.empty():
+        await asyncio.sleep(0.05)
+
+    _writer_task.cancel()
+    try:
+        await _writer_task
+    except asyncio.CancelledError:
+        pass
+    _writer_task = None
+
+
+async def publish(
+    producer: AIOKafkaProducer,
+    topic: str,
+    *,
+    key: bytes,
+    value: Any,
+) -> Optional[RecordMetadata]:
+    """
+    Publish one message according to settings.kafka.ack_mode.
+
+    sync:  wait for the broker ack and return its metadata.
+    async: take an in-flight slot, hand the message to the producer buffer
+           and return None; the ack is handled by _on_delivery. When the
+           broker stalls, slots run out and callers wait (backpressure),
+           up to in_flight_timeout.
+
+    Raises:
+        InFlightLimitExceeded: async mode, no slot within in_flight_timeout.
+        KafkaError: the producer rejected the message.
+    """
+    settings = get_settings()
+
+    if _in_flight is None:
+        return await producer.send_and_wait(topic, value=value, key=key)
+
+    try:
+        await asyncio.wait_for(
+            _in_flight.acquire(),
+            timeout=settings.kafka.in_flight_timeout,
+        )
+    except asyncio.TimeoutError as exc:
+        raise InFlightLimitExceeded() from exc
+
+    try:
+        fut = await producer.send(topic, value=value, key=key)
+    except BaseException:
+        _in_flight.release()
+        raise
+
+    _stats["sent"] += 1
+    _stats["in_flight"] += 1
+    fut.add_done_callback(partial(_on_delivery, topic, key, value))
+    return None
+
+
+def delivery_stats() -> dict[str, int]:
+    return dict(_stats)
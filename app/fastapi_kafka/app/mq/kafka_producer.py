@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import ssl
-import json
 import asyncio
 import logging
 from typing import Optional
@@ -12,6 +11,7 @@ from aiokafka.abc import AbstractTokenProvider
 from aws_msk_iam_sasl_signer import MSKAuthTokenProvider
 
 from ..config import get_settings
+from .codec import get_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,7 @@ async def init_producer() -> AIOKafkaProducer:
         producer_config = {
             "bootstrap_servers": settings.kafka_bootstrap_servers,
             "client_id": getattr(settings.kafka, "client_id", None) or "producer",
-            "value_serializer": lambda v: json.dumps(v).encode("utf-8"),
+            "value_serializer": get_encoder(settings.kafka.value_codec),
             "request_timeout_ms": 40000,
             "acks": 1,
             "compression_type": "gzip",
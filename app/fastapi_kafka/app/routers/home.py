@@ -2,6 +2,8 @@
 import os
 from fastapi import APIRouter, Depends
 
+from ..cache import api_key_verifier, device_cache
+from ..mq import delivery_stats
 from ..config.setting import get_settings
 
 # ====================
@@ -54,6 +56,16 @@ async def home() -> dict:
             "max_overflow": settings.max_overflow,
         }
 
+        response["auth_cache"] = {
+            "device_cache_size": len(device_cache),
+            "api_key": api_key_verifier.stats(),
+        }
+
+        response["kafka_delivery"] = {
+            "ack_mode": settings.kafka.ack_mode,
+            **delivery_stats(),
+        }
+
         response["postgres"] = {
             "host": settings.postgres.host,
             "port": settings.postgres.port,
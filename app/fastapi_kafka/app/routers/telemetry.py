@@ -1,12 +1,10 @@
 # routers/telemetry.py
 from __future__ import annotations
 
-import hashlib
-import hmac
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
@@ -16,6 +14,7 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Response,
     status,
 )
 
@@ -23,6 +22,7 @@ from sqlalchemy import select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import api_key_verifier, device_cache
 from ..db import get_db, redis_client
 from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
 from ..schemas import (
@@ -32,7 +32,7 @@ from ..schemas import (
     TelemetryLatestItem,
 )
 
-from ..mq import get_producer
+from ..mq import InFlightLimitExceeded, get_producer, publish
 from ..config import get_settings
 
 from aiokafka import AIOKafkaProducer
@@ -58,18 +58,6 @@ TELEMETRY_CACHE_TTL_SECONDS = 3600    # Short TTL to limit staleness
 # ============================================================
 # Helper functions
 # ============================================================
-def verify_api_key(api_key: str, stored_hash: str | None) -> bool:
-    """
-    Verify a plain-text API key against a stored SHA-256 hex digest.
-    """
-    if not stored_hash:
-        return False
-
-    stored_hash = stored_hash.strip().lower()
-    candidate_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
-    return hmac.compare_digest(candidate_hash, stored_hash)
-
-
 def normalize_time_window(
     start_time: datetime | None,
     end_time: datetime | None,
@@ -119,34 +107,15 @@ def normalize_time_window(
     return start_time, end_time
 
 
-async def get_authenticated_device(
-    device_uuid: UUID = Path(
-        ...,
-        description="Device UUID burned into firmware and registered in the telemetry registry.",
-    ),
-    api_key: str = Header(
-        alias="X-API-Key",
-        description="Plain-text API key issued to this device.",
-    ),
-    db: AsyncSession = Depends(get_db),
-) -> DeviceRegistry:
+async def load_device_registry(
+    device_uuid: UUID,
+    db: AsyncSession,
+) -> DeviceRegistry | None:
     """
-    Authenticate a device using its UUID and API key.
+    Load a device registry entry from Redis, falling back to Postgres.
 
-    Steps:
-    1. Look up the device by device_uuid in DeviceRegistry.
-    2. Verify the provided API key against the stored hash.
-    3. Return the DeviceRegistry ORM instance on success.
-
-    Errors:
-    - 404 if the device is not found in the registry.
-    - 401 if the API key is invalid.
+    Returns None if the device is not registered.
     """
-    logger.debug(
-        "Authenticating device",
-        extra={"device_uuid": str(device_uuid)},
-    )
-
     device_uuid_str = str(device_uuid)
     cache_key = f"device:registry:{device_uuid_str}"
     device = None
@@ -209,14 +178,10 @@ async def get_authenticated_device(
             ) from exc
 
         if device is None:
-            logger.warning(
-                "Device not found in registry",
-                extra={"device_uuid": device_uuid_str},
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Device not found.",
-            )
+            return None
+
+        # Shared across requests via device_cache: detach from this session
+        db.expunge(device)
 
         # Cache in Redis
         try:
@@ -244,8 +209,59 @@ async def get_authenticated_device(
                 exc_info=exc,
             )
 
-    # Verify API key
-    if not verify_api_key(api_key=api_key, stored_hash=device.api_key_hash):
+    return device
+
+
+async def get_authenticated_device(
+    device_uuid: UUID = Path(
+        ...,
+        description="Device UUID burned into firmware and registered in the telemetry registry.",
+    ),
+    api_key: str = Header(
+        alias="X-API-Key",
+        description="Plain-text API key issued to this device.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> DeviceRegistry:
+    """
+    Authenticate a device using its UUID and API key.
+
+    Steps:
+    1. Look up the device by device_uuid (in-process cache, then Redis/DB).
+    2. Verify the provided API key against the stored hash.
+    3. Return the DeviceRegistry ORM instance on success.
+
+    Errors:
+    - 404 if the device is not found in the registry.
+    - 401 if the API key is invalid.
+    """
+    logger.debug(
+        "Authenticating device",
+        extra={"device_uuid": str(device_uuid)},
+    )
+
+    device_uuid_str = str(device_uuid)
+
+    # try in-process cache, then Redis / Postgres
+    hit, cached = device_cache.get(device_uuid)
+    if not hit:
+        device = await load_device_registry(device_uuid, db)
+        cached = device_cache.set(device_uuid, device)
+
+    if cached is None:
+        logger.warning(
+            "Device not found in registry",
+            extra={"device_uuid": device_uuid_str, "cached": hit},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Device not found.",
+        )
+
+    device = cached.device
+
+    # Verify API key (memoized per device and stored hash)
+    if not api_key_verifier.verify(device_uuid, api_key, cached.stored_hash):
         logger.warning(
             "Invalid API key for device",
             extra={"device_uuid": device_uuid_str},
@@ -477,14 +493,27 @@ async def get_telemetry_count() -> dict[str, int]:
     summary="Ingest telemetry for a device",
     response_model=TelemetryItem,
     status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": TelemetryItem,
+            "description": "Buffered for delivery (KAFKA__ACK_MODE=async).",
+        },
+    },
 )
 async def create_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     payload: TelemetryCreate = Body(
         description="Telemetry payload containing coordinates and optional device timestamp.",
     ),
     producer: AIOKafkaProducer = Depends(get_producer),
 ) -> TelemetryItem:
+    """
+    Publish a telemetry event to Kafka.
+
+    With KAFKA__ACK_MODE=async the event is only buffered by the producer
+    and 202 Accepted is returned; the broker ack is tracked in background.
+    """
     now_utc = datetime.now(timezone.utc)
     device_time = payload.device_time or now_utc
 
@@ -494,24 +523,38 @@ async def create_telemetry_for_device(
         y_coord=payload.y_coord,
         device_time=device_time,
         system_time_utc=now_utc,
+        # idempotency key: the consumer stores a redelivered event once
+        event_id=uuid4(),
     )
 
     topic = settings.kafka.topic
     key = str(device.device_uuid).encode("utf-8")
-    value = item.model_dump(mode="json")
+    value = item  # encoded by the producer's value codec
 
     # ---- Kafka publish ----
     try:
-        md = await producer.send_and_wait(topic, value=value, key=key)
-        logger.info(
-            "Telemetry enqueued",
-            extra={
-                "device_uuid": str(device.device_uuid),
-                "topic": topic,
-                "partition": md.partition,
-                "offset": md.offset,
-            },
+        md = await publish(producer, topic, key=key, value=value)
+        if md is None:
+            response.status_code = status.HTTP_202_ACCEPTED
+        else:
+            logger.info(
+                "Telemetry enqueued",
+                extra={
+                    "device_uuid": str(device.device_uuid),
+                    "topic": topic,
+                    "partition": md.partition,
+                    "offset": md.offset,
+                },
+            )
+    except InFlightLimitExceeded as exc:
+        logger.warning(
+            "Kafka in-flight window full",
+            extra={"device_uuid": str(device.device_uuid), "topic": topic},
         )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telemetry ingest is overloaded, retry later.",
+        ) from exc
     except KafkaError as exc:
         logger.exception(
             "Kafka publish failed",
@@ -553,7 +596,9 @@ async def get_latest_telemetry_for_device(
     """
     Return the latest telemetry snapshot for the authenticated device from Redis only.
 
-    If the Redis key is missing (worker not synced yet), returns 404.
+    The key is synced by the outbox worker, and also written by the Kafka
+    consumer after each flush when LATEST_PROJECTION is on; if it is
+    missing, returns 404.
     """
     device_uuid_str = str(device.device_uuid)
     cache_key = f"telemetry:latest:{device_uuid_str}"
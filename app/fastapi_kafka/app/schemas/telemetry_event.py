@@ -63,6 +63,14 @@ class TelemetryItem(ORMModel):
         ),
         examples=["2025-11-17T12:34:56Z"],
     )
+    event_id: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Idempotency key assigned at ingest and carried through Kafka; "
+            "a redelivered event with the same key is stored only once. "
+            "Null for events written without one."
+        ),
+    )
 
 
 class TelemetryCountItem(BaseModel):
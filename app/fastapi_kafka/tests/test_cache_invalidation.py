@@ -0,0 +1,63 @@
+# tests/test_cache_invalidation.py
+import asyncio
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from app.cache import invalidation
+from app.cache.device_cache import device_cache
+from app.models import DeviceRegistry
+
+
+async def _start_listener(monkeypatch):
+    """Run listen_for_invalidations against a fake Redis until subscribed."""
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(invalidation, "redis_client", fake)
+
+    task = asyncio.create_task(invalidation.listen_for_invalidations())
+    for _ in range(100):
+        if (await fake.pubsub_numpat()) > 0:
+            break
+        await asyncio.sleep(0.01)
+    return fake, task
+
+
+async def _stop(task):
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def _cache_device():
+    device_uuid = uuid4()
+    device_cache.set(device_uuid, DeviceRegistry(device_uuid=device_uuid, api_key_hash="ab"))
+    return device_uuid
+
+
+@pytest.mark.asyncio
+async def test_registry_fill_does_not_evict(monkeypatch):
+    """The loader's own SET of the registry key keeps the in-process entry."""
+    fake, task = await _start_listener(monkeypatch)
+    device_uuid = _cache_device()
+
+    await fake.set(f"{invalidation.DEVICE_REGISTRY_KEY_PREFIX}{device_uuid}", "{}")
+    await asyncio.sleep(0.05)
+
+    assert device_cache.get(device_uuid)[0] is True
+    await _stop(task)
+
+
+@pytest.mark.asyncio
+async def test_registry_delete_evicts(monkeypatch):
+    """Deleting the registry key evicts the device on every worker."""
+    fake, task = await _start_listener(monkeypatch)
+    device_uuid = _cache_device()
+    key = f"{invalidation.DEVICE_REGISTRY_KEY_PREFIX}{device_uuid}"
+
+    await fake.set(key, "{}")
+    await fake.delete(key)
+    await asyncio.sleep(0.05)
+
+    assert device_cache.get(device_uuid) == (False, None)
+    await _stop(task)
@@ -0,0 +1,156 @@
+# tests/test_kafka_delivery.py
+import asyncio
+import json
+from uuid import UUID
+
+import httpx
+import pytest
+import pytest_asyncio
+from aiokafka.errors import KafkaTimeoutError
+
+from app import main
+from app.config import get_settings
+from app.models import DeviceRegistry
+from app.mq import kafka_delivery
+from app.mq.kafka_delivery import InFlightLimitExceeded, publish
+from app.routers import telemetry
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+KEY = DEVICE_UUID.encode()
+
+
+class FakeProducer:
+    """AIOKafkaProducer stand-in; every send returns a future the test resolves."""
+
+    def __init__(self, send_error=None):
+        self.send_error = send_error
+        self.futures = []
+
+    async def send(self, topic, value=None, key=None):
+        if self.send_error is not None:
+            raise self.send_error
+        fut = asyncio.get_running_loop().create_future()
+        self.futures.append(fut)
+        return fut
+
+    async def send_and_wait(self, topic, value=None, key=None):
+        raise AssertionError("sync mode is not expected here")
+
+
+@pytest_asyncio.fixture
+async def tracker(monkeypatch, tmp_path):
+    """Async ack mode with a 2-slot window and a dead-letter file under tmp_path."""
+    kafka = get_settings().kafka
+    monkeypatch.setattr(kafka, "ack_mode", "async")
+    monkeypatch.setattr(kafka, "max_in_flight", 2)
+    monkeypatch.setattr(kafka, "in_flight_timeout", 0.05)
+    monkeypatch.setattr(kafka, "dead_letter_path", str(tmp_path / "dead_letter.jsonl"))
+    monkeypatch.setattr(kafka_delivery, "_in_flight", None)
+    monkeypatch.setattr(kafka_delivery, "_dead_letters", None)
+    monkeypatch.setattr(kafka_delivery, "_stats", dict.fromkeys(kafka_delivery._stats, 0))
+
+    await kafka_delivery.start_delivery_tracker()
+    yield tmp_path / "dead_letter.jsonl"
+    await kafka_delivery.stop_delivery_tracker()
+
+
+async def _settle():
+    # done callbacks run on the next loop iteration
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_slot_released_on_success_and_on_failure(tracker):
+    producer = FakeProducer()
+
+    assert await publish(producer, "telemetry", key=KEY, value={"n": 1}) is None
+    assert await publish(producer, "telemetry", key=KEY, value={"n": 2}) is None
+    # window full: the third caller waits in_flight_timeout, then gives up
+    with pytest.raises(InFlightLimitExceeded):
+        await publish(producer, "telemetry", key=KEY, value={"n": 3})
+
+    ok, failed = producer.futures
+    ok.set_result(None)
+    failed.set_exception(KafkaTimeoutError())
+    await _settle()
+
+    assert kafka_delivery.delivery_stats() == {
+        "in_flight": 0, "sent": 2, "delivered": 1, "failed": 1, "dead_letter_dropped": 0,
+    }
+    # both slots are free again
+    await publish(producer, "telemetry", key=KEY, value={"n": 4})
+    await publish(producer, "telemetry", key=KEY, value={"n": 5})
+
+
+@pytest.mark.asyncio
+async def test_slot_released_when_producer_rejects(tracker):
+    with pytest.raises(KafkaTimeoutError):
+        await publish(FakeProducer(send_error=KafkaTimeoutError()), "telemetry", key=KEY, value={})
+
+    producer = FakeProducer()
+    await publish(producer, "telemetry", key=KEY, value={})
+    await publish(producer, "telemetry", key=KEY, value={})
+    assert len(producer.futures) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_written_to_dead_letter_file(tracker):
+    producer = FakeProducer()
+    await publish(producer, "telemetry", key=KEY, value={"x_coord": 1.5})
+    producer.futures[0].set_exception(KafkaTimeoutError())
+    await _settle()
+
+    # stop drains the queue before cancelling the writer
+    await kafka_delivery.stop_delivery_tracker()
+
+    [record] = [json.loads(line) for line in tracker.read_text().splitlines()]
+    assert record["topic"] == "telemetry"
+    assert record["key"] == DEVICE_UUID
+    assert record["value"] == {"x_coord": 1.5}
+    assert "KafkaTimeoutError" in record["error"]
+
+
+# ============================================================
+# POST /telemetry/{device_uuid}
+# ============================================================
+async def _post(producer):
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    main.app.dependency_overrides[telemetry.get_producer] = lambda: producer
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                f"/api/telemetry/{DEVICE_UUID}", json={"x_coord": 1.0, "y_coord": 2.0},
+            )
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_async_mode_returns_202_once_buffered(tracker):
+    producer = FakeProducer()
+
+    resp = await _post(producer)
+
+    assert resp.status_code == 202
+    assert resp.json()["device_uuid"] == DEVICE_UUID
+    assert len(producer.futures) == 1
+    producer.futures[0].set_result(None)
+    await _settle()
+
+
+@pytest.mark.asyncio
+async def test_full_in_flight_window_maps_to_503(tracker):
+    producer = FakeProducer()
+    await publish(producer, "telemetry", key=KEY, value={})
+    await publish(producer, "telemetry", key=KEY, value={})
+
+    resp = await _post(producer)
+
+    assert resp.status_code == 503
+    assert resp.json() == {"detail": "Telemetry ingest is overloaded, retry later."}
+    for fut in producer.futures:
+        fut.set_result(None)
+    await _settle()
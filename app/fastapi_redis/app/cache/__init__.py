@@ -0,0 +1,23 @@
+from .api_key_cache import ApiKeyVerifier, api_key_verifier
+from .device_cache import CachedDevice, DeviceCache, device_cache
+from .invalidation import listen_for_invalidations
+from .list_generation import bump_generation, get_generation, incr_generation
+from .single_flight import SingleFlight, telemetry_list_flight
+from .telemetry_series import add_to_series, read_series, reset_series
+
+__all__ = [
+    "ApiKeyVerifier",
+    "api_key_verifier",
+    "CachedDevice",
+    "DeviceCache",
+    "device_cache",
+    "listen_for_invalidations",
+    "bump_generation",
+    "get_generation",
+    "incr_generation",
+    "SingleFlight",
+    "telemetry_list_flight",
+    "add_to_series",
+    "read_series",
+    "reset_series",
+]
@@ -0,0 +1,99 @@
+# cache/device_cache.py
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from ..config import get_settings
+from ..models import DeviceRegistry
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDevice:
+    """A device registry row plus its API key hash normalized once."""
+
+    device: DeviceRegistry
+    stored_hash: str
+
+    @classmethod
+    def from_device(cls, device: DeviceRegistry) -> CachedDevice:
+        return cls(
+            device=device,
+            stored_hash=(device.api_key_hash or "").strip().lower(),
+        )
+
+
+class DeviceCache:
+    """
+    Per-worker LRU cache of device registry lookups used by device auth.
+
+    Entries expire after `ttl` seconds. Unknown device UUIDs are cached as
+    None for `negative_ttl` seconds so repeated requests for them do not
+    reach the backing store either. Not shared across workers; asyncio
+    code runs on one thread, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[UUID, tuple[float, CachedDevice | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, device_uuid: UUID) -> tuple[bool, CachedDevice | None]:
+        """
+        Returns:
+            (hit, entry). A hit with entry None is a cached "not found".
+        """
+        entry = self._entries.get(device_uuid)
+        if entry is None:
+            return False, None
+
+        expires_at, cached = entry
+        if expires_at <= time.monotonic():
+            del self._entries[device_uuid]
+            return False, None
+
+        self._entries.move_to_end(device_uuid)
+        return True, cached
+
+    def set(self, device_uuid: UUID, device: DeviceRegistry | None) -> CachedDevice | None:
+        """
+        Cache a lookup result (None for "not found").
+
+        Returns:
+            The cache entry for `device`, even when caching is disabled.
+        """
+        cached = CachedDevice.from_device(device) if device is not None else None
+
+        ttl = self.ttl if cached is not None else self.negative_ttl
+        if self.maxsize <= 0 or ttl <= 0:
+            return cached
+
+        self._entries[device_uuid] = (time.monotonic() + ttl, cached)
+        self._entries.move_to_end(device_uuid)
+
+        # Evict least recently used entries beyond the size bound
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return cached
+
+    def invalidate(self, device_uuid: UUID) -> None:
+        self._entries.pop(device_uuid, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+device_cache = DeviceCache(
+    maxsize=settings.device_cache_size,
+    ttl=settings.device_cache_ttl,
+    negative_ttl=settings.device_cache_negative_ttl,
+)
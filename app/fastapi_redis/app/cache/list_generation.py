@@ -0,0 +1,53 @@
+# cache/list_generation.py
+"""
+Per-device generation of the telemetry listing cache.
+
+    telemetry:gen:{uuid}   INCR after every committed write for the device
+
+Listing cache keys embed the generation they were read under, so a write
+makes every cached window of that device unreachable at once, without
+SCAN/DEL; the orphans just age out with their TTL. The counter has no TTL:
+if it expired and restarted, old keys could become reachable again.
+
+A bump lost to a Redis error leaves the device's cached windows stale
+until TELEMETRY_LIST_CACHE_TTL, so that TTL is kept to minutes.
+
+Bumped by the API after its INSERT commits (INGEST_MODE=db) and by the
+stream worker after each batch commits (INGEST_MODE=stream).
+"""
+from __future__ import annotations
+
+from uuid import UUID
+
+from ..db import redis_client
+
+TELEMETRY_GEN = "telemetry:gen"
+
+
+def generation_key(device_uuid: UUID) -> str:
+    return f"{TELEMETRY_GEN}:{device_uuid}"
+
+
+async def get_generation(device_uuid: UUID) -> int:
+    """
+    Raises:
+        RedisError: Redis unavailable.
+    """
+    value = await redis_client.get(generation_key(device_uuid))
+    return int(value or 0)
+
+
+def bump_generation(pipe, device_uuid: UUID) -> None:
+    """Queue the generation INCR on a pipeline."""
+    pipe.incr(generation_key(device_uuid))
+
+
+async def incr_generation(device_uuid: UUID) -> None:
+    """
+    INCR the generation on its own, e.g. after the pipeline that queued
+    it failed.
+
+    Raises:
+        RedisError: Redis unavailable.
+    """
+    await redis_client.incr(generation_key(device_uuid))
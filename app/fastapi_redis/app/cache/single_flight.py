@@ -0,0 +1,136 @@
+# cache/single_flight.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from ..config import get_settings
+from ..db import redis_client
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL_SEC = 0.025
+
+# Delete the lock only if this caller still owns it
+LUA_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_release_lock = redis_client.register_script(LUA_RELEASE_LOCK)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent cache misses so one caller loads a value and the
+    rest reuse it.
+
+    Within a worker, callers of the same key await the in-flight future.
+    Across workers, the first caller takes "{key}:lock" (SET NX PX); others
+    poll the cache key until the holder has written it, and load it
+    themselves only if it does not appear within `lock_ms`. A Redis error
+    never fails the request: the caller just loads without coordination.
+    """
+
+    def __init__(self, lock_ms: int) -> None:
+        self.lock_ms = lock_ms
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+    async def load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        ttl: int,
+    ) -> str:
+        """
+        Return the value for `key`, calling `loader` at most once per worker
+        (and, while the lock holds, once across workers) and caching its
+        result for `ttl` seconds.
+
+        Raises:
+            Whatever `loader` raises, to every caller coalesced onto it.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # the loading request was cancelled, not this one
+                return await self.load(key, loader, ttl)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load_shared(key, loader, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: no "never retrieved" warning without waiters
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_shared(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        ttl: int,
+    ) -> str:
+        lock_key = f"{key}:lock"
+        token = uuid4().hex
+
+        try:
+            locked = bool(await redis_client.set(lock_key, token, nx=True, px=self.lock_ms))
+        except RedisError:
+            logger.warning("Failed to take cache lock", extra={"cache_key": key})
+            return await loader()
+
+        if not locked:
+            value = await self._wait_for(key)
+            if value is not None:
+                return value
+            logger.debug("Cache lock holder too slow, loading", extra={"cache_key": key})
+
+        try:
+            value = await loader()
+            try:
+                await redis_client.set(key, value, ex=ttl)
+            except RedisError:
+                logger.warning("Failed to write cache", extra={"cache_key": key})
+            return value
+        finally:
+            if locked:
+                try:
+                    await _release_lock(keys=[lock_key], args=[token])
+                except RedisError:
+                    pass  # expires after lock_ms
+
+    async def _wait_for(self, key: str) -> str | None:
+        deadline = time.monotonic() + self.lock_ms / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(POLL_INTERVAL_SEC)
+            try:
+                value = await redis_client.get(key)
+            except RedisError:
+                return None
+            if value is not None:
+                return value
+        return None
+
+
+telemetry_list_flight = SingleFlight(lock_ms=settings.telemetry_cache_lock_ms)
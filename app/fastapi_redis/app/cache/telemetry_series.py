@@ -0,0 +1,147 @@
+# cache/telemetry_series.py
+"""
+Per-device recent telemetry kept in Redis for the listing endpoint.
+
+    telemetry:series:{uuid}        ZSET, member = TelemetryItem JSON,
+                                   score = system_time_utc in microseconds
+    telemetry:series:{uuid}:since  coverage: the ZSET holds every event
+                                   with score >= since
+
+Both are maintained after the rows commit by one Lua call that adds the
+new events and trims the set to TELEMETRY_SERIES_SECONDS /
+TELEMETRY_SERIES_MAX_EVENTS, moving `since` past whatever was trimmed:
+by the API with INGEST_MODE=db, by the stream worker with
+INGEST_MODE=stream (queued events are not stored yet and may be
+dead-lettered). Coverage starts at the first event written, so after a
+Redis flush or for an idle device nothing older is ever claimed.
+
+If committed events cannot be added, both keys are dropped (reset_series):
+`since` would otherwise claim coverage of rows the set does not hold.
+
+A window query is answered from the ZSET when that is exact: it returned
+`limit` events whose range is covered, or fewer and the whole window is
+covered. Otherwise the caller falls back to Postgres.
+
+Scores are integers below 2**53, so they are exact as Redis doubles.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+from uuid import UUID
+
+from ..config import get_settings
+from ..db import redis_client
+from ..schemas import TelemetryItem
+
+settings = get_settings()
+
+TELEMETRY_SERIES = "telemetry:series"
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# KEYS[1] series, KEYS[2] since
+# ARGV[1] horizon score (older events are dropped), ARGV[2] max events,
+# ARGV[3] ttl seconds, ARGV[4..] score, member pairs
+LUA_SERIES_ADD = """
+local series, cover = KEYS[1], KEYS[2]
+local horizon = tonumber(ARGV[1])
+local max_len = tonumber(ARGV[2])
+
+-- a new series covers from its oldest event; an existing one never moves back
+local since = tonumber(redis.call('GET', cover))
+local is_new = not since
+for i = 4, #ARGV, 2 do
+  local score = tonumber(ARGV[i])
+  if is_new and (not since or score < since) then since = score end
+  redis.call('ZADD', series, ARGV[i], ARGV[i + 1])
+end
+
+redis.call('ZREMRANGEBYSCORE', series, '-inf', '(' .. ARGV[1])
+if horizon > since then since = horizon end
+
+local excess = redis.call('ZCARD', series) - max_len
+if excess > 0 then
+  local cut = redis.call('ZRANGE', series, excess - 1, excess - 1, 'WITHSCORES')
+  redis.call('ZREMRANGEBYRANK', series, 0, excess - 1)
+  local after_cut = tonumber(cut[2]) + 1
+  if after_cut > since then since = after_cut end
+end
+
+redis.call('SET', cover, string.format('%d', since), 'EX', ARGV[3])
+redis.call('EXPIRE', series, ARGV[3])
+return redis.call('ZCARD', series)
+"""
+
+_series_add = redis_client.register_script(LUA_SERIES_ADD)
+
+
+def series_keys(device_uuid: UUID) -> tuple[str, str]:
+    series_key = f"{TELEMETRY_SERIES}:{device_uuid}"
+    return series_key, f"{series_key}:since"
+
+
+def to_score(ts: datetime) -> int:
+    """UTC timestamp -> integer microseconds since the epoch."""
+    return (ts - EPOCH) // timedelta(microseconds=1)
+
+
+async def add_to_series(pipe, device_uuid: UUID, items: Sequence[TelemetryItem]) -> None:
+    """Queue the series update for freshly ingested items on a pipeline."""
+    horizon = to_score(datetime.now(timezone.utc)) - settings.telemetry_series_seconds * 1_000_000
+
+    args: list = [horizon, settings.telemetry_series_max_events, settings.telemetry_series_seconds]
+    for item in items:
+        args += [to_score(item.system_time_utc), item.model_dump_json()]
+
+    await _series_add(keys=list(series_keys(device_uuid)), args=args, client=pipe)
+
+
+async def reset_series(device_uuid: UUID) -> None:
+    """
+    Drop a device's series and coverage; the next add starts a new one.
+
+    Raises:
+        RedisError: Redis unavailable.
+    """
+    await redis_client.delete(*series_keys(device_uuid))
+
+
+async def read_series(
+    device_uuid: UUID,
+    start_time: datetime,
+    end_time: datetime,
+    limit: int,
+) -> list[TelemetryItem] | None:
+    """
+    Newest `limit` events in [start_time, end_time], most recent first.
+
+    Returns:
+        The events, or None when the series cannot answer exactly.
+
+    Raises:
+        RedisError: Redis unavailable.
+    """
+    series_key, since_key = series_keys(device_uuid)
+    start_score = to_score(start_time)
+
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zrevrangebyscore(
+        series_key,
+        to_score(end_time),
+        start_score,
+        start=0,
+        num=limit,
+        withscores=True,
+    )
+    pipe.get(since_key)
+    members, since = await pipe.execute()
+
+    if since is None:
+        return None
+
+    # a full page only needs its own span covered, a short one the whole window
+    bound = int(members[-1][1]) if len(members) == limit else start_score
+    if int(since) > bound:
+        return None
+
+    return [TelemetryItem.model_validate_json(member) for member, _ in members]
@@ -61,6 +61,17 @@ class RedisSettings(BaseModel):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+# ==============================
+# Redis Stream
+# ==============================
+class StreamSettings(BaseModel):
+    """Redis Stream ingest configuration (INGEST_MODE=stream)."""
+
+    key: str = "telemetry:stream"       # shard n is "{key}:{n}"
+    shards: int = Field(default=4, ge=1)  # must match the stream worker
+    maxlen: int = Field(default=1_000_000, ge=0)  # approximate cap per shard; 0: none
+
+
 # ==============================
 # Application Settings
 # ==============================
@@ -124,6 +135,77 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    ingest_mode: Literal["db", "stream"] = Field(
+        default="db",
+        alias="INGEST_MODE",
+        description="db: POST writes to Postgres; stream: POST XADDs to a Redis Stream (202).",
+    )
+
+    # ------------------------------
+    # Device auth cache
+    # ------------------------------
+    device_cache_size: int = Field(
+        default=100_000,
+        ge=0,
+        alias="DEVICE_CACHE_SIZE",
+        description="Max devices kept in the per-worker auth cache (0 disables).",
+    )
+
+    device_cache_ttl: float = Field(
+        default=300.0,
+        ge=0,
+        alias="DEVICE_CACHE_TTL",
+        description="Seconds a cached device registry entry stays valid.",
+    )
+
+    device_cache_negative_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        alias="DEVICE_CACHE_NEGATIVE_TTL",
+        description="Seconds an unknown device UUID stays cached as not found.",
+    )
+
+    # ------------------------------
+    # Recent telemetry series (listing)
+    # ------------------------------
+    telemetry_series_seconds: int = Field(
+        default=3600,
+        ge=1,
+        alias="TELEMETRY_SERIES_SECONDS",
+        description="Seconds of recent telemetry kept per device in Redis for listings.",
+    )
+
+    telemetry_series_max_events: int = Field(
+        default=1000,
+        ge=1,
+        alias="TELEMETRY_SERIES_MAX_EVENTS",
+        description="Max recent telemetry events kept per device in Redis for listings.",
+    )
+
+    # ------------------------------
+    # Telemetry listing cache (Postgres fallback)
+    # ------------------------------
+    telemetry_cache_bucket_seconds: int = Field(
+        default=10,
+        ge=0,
+        alias="TELEMETRY_CACHE_BUCKET_SECONDS",
+        description="Open-ended listing windows are widened to multiples of this many seconds for caching (0 disables).",
+    )
+
+    telemetry_list_cache_ttl: int = Field(
+        default=300,
+        ge=1,
+        alias="TELEMETRY_LIST_CACHE_TTL",
+        description="Seconds a cached listing window is kept; writes invalidate it via the device generation, the TTL bounds staleness if a bump is lost.",
+    )
+
+    telemetry_cache_lock_ms: int = Field(
+        default=2000,
+        ge=1,
+        alias="TELEMETRY_CACHE_LOCK_MS",
+        description="Milliseconds a listing cache miss holds its lock while querying Postgres.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
@@ -158,6 +240,7 @@ class Settings(BaseSettings):
     # ------------------------------
     postgres: PostgresSettings = PostgresSettings()
     redis: RedisSettings = RedisSettings()
+    stream: StreamSettings = StreamSettings()
 
     # Properties
     @property
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import listen_for_invalidations
 from .config import get_settings, setup_logging
 from .routers import home, health, device, telemetry
 
@@ -16,6 +20,15 @@ API_PREFIX = "/api"
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    invalidation_task = asyncio.create_task(listen_for_invalidations())
+    yield
+    invalidation_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await invalidation_task
+
+
 app = FastAPI(
     title="IoT Device Management API",
     version="0.1.0",
@@ -25,6 +38,7 @@ app = FastAPI(
         "and API keys, while administrative endpoints are intended for internal "
         "operations and tooling."
     ),
+    lifespan=lifespan,
 )
 
 
@@ -45,6 +59,7 @@ app.add_middleware(
     allow_credentials=False,  # no cookies for devices
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type", "x-api-key"],
+    expose_headers=["X-Next-Cursor", "Link"],  # listing pagination
 )
 
 # ====================
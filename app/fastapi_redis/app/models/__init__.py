@@ -2,11 +2,13 @@
 from .base import Base
 from .device_registry import DeviceRegistry
 from .telemetry_event import TelemetryEvent
+from .telemetry_event_count import TelemetryEventCount
 from .telemetry_latest import TelemetryLatest
 
 __all__ = [
     "Base",
     "DeviceRegistry",
     "TelemetryEvent",
+    "TelemetryEventCount",
     "TelemetryLatest",
 ]
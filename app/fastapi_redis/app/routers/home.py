@@ -2,6 +2,7 @@
 import os
 from fastapi import APIRouter
 
+from ..cache import api_key_verifier, device_cache
 from ..config.setting import get_settings
 
 # ====================
@@ -54,6 +55,11 @@ async def home() -> dict:
             "max_overflow": settings.max_overflow,
         }
 
+        response["auth_cache"] = {
+            "device_cache_size": len(device_cache),
+            "api_key": api_key_verifier.stats(),
+        }
+
         response["postgres"] = {
             "host": settings.postgres.host,
             "port": settings.postgres.port,
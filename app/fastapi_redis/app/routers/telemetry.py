@@ -1,12 +1,16 @@
 # routers/telemetry.py
 from __future__ import annotations
 
-import hashlib
-import hmac
+import base64
+import binascii
+import csv
+import io
 import json
 import logging
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from typing import Literal
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
@@ -16,21 +20,39 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Request,
+    Response,
     status,
 )
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
 
-from sqlalchemy import select, func
+from sqlalchemy import insert, or_, select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import (
+    add_to_series,
+    api_key_verifier,
+    bump_generation,
+    device_cache,
+    get_generation,
+    incr_generation,
+    read_series,
+    reset_series,
+    telemetry_list_flight,
+)
 from ..db import get_db, redis_client
-from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
+from ..models import DeviceRegistry, TelemetryEvent, TelemetryEventCount, TelemetryLatest
 from ..schemas import (
     TelemetryCreate,
     TelemetryItem,
+    TelemetryPage,
     TelemetryCountItem,
+    TelemetryBatchItem,
     TelemetryLatestItem,
 )
+from ..stream import publish_telemetry, stream_key_for
 
 from ..config import get_settings
 
@@ -48,22 +70,30 @@ MAX_LATEST_SECONDS = 24 * 3600      # 24 hours
 
 TELEMETRY_CACHE_TTL_SECONDS = 3600    # Short TTL to limit staleness
 
+MAX_BATCH_SIZE = 500                # Max telemetry events per batch request
 
-# ============================================================
-# Helper functions
-# ============================================================
-def verify_api_key(api_key: str, stored_hash: str | None) -> bool:
-    """
-    Verify a plain-text API key against a stored SHA-256 hex digest.
-    """
-    if not stored_hash:
-        return False
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-    stored_hash = stored_hash.strip().lower()
-    candidate_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
-    return hmac.compare_digest(candidate_hash, stored_hash)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"  # cursor of the next listing page
 
+EXPORT_CHUNK_ROWS = 1000            # Rows fetched from the server-side cursor per chunk
 
+# Core INSERT ... RETURNING for the single-event ingest path. Built once at
+# import so the compiled SQL (and asyncpg's prepared statement) is reused,
+# and the stored row comes back without a post-commit SELECT.
+INSERT_TELEMETRY_STMT = insert(TelemetryEvent.__table__).returning(
+    TelemetryEvent.__table__.c.device_uuid,
+    TelemetryEvent.__table__.c.x_coord,
+    TelemetryEvent.__table__.c.y_coord,
+    TelemetryEvent.__table__.c.device_time,
+    TelemetryEvent.__table__.c.system_time_utc,
+    TelemetryEvent.__table__.c.event_id,
+)
+
+
+# ============================================================
+# Helper functions
+# ============================================================
 def normalize_time_window(
     start_time: datetime | None,
     end_time: datetime | None,
@@ -113,34 +143,106 @@ def normalize_time_window(
     return start_time, end_time
 
 
-async def get_authenticated_device(
-    device_uuid: UUID = Path(
-        ...,
-        description="Device UUID burned into firmware and registered in the telemetry registry.",
-    ),
-    api_key: str = Header(
-        alias="X-API-Key",
-        description="Plain-text API key issued to this device.",
-    ),
-    db: AsyncSession = Depends(get_db),
-) -> DeviceRegistry:
+def align_open_window(
+    start_time: datetime,
+    end_time: datetime,
+    bucket_seconds: int,
+    widen_start: bool,
+) -> tuple[datetime, datetime]:
     """
-    Authenticate a device using its UUID and API key.
+    Widen a window whose end defaulted to now() out to bucket boundaries:
+    the end up to the next one, and with `widen_start` (start derived from
+    the end) the start down to the previous one.
+
+    Requests within the same `bucket_seconds` then read the same window
+    (and cache key). Nothing is dropped: no row is newer than now(), rows
+    written later bump the device generation and so miss the cached page,
+    and clip_page() trims the result back to the requested window.
+    """
+    if bucket_seconds <= 0:
+        return start_time, end_time
 
-    Steps:
-    1. Look up the device by device_uuid in DeviceRegistry.
-    2. Verify the provided API key against the stored hash.
-    3. Return the DeviceRegistry ORM instance on success.
+    bucket = timedelta(seconds=bucket_seconds)
+    aligned_end = end_time + (-(end_time - EPOCH)) % bucket
 
-    Errors:
-    - 404 if the device is not found in the registry.
-    - 401 if the API key is invalid.
+    if widen_start:
+        return start_time - (start_time - EPOCH) % bucket, aligned_end
+    return start_time, aligned_end
+
+
+def clip_page(page: TelemetryPage, start_time: datetime, end_time: datetime) -> TelemetryPage:
     """
-    logger.debug(
-        "Authenticating device",
-        extra={"device_uuid": str(device_uuid)},
-    )
+    Restrict a page read for an aligned (wider) window to [start_time, end_time].
+
+    Items past the requested start end the listing: their next page would
+    be older still.
+    """
+    items = [i for i in page.items if start_time <= i.system_time_utc <= end_time]
+    if len(items) == len(page.items):
+        return page
+
+    next_cursor = page.next_cursor
+    if page.items[-1].system_time_utc < start_time:
+        next_cursor = None
+    return TelemetryPage(items=items, next_cursor=next_cursor)
+
+
+def encode_cursor(system_time_utc: datetime, event_id: int | None) -> str:
+    """
+    Opaque listing cursor: the (system_time_utc, id) of the last item returned,
+    as "<microseconds since epoch>:<id>" in unpadded URL-safe base64.
+
+    Pages served from the Redis series carry no id; their cursor ("<us>:")
+    continues strictly before system_time_utc, so it is only issued when
+    the page does not end inside a run of equal timestamps.
+    """
+    micros = (system_time_utc - EPOCH) // timedelta(microseconds=1)
+    raw = f"{micros}:{'' if event_id is None else event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def set_next_cursor(request: Request, response: Response, next_cursor: str | None) -> None:
+    """
+    Advertise the next listing page in headers, leaving the body a plain
+    array: the cursor itself, and the page URL as `Link: <...>; rel="next"`.
+    """
+    if next_cursor is None:
+        return
+    url = request.url.include_query_params(cursor=next_cursor)
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    response.headers["Link"] = f'<{url.path}?{url.query}>; rel="next"'
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int | None]:
+    """
+    Inverse of encode_cursor.
+
+    Raises:
+        HTTPException(400): the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, event_id = raw.split(":")
+        return (
+            EPOCH + timedelta(microseconds=int(micros)),
+            int(event_id) if event_id else None,
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        ) from exc
 
+
+async def load_device_registry(
+    device_uuid: UUID,
+    db: AsyncSession,
+) -> DeviceRegistry | None:
+    """
+    Load a device registry entry from Redis, falling back to Postgres.
+
+    Returns None if the device is not registered.
+    """
     device_uuid_str = str(device_uuid)
     cache_key = f"device:registry:{device_uuid_str}"
     device = None
@@ -203,14 +305,10 @@ async def get_authenticated_device(
             ) from exc
 
         if device is None:
-            logger.warning(
-                "Device not found in registry",
-                extra={"device_uuid": device_uuid_str},
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Device not found.",
-            )
+            return None
+
+        # Shared across requests via device_cache: detach from this session
+        db.expunge(device)
 
         # Cache in Redis
         try:
@@ -238,8 +336,59 @@ async def get_authenticated_device(
                 exc_info=exc,
             )
 
-    # Verify API key
-    if not verify_api_key(api_key=api_key, stored_hash=device.api_key_hash):
+    return device
+
+
+async def get_authenticated_device(
+    device_uuid: UUID = Path(
+        ...,
+        description="Device UUID burned into firmware and registered in the telemetry registry.",
+    ),
+    api_key: str = Header(
+        alias="X-API-Key",
+        description="Plain-text API key issued to this device.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> DeviceRegistry:
+    """
+    Authenticate a device using its UUID and API key.
+
+    Steps:
+    1. Look up the device by device_uuid (in-process cache, then Redis/DB).
+    2. Verify the provided API key against the stored hash.
+    3. Return the DeviceRegistry ORM instance on success.
+
+    Errors:
+    - 404 if the device is not found in the registry.
+    - 401 if the API key is invalid.
+    """
+    logger.debug(
+        "Authenticating device",
+        extra={"device_uuid": str(device_uuid)},
+    )
+
+    device_uuid_str = str(device_uuid)
+
+    # try in-process cache, then Redis / Postgres
+    hit, cached = device_cache.get(device_uuid)
+    if not hit:
+        device = await load_device_registry(device_uuid, db)
+        cached = device_cache.set(device_uuid, device)
+
+    if cached is None:
+        logger.warning(
+            "Device not found in registry",
+            extra={"device_uuid": device_uuid_str, "cached": hit},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Device not found.",
+        )
+
+    device = cached.device
+
+    # Verify API key (memoized per device and stored hash)
+    if not api_key_verifier.verify(device_uuid, api_key, cached.stored_hash):
         logger.warning(
             "Invalid API key for device",
             extra={"device_uuid": device_uuid_str},
@@ -257,6 +406,65 @@ async def get_authenticated_device(
     return device
 
 
+async def enqueue_telemetry(device: DeviceRegistry, items: list[TelemetryItem]) -> None:
+    """
+    Append telemetry items to the device's Redis stream shard.
+
+    Raises:
+        HTTPException(503): the stream could not be written.
+    """
+    stream_key = stream_key_for(device.device_uuid)
+
+    try:
+        await publish_telemetry(items)
+    except RedisError as exc:
+        logger.exception(
+            "Redis stream publish failed",
+            extra={"device_uuid": str(device.device_uuid), "stream": stream_key},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to enqueue telemetry event.",
+        ) from exc
+
+    logger.debug(
+        "Telemetry enqueued",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "stream": stream_key,
+            "count": len(items),
+        },
+    )
+
+
+async def forget_series(device_uuid: UUID) -> None:
+    """
+    Drop the device's recent series after committed events failed to be
+    added, so listings fall back to Postgres instead of missing them.
+    """
+    try:
+        await reset_series(device_uuid)
+    except RedisError:
+        logger.error(
+            "Failed to reset telemetry series; listings may miss events until it expires",
+            extra={"device_uuid": str(device_uuid)},
+        )
+
+
+async def forget_listings(device_uuid: UUID) -> None:
+    """
+    Retry the generation bump on its own after the write pipeline failed,
+    so cached listings do not keep serving a window without the new events.
+    """
+    try:
+        await incr_generation(device_uuid)
+    except RedisError:
+        logger.error(
+            "Failed to invalidate cached telemetry listings; they may be stale until TELEMETRY_LIST_CACHE_TTL",
+            extra={"device_uuid": str(device_uuid)},
+        )
+
+
 # ============================================================
 # GET /telemetry/count
 # ============================================================
@@ -275,11 +483,12 @@ async def get_telemetry_count(
     """
     logger.debug("Fetching telemetry count (total telemetry event count)")
 
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    # Trigger-maintained sharded counter: constant-time regardless of table size
+    stmt = select(func.coalesce(func.sum(TelemetryEventCount.row_count), 0))
 
     try:
         result = await db.execute(stmt)
-        telemetry_count = result.scalar_one()
+        telemetry_count = int(result.scalar_one())
     except SQLAlchemyError as exc:
         logger.exception("Database error while fetching telemetry count")
         raise HTTPException(
@@ -306,11 +515,18 @@ async def get_telemetry_count(
         "The device must authenticate using the `X-API-Key` header. The time window can "
         "be specified using `start_time` and `end_time`, or by using `latest_seconds` "
         "to request data from a recent lookback period.\n\n"
-        "Results are ordered by `system_time_utc` in descending order (most recent first)."
+        "Results are ordered by `system_time_utc` in descending order (most recent first).\n\n"
+        "Recent windows are answered from a per-device Redis sorted set; older "
+        "ones fall back to PostgreSQL.\n\n"
+        "When more events remain, the response carries an `X-Next-Cursor` header (and a "
+        "`Link: rel=\"next\"` URL); pass it back as `cursor` to read the next, older page "
+        "of the same window."
     ),
     response_model=list[TelemetryItem],
 )
 async def list_telemetry_for_device(
+    request: Request,
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     start_time: datetime | None = Query(
         default=None,
@@ -342,6 +558,10 @@ async def list_telemetry_for_device(
         le=5000,
         description="Maximum number of telemetry records to return.",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description="`X-Next-Cursor` of the previous page; continues after its last item.",
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> list[TelemetryItem]:
     """
@@ -349,7 +569,26 @@ async def list_telemetry_for_device(
 
     The device is authenticated via its UUID (path) and API key (header).
     Only telemetry for the authenticated device is returned.
+
+    The newest `limit` events in the window come from the device's Redis
+    series with one ZREVRANGEBYSCORE when it retains enough of the window
+    (see cache/telemetry_series.py); otherwise PostgreSQL is queried and
+    the result cached per window until the device's next write. Open-ended
+    windows are widened to TELEMETRY_CACHE_BUCKET_SECONDS for that path so
+    repeated polls share a cache key (the page is clipped back to the
+    requested window), and concurrent misses of one key run a single query.
+
+    Later pages (`cursor`) always come from PostgreSQL, read with a keyset
+    seek on (system_time_utc, id) below the cursor, which the (device_uuid,
+    system_time_utc DESC) index serves directly, so a deep page costs the
+    same as the first.
     """
+    after = decode_cursor(cursor) if cursor is not None else None
+
+    # end_time defaults to now: such windows are aligned for caching below
+    open_ended = end_time is None
+    derived_start = start_time is None
+
     # Normalize time window
     start_time, end_time = normalize_time_window(
         start_time=start_time,
@@ -367,16 +606,72 @@ async def list_telemetry_for_device(
         },
     )
 
+    # Recent window, first page: Redis series (one extra event tells
+    # whether another page exists)
+    items = None
+    if after is None:
+        try:
+            items = await read_series(device.device_uuid, start_time, end_time, limit + 1)
+        except Exception:
+            logger.warning(
+                "Failed to read telemetry series from Redis, falling back",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+
+    if items is not None:
+        next_cursor = None
+        if len(items) > limit:
+            last, following = items[limit - 1], items[limit]
+            # no id to break a tie at the page boundary: let Postgres page it
+            if last.system_time_utc == following.system_time_utc:
+                items = None
+            else:
+                items = items[:limit]
+                next_cursor = encode_cursor(last.system_time_utc, None)
+
+    if items is not None:
+        logger.debug(
+            "Telemetry served from Redis series",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "returned_count": len(items),
+            },
+        )
+        set_next_cursor(request, response, next_cursor)
+        return items
+
+    # Postgres fallback: cache per window, one query per concurrent miss
+    query_start, query_end = start_time, end_time
+    if open_ended:
+        query_start, query_end = align_open_window(
+            start_time,
+            end_time,
+            settings.telemetry_cache_bucket_seconds,
+            widen_start=derived_start,
+        )
+
+    # the key embeds the device's generation: any later write makes it stale
+    try:
+        generation = await get_generation(device.device_uuid)
+    except Exception:
+        logger.warning(
+            "Failed to read telemetry cache generation, bypassing cache",
+            extra={"device_uuid": str(device.device_uuid)},
+        )
+        generation = None
+
     cache_key = (
         f"telemetry:{device.device_uuid}:"
-        f"{int(start_time.timestamp())}:"
-        f"{int(end_time.timestamp())}:"
-        f"{limit}"
+        f"{generation}:"
+        f"{int(query_start.timestamp())}:"
+        f"{int(query_end.timestamp())}:"
+        f"{limit}:"
+        f"{cursor or ''}"
     )
 
     # Try Redis cache
     try:
-        cached = await redis_client.get(cache_key)
+        cached = await redis_client.get(cache_key) if generation is not None else None
     except Exception:
         cached = None
 
@@ -387,9 +682,9 @@ async def list_telemetry_for_device(
                 device.device_uuid), "cache_key": cache_key},
         )
         try:
-            payload = json.loads(cached)
-            items = [TelemetryItem.model_validate(obj) for obj in payload]
-            return items
+            page = clip_page(TelemetryPage.model_validate_json(cached), start_time, end_time)
+            set_next_cursor(request, response, page.next_cursor)
+            return page.items
         except Exception:
             # If cache is corrupted or incompatible, ignore and fall back to DB
             logger.warning(
@@ -398,67 +693,227 @@ async def list_telemetry_for_device(
                     device.device_uuid), "cache_key": cache_key},
             )
 
-    # Cache miss: query PostgreSQL
+    async def query_window() -> str:
+        # Cache miss: query PostgreSQL
+        stmt = (
+            select(TelemetryEvent)
+            .where(
+                TelemetryEvent.device_uuid == device.device_uuid,
+                TelemetryEvent.system_time_utc >= query_start,
+                TelemetryEvent.system_time_utc <= query_end,
+            )
+            .order_by(TelemetryEvent.system_time_utc.desc(), TelemetryEvent.id.desc())
+            .limit(limit + 1)
+        )
+
+        if after is not None:
+            after_time, after_id = after
+            # the bare bound is the index range; the OR only filters ties
+            stmt = stmt.where(
+                TelemetryEvent.system_time_utc <= after_time,
+                TelemetryEvent.system_time_utc < after_time
+                if after_id is None
+                else or_(
+                    TelemetryEvent.system_time_utc < after_time,
+                    TelemetryEvent.id < after_id,
+                ),
+            )
+
+        try:
+            result = await db.execute(stmt)
+            rows = result.scalars().all()
+        except SQLAlchemyError as exc:
+            logger.exception(
+                "Database error while listing telemetry",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve telemetry.",
+            ) from exc
+
+        logger.debug(
+            "Telemetry listing queried",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "returned_count": len(rows),
+                "cache_key": cache_key,
+            },
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].system_time_utc, rows[-1].id)
+
+        return TelemetryPage(
+            items=[TelemetryItem.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        ).model_dump_json()
+
+    # Concurrent misses of this key (any worker) share one query; the
+    # result is cached for TELEMETRY_LIST_CACHE_TTL
+    if generation is None:
+        payload = await query_window()
+    else:
+        payload = await telemetry_list_flight.load(
+            cache_key, query_window, settings.telemetry_list_cache_ttl,
+        )
+    page = clip_page(TelemetryPage.model_validate_json(payload), start_time, end_time)
+
+    logger.debug(
+        "Telemetry listing succeeded",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "returned_count": len(page.items),
+            "has_more": page.next_cursor is not None,
+        },
+    )
+    set_next_cursor(request, response, page.next_cursor)
+    return page.items
+
+
+# ============================================================
+# GET /telemetry/{device_uuid}/export
+# ============================================================
+# Plain columns, not ORM entities: the session keeps no identity map
+# entry per exported row, so memory stays flat however long the export.
+EXPORT_COLUMNS = (
+    TelemetryEvent.__table__.c.device_uuid,
+    TelemetryEvent.__table__.c.x_coord,
+    TelemetryEvent.__table__.c.y_coord,
+    TelemetryEvent.__table__.c.device_time,
+    TelemetryEvent.__table__.c.system_time_utc,
+    TelemetryEvent.__table__.c.event_id,
+)
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def format_ndjson(rows: Sequence) -> str:
+    """One JSON object per row, newline-terminated."""
+    return "".join(
+        json.dumps({key: _export_value(value) for key, value in row._mapping.items()}) + "\n"
+        for row in rows
+    )
+
+
+def format_csv(rows: Sequence) -> str:
+    """CSV records (no header) for a chunk of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(_export_value(value) for value in row)
+    return buffer.getvalue()
+
+
+@router.get(
+    "/{device_uuid}/export",
+    summary="Export telemetry history for a device",
+    description=(
+        "Stream every telemetry event of a device in `[start_time, end_time]` as NDJSON "
+        "(one JSON object per line) or CSV with a header row, oldest first. The device "
+        "must authenticate using the `X-API-Key` header.\n\n"
+        "Rows are read through a server-side cursor and sent in chunks, so any range can "
+        "be exported with constant memory. A database error after the first chunk ends "
+        "the response early."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "Telemetry events, oldest first.",
+        },
+    },
+)
+async def export_telemetry_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    start_time: datetime = Query(
+        description="Start of the time range (UTC), inclusive.",
+    ),
+    end_time: datetime | None = Query(
+        default=None,
+        description="End of the time range (UTC), inclusive. Defaults to the current server time.",
+    ),
+    export_format: Literal["ndjson", "csv"] = Query(
+        default="ndjson",
+        alias="format",
+        description="Output format.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Device-facing telemetry export endpoint.
+
+    The cursor is opened before the response starts, so a failing query
+    still maps to a 500. The session is request-scoped and stays open
+    until the body has been sent.
+    """
+    start_time, end_time = normalize_time_window(
+        start_time=start_time,
+        end_time=end_time,
+        latest_seconds=DEFAULT_LATEST_SECONDS,
+    )
+
     stmt = (
-        select(TelemetryEvent)
+        select(*EXPORT_COLUMNS)
         .where(
             TelemetryEvent.device_uuid == device.device_uuid,
             TelemetryEvent.system_time_utc >= start_time,
             TelemetryEvent.system_time_utc <= end_time,
         )
-        .order_by(TelemetryEvent.system_time_utc.desc())
-        .limit(limit)
+        .order_by(TelemetryEvent.system_time_utc, TelemetryEvent.id)
+        .execution_options(yield_per=EXPORT_CHUNK_ROWS)
     )
 
     try:
-        result = await db.execute(stmt)
-        rows = result.scalars().all()
+        result = await db.stream(stmt)
     except SQLAlchemyError as exc:
         logger.exception(
-            "Database error while listing telemetry",
+            "Database error while exporting telemetry",
             extra={"device_uuid": str(device.device_uuid)},
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve telemetry.",
+            detail="Failed to export telemetry.",
         ) from exc
 
-    # Convert ORM rows -> DTOs
-    items: list[TelemetryItem] = [
-        TelemetryItem.model_validate(row) for row in rows
-    ]
+    formatter = format_csv if export_format == "csv" else format_ndjson
 
-    logger.debug(
-        "Telemetry listing succeeded",
-        extra={
-            "device_uuid": str(device.device_uuid),
-            "returned_count": len(items),
-        },
-    )
+    async def body() -> AsyncIterator[str]:
+        exported = 0
+        try:
+            if export_format == "csv":
+                yield ",".join(column.name for column in EXPORT_COLUMNS) + "\r\n"
+            async for rows in result.partitions():
+                exported += len(rows)
+                yield formatter(rows)
+        except SQLAlchemyError:
+            logger.exception(
+                "Database error while exporting telemetry, response truncated",
+                extra={"device_uuid": str(device.device_uuid), "exported_count": exported},
+            )
+        finally:
+            await result.close()
 
-    # Store in Redis cache
-    try:
-        await redis_client.set(
-            cache_key,
-            json.dumps([item.model_dump(mode="json") for item in items]),
-            ex=TELEMETRY_CACHE_TTL_SECONDS,
-        )
         logger.debug(
-            "Telemetry cached",
-            extra={
-                "device_uuid": str(device.device_uuid),
-                "cache_key": cache_key,
-                "ttl": TELEMETRY_CACHE_TTL_SECONDS,
-            },
-        )
-    except Exception:
-        logger.warning(
-            "Failed to write telemetry to Redis cache",
-            extra={"device_uuid": str(
-                device.device_uuid), "cache_key": cache_key},
+            "Telemetry export finished",
+            extra={"device_uuid": str(device.device_uuid), "exported_count": exported},
         )
 
-    return items
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"telemetry-{device.device_uuid}.{export_format}"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 # ============================================================
@@ -476,8 +931,15 @@ async def list_telemetry_for_device(
     ),
     response_model=TelemetryItem,
     status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": TelemetryItem,
+            "description": "Queued in the Redis stream (INGEST_MODE=stream).",
+        },
+    },
 )
 async def create_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     payload: TelemetryCreate = Body(
         description="Telemetry payload containing coordinates and optional device timestamp.",
@@ -490,69 +952,218 @@ async def create_telemetry_for_device(
     The device is authenticated via `get_authenticated_device`. The server
     sets `system_time_utc` to the current UTC time. If `device_time` is not
     provided in the payload, it is set to the same value as `system_time_utc`.
+
+    With INGEST_MODE=stream the event is appended to the Redis stream
+    instead and 202 Accepted is returned; the stream worker stores it.
     """
     now_utc = datetime.now(timezone.utc)
     device_time = payload.device_time or now_utc
+    # idempotency key (the stream worker stores a reclaimed entry once);
+    # also keeps identical readings distinct in the Redis series
+    event_id = uuid4()
+
+    if settings.ingest_mode == "stream":
+        item = TelemetryItem(
+            device_uuid=device.device_uuid,
+            x_coord=payload.x_coord,
+            y_coord=payload.y_coord,
+            device_time=device_time,
+            system_time_utc=now_utc,
+            event_id=event_id,
+        )
+        await enqueue_telemetry(device, [item])
+        response.status_code = status.HTTP_202_ACCEPTED
+    else:
+        params = {
+            "device_uuid": device.device_uuid,
+            "x_coord": payload.x_coord,
+            "y_coord": payload.y_coord,
+            "device_time": device_time,
+            "system_time_utc": now_utc,
+            "event_id": event_id,
+        }
+
+        # commit db
+        try:
+            result = await db.execute(INSERT_TELEMETRY_STMT, params)
+            row = result.one()
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            logger.exception(
+                "Database error while storing telemetry",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store telemetry.",
+            ) from exc
 
-    telemetry = TelemetryEvent(
-        device_uuid=device.device_uuid,
-        x_coord=payload.x_coord,
-        y_coord=payload.y_coord,
-        device_time=device_time,
-        system_time_utc=now_utc,
-    )
+        logger.debug(
+            "Telemetry stored successfully",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "system_time_utc": row.system_time_utc.isoformat(),
+            },
+        )
 
-    db.add(telemetry)
+        # Row -> DTO
+        item = TelemetryItem.model_validate(row)
+
+    # Cache in Redis
+    latest_key = f"telemetry:latest:{device.device_uuid}"
 
-    # commit db
     try:
-        await db.commit()
-        await db.refresh(telemetry)
-    except SQLAlchemyError as exc:
-        await db.rollback()
-        logger.exception(
-            "Database error while storing telemetry",
+        pipe = redis_client.pipeline(transaction=False)
+        # Store latest telemetry
+        pipe.set(
+            latest_key,
+            item.model_dump_json(),
+            ex=TELEMETRY_CACHE_TTL_SECONDS,  # TTL
+        )
+        if settings.ingest_mode == "db":
+            # committed: recent events served by the listing endpoint, and
+            # invalidate cached listings (stream: the worker does both
+            # after its own commit)
+            await add_to_series(pipe, device.device_uuid, [item])
+            bump_generation(pipe, device.device_uuid)
+        await pipe.execute()
+    except Exception:
+        logger.warning(
+            "Failed to write telemetry to Redis cache",
             extra={"device_uuid": str(device.device_uuid)},
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to store telemetry.",
-        ) from exc
+        if settings.ingest_mode == "db":
+            await forget_series(device.device_uuid)
+            await forget_listings(device.device_uuid)
 
-    logger.debug(
-        "Telemetry stored successfully",
-        extra={
-            "device_uuid": str(device.device_uuid),
-            "system_time_utc": telemetry.system_time_utc.isoformat(),
+    return item
+
+
+# ============================================================
+# POST /telemetry/{device_uuid}/batch
+# ============================================================
+@router.post(
+    "/{device_uuid}/batch",
+    summary="Ingest a batch of telemetry for a device",
+    description=(
+        "Ingest multiple telemetry events for a specific device in a single request. "
+        "The device authenticates once using the `X-API-Key` header and all events "
+        "are stored in one multi-row INSERT within a single transaction. "
+        f"At most {MAX_BATCH_SIZE} events are accepted per request.\n\n"
+        "Every event in the batch is stamped with the same server-side "
+        "`system_time_utc`; events without `device_time` default to that value."
+    ),
+    response_model=TelemetryBatchItem,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": TelemetryBatchItem,
+            "description": "Queued in the Redis stream (INGEST_MODE=stream); `ids` is empty.",
         },
-    )
+    },
+)
+async def create_telemetry_batch_for_device(
+    response: Response,
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    payload: list[TelemetryCreate] = Body(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="List of telemetry payloads containing coordinates and optional device timestamps.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> TelemetryBatchItem:
+    """
+    Ingest a batch of telemetry events for the authenticated device.
+
+    Rows are written with a Core multi-row INSERT ... RETURNING id, so the
+    whole batch costs one authentication, one statement and one commit
+    instead of one of each per event. The Redis latest snapshot and recent
+    series are then refreshed in a single pipeline round-trip.
+
+    With INGEST_MODE=stream the events are appended to the Redis stream in
+    one round trip and 202 Accepted is returned without database ids.
+    """
+    now_utc = datetime.now(timezone.utc)
+
+    items = [
+        TelemetryItem(
+            device_uuid=device.device_uuid,
+            x_coord=p.x_coord,
+            y_coord=p.y_coord,
+            device_time=p.device_time or now_utc,
+            system_time_utc=now_utc,
+            event_id=uuid4(),
+        )
+        for p in payload
+    ]
+
+    if settings.ingest_mode == "stream":
+        await enqueue_telemetry(device, items)
+        response.status_code = status.HTTP_202_ACCEPTED
+        ids: list[int] = []
+    else:
+        stmt = insert(TelemetryEvent).returning(
+            TelemetryEvent.id,
+            sort_by_parameter_order=True,
+        )
+
+        # commit db
+        try:
+            result = await db.execute(stmt, [item.model_dump() for item in items])
+            ids = list(result.scalars().all())
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            logger.exception(
+                "Database error while storing telemetry batch",
+                extra={
+                    "device_uuid": str(device.device_uuid),
+                    "batch_size": len(items),
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store telemetry batch.",
+            ) from exc
 
-    # Convert ORM
-    item = TelemetryItem.model_validate(telemetry)
+        logger.debug(
+            "Telemetry batch stored successfully",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "inserted_count": len(ids),
+            },
+        )
 
     # Cache in Redis
     latest_key = f"telemetry:latest:{device.device_uuid}"
-    recent_list_key = f"telemetry:recent:{device.device_uuid}"
 
     try:
-        # Store latest telemetry
-        await redis_client.set(
+        pipe = redis_client.pipeline(transaction=False)
+        # Last item in the batch is the most recent reading
+        pipe.set(
             latest_key,
-            item.model_dump_json(),
-            ex=TELEMETRY_CACHE_TTL_SECONDS,  # TTL
+            items[-1].model_dump_json(),
+            ex=TELEMETRY_CACHE_TTL_SECONDS,
         )
-
-        # rolling list of recent events
-        await redis_client.lpush(recent_list_key, item.model_dump_json())
-        # keep most recent 100
-        await redis_client.ltrim(recent_list_key, 0, 99)
+        if settings.ingest_mode == "db":
+            await add_to_series(pipe, device.device_uuid, items)
+            bump_generation(pipe, device.device_uuid)
+        await pipe.execute()
     except Exception:
         logger.warning(
-            "Failed to write telemetry to Redis cache",
+            "Failed to write telemetry batch to Redis cache",
             extra={"device_uuid": str(device.device_uuid)},
         )
+        if settings.ingest_mode == "db":
+            await forget_series(device.device_uuid)
+            await forget_listings(device.device_uuid)
 
-    return item
+    return TelemetryBatchItem(
+        device_uuid=device.device_uuid,
+        inserted_count=len(items),
+        ids=ids,
+    )
 
 
 # ============================================================
@@ -1,12 +1,20 @@
 # schemas/__init__.py
 from .device_registry import DeviceRegistryItem
-from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem
+from .telemetry_event import (
+    TelemetryItem,
+    TelemetryPage,
+    TelemetryCreate,
+    TelemetryCountItem,
+    TelemetryBatchItem,
+)
 from .telemetry_latest import TelemetryLatestItem
 
 __all__ = [
     "DeviceRegistryItem",
     "TelemetryItem",
+    "TelemetryPage",
     "TelemetryCreate",
     "TelemetryCountItem",
+    "TelemetryBatchItem",
     "TelemetryLatestItem",
 ]
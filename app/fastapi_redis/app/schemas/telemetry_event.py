@@ -63,8 +63,55 @@ class TelemetryItem(ORMModel):
         ),
         examples=["2025-11-17T12:34:56Z"],
     )
+    event_id: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Idempotency key assigned at ingest and carried through the Redis "
+            "stream; a redelivered event with the same key is stored only once. "
+            "Null for events written without one."
+        ),
+    )
+
+
+class TelemetryPage(BaseModel):
+    """
+    One page of a device's telemetry listing, most recent first, as cached
+    in Redis. The endpoint returns `items` as the body and `next_cursor` in
+    the X-Next-Cursor / Link headers.
+    """
+
+    items: list[TelemetryItem] = Field(
+        description="Telemetry events of this page, ordered by system_time_utc descending.",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque cursor for the next (older) page; pass it back as `cursor` "
+            "with the same window parameters. Null on the last page."
+        ),
+    )
 
 
 class TelemetryCountItem(BaseModel):
     device_uuid: UUID
     total_events: int
+
+
+class TelemetryBatchItem(BaseModel):
+    """
+    Summary returned after a batch of telemetry events has been stored.
+    """
+
+    device_uuid: UUID = Field(
+        description="UUID of the device the batch was ingested for.",
+    )
+    inserted_count: int = Field(
+        description="Number of telemetry events stored (or queued, with 202) by this request.",
+        examples=[100],
+    )
+    ids: list[int] = Field(
+        description=(
+            "Database ids of the stored telemetry events, in request order. "
+            "Empty when the batch was queued in the Redis stream (202)."
+        ),
+    )
@@ -0,0 +1,6 @@
+from .producer import publish_telemetry, stream_key_for
+
+__all__ = [
+    "publish_telemetry",
+    "stream_key_for",
+]
@@ -0,0 +1,62 @@
+# stream/producer.py
+"""
+Redis Stream ingest (INGEST_MODE=stream).
+
+Telemetry is XADDed to one of STREAM__SHARDS streams chosen by a stable
+hash of the device UUID, so a device's events stay ordered within one
+shard while the write load spreads over several keys. The redis stream
+worker (redis/worker, `python -m app.stream`) reads them with a consumer
+group, stores them in Postgres and acknowledges after commit.
+
+The worker deletes entries once stored, so a shard only holds the backlog.
+XADD trims each shard to about STREAM__MAXLEN entries (approximate, so
+Redis trims whole nodes cheaply): if the worker stays down long enough to
+reach it, the oldest unstored entries are dropped rather than letting the
+backlog exhaust Redis memory.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import Sequence
+from uuid import UUID
+
+from ..config import get_settings
+from ..db import redis_client
+from ..schemas import TelemetryItem
+
+settings = get_settings()
+
+
+def stream_key_for(device_uuid: UUID) -> str:
+    """Shard stream of a device; crc32 keeps it stable across processes."""
+    shard = zlib.crc32(device_uuid.bytes) % settings.stream.shards
+    return f"{settings.stream.key}:{shard}"
+
+
+def _to_fields(item: TelemetryItem) -> dict:
+    return {
+        "event_id": str(item.event_id),
+        "device_uuid": str(item.device_uuid),
+        "x_coord": item.x_coord,
+        "y_coord": item.y_coord,
+        "device_time": item.device_time.isoformat(),
+        "system_time_utc": item.system_time_utc.isoformat(),
+    }
+
+
+async def publish_telemetry(items: Sequence[TelemetryItem]) -> None:
+    """
+    XADD telemetry items in one round trip.
+
+    Raises:
+        RedisError: the entries could not be appended.
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    for item in items:
+        pipe.xadd(
+            stream_key_for(item.device_uuid),
+            _to_fields(item),
+            maxlen=settings.stream.maxlen or None,
+            approximate=True,
+        )
+    await pipe.execute()
@@ -0,0 +1,158 @@
+# tests/test_ingest_series.py
+import logging
+from uuid import UUID
+
+import fakeredis.aioredis
+import httpx
+import pytest
+import pytest_asyncio
+from redis.exceptions import RedisError
+
+from app import main
+from app.cache import list_generation, telemetry_series
+from app.cache.list_generation import generation_key
+from app.cache.telemetry_series import series_keys
+from app.models import DeviceRegistry
+from app.routers import telemetry
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+BATCH = [{"x_coord": 1.0, "y_coord": 2.0}, {"x_coord": 3.0, "y_coord": 4.0}]
+
+
+class FakeSession:
+    """get_db stand-in for the INSERT ... RETURNING id of the batch endpoint."""
+
+    async def execute(self, stmt, rows):
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return list(range(1, len(rows) + 1))
+
+        return Result()
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(telemetry, "redis_client", fake)
+    monkeypatch.setattr(telemetry_series, "redis_client", fake)
+    monkeypatch.setattr(list_generation, "redis_client", fake)
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    main.app.dependency_overrides[telemetry.get_db] = lambda: FakeSession()
+    yield fake
+    main.app.dependency_overrides.clear()
+
+
+async def _post_batch():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=BATCH)
+
+
+@pytest.mark.asyncio
+async def test_committed_batch_is_added_to_series(fake, monkeypatch):
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "db")
+
+    resp = await _post_batch()
+
+    assert resp.status_code == 201
+    series_key, since_key = series_keys(UUID(DEVICE_UUID))
+    assert await fake.zcard(series_key) == 2
+    assert await fake.exists(since_key)
+
+
+def _fail_pipeline(fake, monkeypatch):
+    pipeline = fake.pipeline
+
+    def failing_pipeline(**kwargs):
+        """Queues everything, then fails like a Redis outage at EXECUTE."""
+        pipe = pipeline(**kwargs)
+
+        async def execute():
+            raise RedisError("connection reset")
+
+        pipe.execute = execute
+        return pipe
+
+    monkeypatch.setattr(fake, "pipeline", failing_pipeline)
+
+
+@pytest.mark.asyncio
+async def test_failed_series_add_drops_the_series(fake, monkeypatch):
+    """Coverage must not claim committed rows the set never received."""
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "db")
+    series_key, since_key = series_keys(UUID(DEVICE_UUID))
+    await fake.zadd(series_key, {"older": 1})
+    await fake.set(since_key, 1)
+    _fail_pipeline(fake, monkeypatch)
+
+    resp = await _post_batch()
+
+    assert resp.status_code == 201
+    assert await fake.exists(series_key, since_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_pipeline_still_bumps_the_generation(fake, monkeypatch):
+    """Cached listings must not keep serving a window without the new rows."""
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "db")
+    await fake.set(generation_key(UUID(DEVICE_UUID)), 4)
+    _fail_pipeline(fake, monkeypatch)
+
+    resp = await _post_batch()
+
+    assert resp.status_code == 201
+    assert await fake.get(generation_key(UUID(DEVICE_UUID))) == "5"
+
+
+@pytest.mark.asyncio
+async def test_lost_generation_bump_is_logged_as_error(fake, monkeypatch, caplog):
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "db")
+    _fail_pipeline(fake, monkeypatch)
+
+    async def incr(key):
+        raise RedisError("connection reset")
+
+    monkeypatch.setattr(fake, "incr", incr)
+
+    with caplog.at_level(logging.ERROR):
+        resp = await _post_batch()
+
+    # the rows are committed either way; only the cache is at risk
+    assert resp.status_code == 201
+    assert any(
+        record.levelno == logging.ERROR and "TELEMETRY_LIST_CACHE_TTL" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_list_cache_ttl_bounds_a_lost_bump_to_minutes():
+    assert telemetry.settings.telemetry_list_cache_ttl <= 600
+
+
+@pytest.mark.asyncio
+async def test_stream_mode_leaves_series_to_the_worker(fake, monkeypatch):
+    """Queued events are not stored yet and may be dead-lettered: not listed."""
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "stream")
+    published = []
+
+    async def publish(items):
+        published.extend(items)
+
+    monkeypatch.setattr(telemetry, "publish_telemetry", publish)
+
+    resp = await _post_batch()
+
+    assert resp.status_code == 202
+    assert len(published) == 2
+    assert await fake.exists(*series_keys(UUID(DEVICE_UUID))) == 0
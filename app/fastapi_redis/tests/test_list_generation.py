@@ -0,0 +1,37 @@
+# tests/test_list_generation.py
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from app.cache import list_generation
+from app.cache.list_generation import bump_generation, generation_key, get_generation
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(list_generation, "redis_client", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_unknown_device_starts_at_zero(fake):
+    assert await get_generation(uuid4()) == 0
+
+
+@pytest.mark.asyncio
+async def test_bump_moves_only_that_device(fake):
+    """A write makes every cached window of its device unreachable, and no other's."""
+    written, other = uuid4(), uuid4()
+
+    pipe = fake.pipeline(transaction=False)
+    bump_generation(pipe, written)
+    bump_generation(pipe, written)
+    await pipe.execute()
+
+    assert await get_generation(written) == 2
+    assert await get_generation(other) == 0
+    # no TTL: an expired counter restarting at 0 could revive old keys
+    assert await fake.ttl(generation_key(written)) == -1
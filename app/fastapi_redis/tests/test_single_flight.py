@@ -0,0 +1,98 @@
+# tests/test_single_flight.py
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from redis.exceptions import ConnectionError
+
+from app.cache import single_flight
+from app.cache.single_flight import LUA_RELEASE_LOCK, SingleFlight
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(single_flight, "redis_client", fake)
+    monkeypatch.setattr(single_flight, "_release_lock", fake.register_script(LUA_RELEASE_LOCK))
+    return fake
+
+
+class Loader:
+    def __init__(self, value="page", delay=0.05, error=None):
+        self.value, self.delay, self.error = value, delay, error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_in_one_worker_load_once(fake):
+    flight, loader = SingleFlight(lock_ms=1000), Loader()
+
+    results = await asyncio.gather(*(flight.load("k", loader, ttl=60) for _ in range(10)))
+
+    assert results == ["page"] * 10
+    assert loader.calls == 1
+    assert await fake.get("k") == "page"
+    assert await fake.get("k:lock") is None
+
+
+@pytest.mark.asyncio
+async def test_other_worker_waits_for_the_lock_holder(fake):
+    """A second worker (own SingleFlight) polls the key instead of querying too."""
+    first, second = SingleFlight(lock_ms=1000), SingleFlight(lock_ms=1000)
+    slow, other = Loader(delay=0.1), Loader(value="other")
+
+    results = await asyncio.gather(
+        first.load("k", slow, ttl=60),
+        second.load("k", other, ttl=60),
+    )
+
+    assert results == ["page", "page"]
+    assert (slow.calls, other.calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_holder_too_slow_lets_waiter_load(fake):
+    first, second = SingleFlight(lock_ms=100), SingleFlight(lock_ms=100)
+    stuck, other = Loader(delay=0.5), Loader(value="other")
+
+    results = await asyncio.gather(
+        first.load("k", stuck, ttl=60),
+        second.load("k", other, ttl=60),
+    )
+
+    assert results == ["page", "other"]
+    assert other.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_loader_error_reaches_every_coalesced_caller(fake):
+    flight, loader = SingleFlight(lock_ms=1000), Loader(error=RuntimeError("db down"))
+
+    results = await asyncio.gather(
+        *(flight.load("k", loader, ttl=60) for _ in range(3)), return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [RuntimeError] * 3
+    assert loader.calls == 1
+    # the lock is released, so the next miss retries at once
+    assert await fake.get("k:lock") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_down_loads_without_coordination(fake, monkeypatch):
+    async def broken_set(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(fake, "set", broken_set)
+    flight, loader = SingleFlight(lock_ms=1000), Loader()
+
+    assert await flight.load("k", loader, ttl=60) == "page"
+    assert loader.calls == 1
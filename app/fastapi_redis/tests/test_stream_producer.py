@@ -0,0 +1,61 @@
+# tests/test_stream_producer.py
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.schemas import TelemetryItem
+from app.stream import producer
+
+
+class RecordingPipeline:
+    def __init__(self):
+        self.calls = []
+
+    def xadd(self, name, fields, **kwargs):
+        self.calls.append((name, fields, kwargs))
+
+    async def execute(self):
+        return [None] * len(self.calls)
+
+
+class RecordingRedis:
+    def __init__(self):
+        self.pipe = RecordingPipeline()
+
+    def pipeline(self, transaction=True):
+        return self.pipe
+
+
+def _item():
+    now = datetime.now(timezone.utc)
+    return TelemetryItem(
+        device_uuid=uuid4(), x_coord=1.0, y_coord=2.0,
+        device_time=now, system_time_utc=now, event_id=uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_xadd_caps_each_shard_approximately(monkeypatch):
+    fake = RecordingRedis()
+    monkeypatch.setattr(producer, "redis_client", fake)
+    monkeypatch.setattr(producer.settings.stream, "maxlen", 500)
+    item = _item()
+
+    await producer.publish_telemetry([item])
+
+    [(key, fields, kwargs)] = fake.pipe.calls
+    assert key == producer.stream_key_for(item.device_uuid)
+    assert fields["event_id"] == str(item.event_id)
+    assert kwargs == {"maxlen": 500, "approximate": True}
+
+
+@pytest.mark.asyncio
+async def test_zero_maxlen_disables_trimming(monkeypatch):
+    fake = RecordingRedis()
+    monkeypatch.setattr(producer, "redis_client", fake)
+    monkeypatch.setattr(producer.settings.stream, "maxlen", 0)
+
+    await producer.publish_telemetry([_item()])
+
+    assert fake.pipe.calls[0][2]["maxlen"] is None
@@ -0,0 +1,130 @@
+# tests/test_telemetry_batch.py
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import fakeredis.aioredis
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import OperationalError
+
+from app import main
+from app.cache import list_generation, telemetry_series
+from app.models import DeviceRegistry
+from app.routers import telemetry
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+
+
+class FakeSession:
+    """get_db stand-in recording the rows of the multi-row INSERT ... RETURNING id."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.rows = None
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, stmt, rows):
+        if self.error is not None:
+            raise self.error
+        self.rows = rows
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return [100 + n for n in range(len(rows))]
+
+        return Result()
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(telemetry, "redis_client", fake)
+    monkeypatch.setattr(telemetry_series, "redis_client", fake)
+    monkeypatch.setattr(list_generation, "redis_client", fake)
+    monkeypatch.setattr(telemetry.settings, "ingest_mode", "db")
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: DeviceRegistry(device_uuid=UUID(DEVICE_UUID), api_key_hash="")
+    )
+    yield fake
+    main.app.dependency_overrides.clear()
+
+
+async def _post_batch(session, payload):
+    main.app.dependency_overrides[telemetry.get_db] = lambda: session
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(f"/api/telemetry/{DEVICE_UUID}/batch", json=payload)
+
+
+@pytest.mark.asyncio
+async def test_batch_inserts_every_row_and_refreshes_latest(fake):
+    session = FakeSession()
+    payload = [
+        {"x_coord": 1.0, "y_coord": 2.0, "device_time": "2025-11-17T12:00:00Z"},
+        {"x_coord": 3.0, "y_coord": 4.0},
+    ]
+
+    resp = await _post_batch(session, payload)
+
+    assert resp.status_code == 201
+    assert resp.json() == {"device_uuid": DEVICE_UUID, "inserted_count": 2, "ids": [100, 101]}
+    assert session.committed
+    first, second = session.rows
+    assert (first["x_coord"], first["y_coord"]) == (1.0, 2.0)
+    assert first["device_time"] == datetime(2025, 11, 17, 12, tzinfo=timezone.utc)
+    # one server timestamp for the whole batch; a missing device_time defaults to it
+    assert first["system_time_utc"] == second["system_time_utc"] == second["device_time"]
+    # every event gets its own idempotency key
+    assert first["event_id"] != second["event_id"]
+
+    latest = json.loads(await fake.get(f"telemetry:latest:{DEVICE_UUID}"))
+    assert latest["x_coord"] == 3.0
+    assert await fake.get(list_generation.generation_key(UUID(DEVICE_UUID))) == "1"
+
+
+@pytest.mark.asyncio
+async def test_batch_accepts_max_batch_size(fake):
+    session = FakeSession()
+    payload = [{"x_coord": float(n), "y_coord": 0.0} for n in range(telemetry.MAX_BATCH_SIZE)]
+
+    resp = await _post_batch(session, payload)
+
+    assert resp.status_code == 201
+    assert resp.json()["inserted_count"] == telemetry.MAX_BATCH_SIZE
+    assert len(session.rows) == telemetry.MAX_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, telemetry.MAX_BATCH_SIZE + 1])
+async def test_batch_size_out_of_bounds_is_rejected(fake, size):
+    session = FakeSession()
+
+    resp = await _post_batch(session, [{"x_coord": 1.0, "y_coord": 2.0}] * size)
+
+    assert resp.status_code == 422
+    assert session.rows is None
+
+
+@pytest.mark.asyncio
+async def test_batch_db_error_rolls_back_and_returns_500(fake):
+    session = FakeSession(error=OperationalError("INSERT", {}, Exception("connection lost")))
+
+    resp = await _post_batch(session, [{"x_coord": 1.0, "y_coord": 2.0}])
+
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Failed to store telemetry batch."}
+    assert session.rolled_back and not session.committed
+    # nothing committed: no latest snapshot, no listing invalidation
+    assert await fake.get(f"telemetry:latest:{DEVICE_UUID}") is None
@@ -0,0 +1,35 @@
+# tests/test_telemetry_cursor.py
+from fastapi import Response
+from starlette.requests import Request
+
+from app.routers.telemetry import set_next_cursor
+
+DEVICE_UUID = "e003031d-e441-4ece-ba5b-7d54d5b1da21"
+
+
+def _request(query: str) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "scheme": "http", "server": ("api", 80),
+        "path": f"/api/telemetry/{DEVICE_UUID}", "query_string": query.encode(), "headers": [],
+    })
+
+
+def test_next_page_goes_in_headers():
+    """The body stays an array; the cursor and next-page link ride in headers."""
+    response = Response()
+
+    set_next_cursor(_request("limit=2&cursor=old"), response, "abc")
+
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.headers["Link"] == (
+        f'</api/telemetry/{DEVICE_UUID}?limit=2&cursor=abc>; rel="next"'
+    )
+
+
+def test_last_page_sets_no_headers():
+    response = Response()
+
+    set_next_cursor(_request("limit=2"), response, None)
+
+    assert "X-Next-Cursor" not in response.headers
+    assert "Link" not in response.headers
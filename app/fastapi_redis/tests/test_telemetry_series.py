@@ -0,0 +1,93 @@
+# tests/test_telemetry_series.py
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from app.cache import telemetry_series
+from app.cache.telemetry_series import add_to_series, read_series, series_keys
+from app.schemas import TelemetryItem
+
+T0 = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(minutes=10)
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(telemetry_series, "redis_client", fake)
+    return fake
+
+
+def _item(device_uuid, seconds):
+    ts = T0 + timedelta(seconds=seconds)
+    return TelemetryItem(
+        device_uuid=device_uuid, x_coord=float(seconds), y_coord=0.0,
+        device_time=ts, system_time_utc=ts, event_id=uuid4(),
+    )
+
+
+async def _add(fake, device_uuid, *seconds):
+    pipe = fake.pipeline(transaction=False)
+    await add_to_series(pipe, device_uuid, [_item(device_uuid, s) for s in seconds])
+    await pipe.execute()
+
+
+def _at(seconds):
+    return T0 + timedelta(seconds=seconds)
+
+
+@pytest.mark.asyncio
+async def test_covered_window_is_served_newest_first(fake):
+    device_uuid = uuid4()
+    await _add(fake, device_uuid, 1, 2, 3)
+    await _add(fake, device_uuid, 4)
+
+    items = await read_series(device_uuid, _at(1), _at(10), limit=10)
+
+    assert [i.x_coord for i in items] == [4.0, 3.0, 2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_window_older_than_coverage_falls_back(fake):
+    """Coverage starts at the first event written: nothing older is claimed."""
+    device_uuid = uuid4()
+    await _add(fake, device_uuid, 5, 6)
+
+    # short page reaching before coverage: Postgres may hold more
+    assert await read_series(device_uuid, _at(0), _at(10), limit=10) is None
+    # a full page within coverage is still exact
+    items = await read_series(device_uuid, _at(0), _at(10), limit=1)
+    assert [i.x_coord for i in items] == [6.0]
+
+
+@pytest.mark.asyncio
+async def test_trim_by_count_moves_coverage(fake, monkeypatch):
+    monkeypatch.setattr(telemetry_series.settings, "telemetry_series_max_events", 3)
+    device_uuid = uuid4()
+    await _add(fake, device_uuid, 1, 2, 3, 4, 5)
+
+    series_key, since_key = series_keys(device_uuid)
+    assert await fake.zcard(series_key) == 3
+    assert int(await fake.get(since_key)) == telemetry_series.to_score(_at(2)) + 1
+
+    assert await read_series(device_uuid, _at(3), _at(10), limit=10) is not None
+    assert await read_series(device_uuid, _at(1), _at(10), limit=10) is None
+
+
+@pytest.mark.asyncio
+async def test_events_past_horizon_are_dropped(fake, monkeypatch):
+    monkeypatch.setattr(telemetry_series.settings, "telemetry_series_seconds", 60)
+    device_uuid = uuid4()
+    # T0 is ten minutes ago: only the last event is within the last minute
+    await _add(fake, device_uuid, 0, 590)
+
+    series_key, _ = series_keys(device_uuid)
+    assert await fake.zcard(series_key) == 1
+    assert await read_series(device_uuid, _at(0), _at(600), limit=10) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_series_falls_back(fake):
+    assert await read_series(uuid4(), _at(0), _at(10), limit=10) is None
@@ -0,0 +1,68 @@
+# tests/test_telemetry_window.py
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.routers.telemetry import align_open_window, clip_page
+from app.schemas import TelemetryItem, TelemetryPage
+
+NOW = datetime(2025, 11, 17, 12, 0, 7, 250000, tzinfo=timezone.utc)
+
+
+def _item(ts):
+    return TelemetryItem(
+        device_uuid=uuid4(), x_coord=0.0, y_coord=0.0, device_time=ts, system_time_utc=ts,
+    )
+
+
+def test_open_window_is_widened_not_truncated():
+    """The end moves up to the bucket boundary, so rows up to now are included."""
+    start = NOW - timedelta(seconds=60)
+
+    aligned = align_open_window(start, NOW, 10, widen_start=True)
+
+    assert aligned == (
+        datetime(2025, 11, 17, 11, 59, 0, tzinfo=timezone.utc),
+        datetime(2025, 11, 17, 12, 0, 10, tzinfo=timezone.utc),
+    )
+    # every request within the bucket reads the same window
+    later = NOW + timedelta(seconds=2)
+    assert align_open_window(later - timedelta(seconds=60), later, 10, widen_start=True) == aligned
+
+
+def test_explicit_start_is_kept():
+    start = NOW - timedelta(seconds=30)
+
+    assert align_open_window(start, NOW, 10, widen_start=False) == (
+        start, datetime(2025, 11, 17, 12, 0, 10, tzinfo=timezone.utc),
+    )
+
+
+def test_boundary_and_disabled_bucket_are_unchanged():
+    on_boundary = datetime(2025, 11, 17, 12, 0, 10, tzinfo=timezone.utc)
+    start = on_boundary - timedelta(seconds=60)
+
+    assert align_open_window(start, on_boundary, 10, widen_start=True) == (start, on_boundary)
+    assert align_open_window(start, NOW, 0, widen_start=True) == (start, NOW)
+
+
+def test_clip_page_trims_to_requested_window():
+    start, end = NOW - timedelta(seconds=5), NOW
+    newer, inside, older = (
+        _item(NOW + timedelta(seconds=1)), _item(NOW - timedelta(seconds=1)),
+        _item(NOW - timedelta(seconds=6)),
+    )
+
+    page = clip_page(TelemetryPage(items=[newer, inside, older], next_cursor="c"), start, end)
+
+    assert page.items == [inside]
+    # the aligned window continued below the requested start: no next page
+    assert page.next_cursor is None
+
+
+def test_clip_page_keeps_cursor_when_page_ends_inside_window():
+    start, end = NOW - timedelta(seconds=5), NOW
+    items = [_item(NOW + timedelta(seconds=1)), _item(NOW - timedelta(seconds=1))]
+
+    page = clip_page(TelemetryPage(items=items, next_cursor="c"), start, end)
+
+    assert (page.items, page.next_cursor) == (items[1:], "c")
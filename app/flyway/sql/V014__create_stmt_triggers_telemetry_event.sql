@@ -0,0 +1,120 @@
+-- V014__create_stmt_triggers_telemetry_event.sql
+------------------------------------------------------------
+-- Replace the per-row telemetry_event triggers with statement-level
+-- triggers that read the inserted rows from a transition table.
+--   A 1,000-row batch insert now fires 2 trigger calls instead of 2,000.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Drop per-row triggers (V012, V013)
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_upsert_latest ON app.telemetry_event;
+DROP TRIGGER IF EXISTS trg_telemetry_latest_outbox ON app.telemetry_event;
+
+DROP FUNCTION IF EXISTS app.fn_upsert_telemetry_latest();
+DROP FUNCTION IF EXISTS app.fn_outbox_telemetry_latest();
+
+-- ==========================================
+-- Function: fn_upsert_telemetry_latest_stmt
+--   Per insert statement, upsert the newest row per device
+--   into the latest snapshot.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_upsert_telemetry_latest_stmt()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO app.telemetry_latest (
+        device_uuid,
+        alias,
+        x_coord,
+        y_coord,
+        device_time,
+        system_time_utc
+    )
+    SELECT DISTINCT ON (n.device_uuid)
+        n.device_uuid,
+        dr.alias,
+        n.x_coord,
+        n.y_coord,
+        n.device_time,
+        n.system_time_utc
+    FROM new_rows AS n
+    JOIN app.device_registry AS dr
+      ON dr.device_uuid = n.device_uuid
+    -- ON CONFLICT cannot touch the same row twice: keep one row per device
+    ORDER BY n.device_uuid, n.system_time_utc DESC, n.id DESC
+    ON CONFLICT (device_uuid) DO UPDATE
+    SET
+        alias       = EXCLUDED.alias,
+        x_coord     = EXCLUDED.x_coord,
+        y_coord     = EXCLUDED.y_coord,
+        device_time = EXCLUDED.device_time,
+        system_time_utc = EXCLUDED.system_time_utc
+    WHERE app.telemetry_latest.system_time_utc < EXCLUDED.system_time_utc;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ==========================================
+-- Function: fn_outbox_telemetry_latest_stmt
+--   Per insert statement, bulk-insert one outbox row per new event.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_outbox_telemetry_latest_stmt()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO app.telemetry_latest_outbox (
+        telemetry_event_id,
+        device_uuid,
+        event_type,
+        version,
+        system_time_utc,
+        payload
+    )
+    SELECT
+        n.id,
+        n.device_uuid,
+        'TELEMETRY_EVENT_INSERTED',
+        n.id,
+        n.system_time_utc,
+        jsonb_build_object(
+            'id', n.id,
+            'device_uuid', n.device_uuid,
+            'x_coord', n.x_coord,
+            'y_coord', n.y_coord,
+            'device_time', n.device_time,
+            'system_time_utc', n.system_time_utc
+        )
+    FROM new_rows AS n
+    ON CONFLICT (telemetry_event_id) DO NOTHING;
+
+    RETURN NULL;
+END;
+$$;
+
+------------------------------------------------------------
+-- Trigger: update telemetry_latest once per insert statement
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_upsert_latest_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_upsert_latest_stmt
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_upsert_telemetry_latest_stmt();
+
+------------------------------------------------------------
+-- Trigger: write outbox rows once per insert statement
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_latest_outbox_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_latest_outbox_stmt
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_outbox_telemetry_latest_stmt();
+
+RESET ROLE;
@@ -0,0 +1,119 @@
+-- V015__partition_tb_telemetry_event.sql
+------------------------------------------------------------
+-- Convert app.telemetry_event into a table range-partitioned
+-- by system_time_utc.
+--   Time-window queries prune to the matching partitions and
+--   retention becomes DETACH + DROP instead of large DELETEs.
+--   Future partitions are pre-created (and expired ones dropped)
+--   by the partition maintenance job (app/pgdb/partman).
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Move the existing heap table aside
+------------------------------------------------------------
+ALTER TABLE app.telemetry_event RENAME TO telemetry_event_legacy;
+ALTER TABLE app.telemetry_event_legacy
+    RENAME CONSTRAINT telemetry_event_pkey TO telemetry_event_legacy_pkey;
+ALTER INDEX app.idx_telemetry_event_device_system_time_utc
+    RENAME TO idx_telemetry_event_legacy_device_system_time_utc;
+
+------------------------------------------------------------
+-- Table: app.telemetry_event (partitioned)
+--   The partition key must be part of the primary key.
+------------------------------------------------------------
+CREATE TABLE app.telemetry_event (
+    id                BIGINT           GENERATED BY DEFAULT AS IDENTITY,
+    device_uuid       UUID             NOT NULL,
+    x_coord           DOUBLE PRECISION NOT NULL,
+    y_coord           DOUBLE PRECISION NOT NULL,
+    device_time       TIMESTAMPTZ      NOT NULL,
+    system_time_utc   TIMESTAMPTZ      NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, system_time_utc)
+) PARTITION BY RANGE (system_time_utc);
+
+------------------------------------------------------------
+-- Index: last location / time-ordered queries by device
+--   Created on the parent, cascades to every partition.
+------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS idx_telemetry_event_device_system_time_utc
+    ON app.telemetry_event (device_uuid, system_time_utc DESC);
+
+------------------------------------------------------------
+-- Partitions
+--   default: catches rows outside any pre-created range
+--   daily: yesterday .. today + 7 days (UTC), named telemetry_event_pYYYYMMDD
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app.telemetry_event_default
+    PARTITION OF app.telemetry_event DEFAULT;
+
+DO
+$do$
+DECLARE
+    d DATE;
+BEGIN
+    FOR d IN
+        SELECT generate_series(
+            (NOW() AT TIME ZONE 'UTC')::date - 1,
+            (NOW() AT TIME ZONE 'UTC')::date + 7,
+            INTERVAL '1 day'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS app.%I PARTITION OF app.telemetry_event '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'telemetry_event_p' || to_char(d, 'YYYYMMDD'),
+            d::timestamp AT TIME ZONE 'UTC',
+            (d + 1)::timestamp AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END
+$do$;
+
+------------------------------------------------------------
+-- Copy existing rows and continue the id sequence
+------------------------------------------------------------
+INSERT INTO app.telemetry_event (
+    id,
+    device_uuid,
+    x_coord,
+    y_coord,
+    device_time,
+    system_time_utc
+)
+SELECT
+    id,
+    device_uuid,
+    x_coord,
+    y_coord,
+    device_time,
+    system_time_utc
+FROM app.telemetry_event_legacy;
+
+SELECT setval(
+    pg_get_serial_sequence('app.telemetry_event', 'id'),
+    COALESCE((SELECT MAX(id) FROM app.telemetry_event), 0) + 1,
+    false
+);
+
+DROP TABLE app.telemetry_event_legacy;
+
+------------------------------------------------------------
+-- Trigger: statement-level triggers (V014) on the new parent
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_upsert_latest_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_upsert_latest_stmt
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_upsert_telemetry_latest_stmt();
+
+DROP TRIGGER IF EXISTS trg_telemetry_latest_outbox_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_latest_outbox_stmt
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_outbox_telemetry_latest_stmt();
+
+RESET ROLE;
@@ -0,0 +1,83 @@
+-- V016__create_tb_telemetry_event_count.sql
+------------------------------------------------------------
+-- Maintain the total telemetry_event row count incrementally.
+--   Statement-level triggers add/subtract the transition table
+--   size into a sharded counter table, so reading the total is a
+--   SUM over a handful of rows instead of COUNT(*) over the table.
+--   Shards are picked by backend pid to keep concurrent writers
+--   off a single hot row.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Table: app.telemetry_event_count
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app.telemetry_event_count (
+    shard       SMALLINT    PRIMARY KEY,
+    row_count   BIGINT      NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- One row per shard; shard 0 starts with the current exact count
+INSERT INTO app.telemetry_event_count (shard, row_count)
+SELECT s, 0
+FROM generate_series(0, 15) AS s
+ON CONFLICT (shard) DO NOTHING;
+
+UPDATE app.telemetry_event_count
+SET row_count = (SELECT COUNT(*) FROM app.telemetry_event)
+WHERE shard = 0;
+
+-- ==========================================
+-- Function: fn_count_telemetry_event_insert_stmt
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_insert_stmt()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE app.telemetry_event_count
+    SET row_count  = row_count + (SELECT COUNT(*) FROM new_rows),
+        updated_at = NOW()
+    WHERE shard = pg_backend_pid() % 16;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ==========================================
+-- Function: fn_count_telemetry_event_delete_stmt
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_delete_stmt()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE app.telemetry_event_count
+    SET row_count  = row_count - (SELECT COUNT(*) FROM old_rows),
+        updated_at = NOW()
+    WHERE shard = pg_backend_pid() % 16;
+
+    RETURN NULL;
+END;
+$$;
+
+------------------------------------------------------------
+-- Trigger: count inserted / deleted rows once per statement
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_count_insert_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_count_insert_stmt
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_count_telemetry_event_insert_stmt();
+
+DROP TRIGGER IF EXISTS trg_telemetry_event_count_delete_stmt ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_count_delete_stmt
+AFTER DELETE ON app.telemetry_event
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_count_telemetry_event_delete_stmt();
+
+RESET ROLE;
@@ -0,0 +1,26 @@
+-- V017__add_telemetry_event_event_id.sql
+------------------------------------------------------------
+-- Idempotency key for telemetry_event.
+--   event_id is assigned once by the ingest API and carried in the
+--   Kafka message, so a batch redelivered after a consumer crash
+--   (DB committed, offsets not) is skipped by
+--   INSERT ... ON CONFLICT DO NOTHING instead of stored twice.
+--   Statement-level triggers only see rows actually inserted, so the
+--   latest / outbox / count triggers do not fire for duplicates.
+--
+--   The unique index must contain the partition key, hence
+--   (event_id, system_time_utc); a redelivered message carries the
+--   same system_time_utc. Rows written without an event_id (direct
+--   API writes, seeds) stay NULL and are never deduplicated.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+ALTER TABLE app.telemetry_event
+    ADD COLUMN IF NOT EXISTS event_id UUID;
+
+-- Created on the parent, cascades to every partition
+CREATE UNIQUE INDEX IF NOT EXISTS uq_telemetry_event_event_id
+    ON app.telemetry_event (event_id, system_time_utc);
+
+RESET ROLE;
@@ -0,0 +1,124 @@
+# batching.py
+"""
+Adaptive batch size and flush wait for the consumer modes.
+
+AIMD on the batch size, driven by end-to-end freshness (time from the
+first buffered row to the commit of its batch) against FRESHNESS_SLO_SEC:
+
+    full batch within the SLO   -> batch_size += BATCH_SIZE_MIN  (peak: grow)
+    full batch missed the SLO   -> batch_size //= 2              (back off)
+    flush failed                -> batch_size //= 2
+
+The max wait before a partial batch is flushed follows the observed flush
+latency: a few flush durations, so writers are not kept busy by tiny
+batches, but never more than the SLO leaves after the flush itself. Off-
+peak, when flushes are fast, partial batches go out after tens of ms
+instead of a fixed 1 s.
+
+With ADAPTIVE_BATCHING=false the controller holds BATCH_SIZE and
+FLUSH_INTERVAL_MAX_SEC fixed.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from .config import get_settings
+from .metrics import BATCH_TARGET_ROWS, FLUSH_MAX_WAIT_SECONDS
+
+# max wait as a multiple of the (smoothed) flush duration
+WAIT_PER_FLUSH = 4.0
+# smoothing of the flush duration
+EWMA_ALPHA = 0.2
+# gauge labels of a batcher shared by every assigned partition
+ALL_PARTITIONS = ("all", "all")
+
+
+class AdaptiveBatcher:
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        min_size: int,
+        max_size: int,
+        min_wait: float,
+        max_wait: float,
+        slo: float,
+        adaptive: bool = True,
+        labels: Tuple[str, str] = ALL_PARTITIONS,
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.min_wait = min_wait
+        self.max_wait_bound = max(max_wait, min_wait)
+        self.slo = slo
+        self.adaptive = adaptive
+        # (topic, partition) of the gauges this batcher publishes to
+        self.labels = labels
+
+        self.batch_size = batch_size
+        if adaptive:
+            self.batch_size = min(max(batch_size, self.min_size), self.max_size)
+        self.max_wait = self.max_wait_bound
+        self._flush_ewma: Optional[float] = None
+        self._publish()
+
+    @classmethod
+    def from_settings(cls, labels: Tuple[str, str] = ALL_PARTITIONS) -> AdaptiveBatcher:
+        settings = get_settings()
+        return cls(
+            batch_size=settings.batch_size,
+            min_size=settings.batch_size_min,
+            max_size=settings.batch_size_max,
+            min_wait=settings.flush_interval_min_sec,
+            max_wait=settings.flush_interval_max_sec,
+            slo=settings.freshness_slo_sec,
+            adaptive=settings.adaptive_batching,
+            labels=labels,
+        )
+
+    def _publish(self) -> None:
+        BATCH_TARGET_ROWS.labels(*self.labels).set(self.batch_size)
+        FLUSH_MAX_WAIT_SECONDS.labels(*self.labels).set(self.max_wait)
+
+    def close(self) -> None:
+        """Drop this batcher's gauges, e.g. once its partition is revoked."""
+        for gauge in (BATCH_TARGET_ROWS, FLUSH_MAX_WAIT_SECONDS):
+            try:
+                gauge.remove(*self.labels)
+            except KeyError:
+                pass
+
+    def on_flush(self, *, rows: int, age: float, duration: float) -> None:
+        """
+        Record a successful flush.
+
+        rows:     rows in the batch
+        age:      seconds from its first buffered row until it was stored
+        duration: seconds spent writing it
+        """
+        if not self.adaptive:
+            return
+
+        if self._flush_ewma is None:
+            self._flush_ewma = duration
+        else:
+            self._flush_ewma += EWMA_ALPHA * (duration - self._flush_ewma)
+
+        # A partial batch was flushed by the wait timer: its staleness is
+        # fixed by the max wait below, not by a smaller batch size
+        full = rows >= self.batch_size
+        if full and age > self.slo:
+            self.batch_size = max(self.min_size, self.batch_size // 2)
+        elif full:
+            self.batch_size = min(self.max_size, self.batch_size + self.min_size)
+
+        ceiling = max(self.min_wait, min(self.max_wait_bound, self.slo - self._flush_ewma))
+        self.max_wait = min(max(self._flush_ewma * WAIT_PER_FLUSH, self.min_wait), ceiling)
+        self._publish()
+
+    def on_failure(self) -> None:
+        """Record a failed flush attempt."""
+        if not self.adaptive:
+            return
+        self.batch_size = max(self.min_size, self.batch_size // 2)
+        self._publish()
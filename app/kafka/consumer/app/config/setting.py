@@ -29,6 +29,9 @@ class KafkaSettings(BaseModel):
     topic: str = Field(default="telemetry")
     topics: List[str] = Field(default_factory=list)
 
+    # poison messages / rows rejected by the DB; empty disables the DLQ
+    dead_letter_topic: str = Field(default="telemetry.dlq")
+
     # msk auth
     use_msk_auth: bool = False # turn on for aws msk
 
@@ -112,6 +115,106 @@ class Settings(BaseSettings):
         description="The number of data rows for a batch job.",
     )
 
+    adaptive_batching: bool = Field(
+        default=False,
+        alias="ADAPTIVE_BATCHING",
+        description="Tune batch size and flush wait from flush latency (AIMD).",
+    )
+
+    batch_size_min: int = Field(
+        default=250,
+        ge=1,
+        alias="BATCH_SIZE_MIN",
+        description="Adaptive batching: smallest batch size, also the additive step.",
+    )
+
+    batch_size_max: int = Field(
+        default=20000,
+        ge=1,
+        alias="BATCH_SIZE_MAX",
+        description="Adaptive batching: largest batch size.",
+    )
+
+    flush_interval_min_sec: float = Field(
+        default=0.05,
+        gt=0,
+        alias="FLUSH_INTERVAL_MIN_SEC",
+        description="Adaptive batching: shortest wait before a partial batch is flushed.",
+    )
+
+    flush_interval_max_sec: float = Field(
+        default=1.0,
+        gt=0,
+        alias="FLUSH_INTERVAL_MAX_SEC",
+        description="Longest wait before a partial batch is flushed (fixed value when not adaptive).",
+    )
+
+    freshness_slo_sec: float = Field(
+        default=1.0,
+        gt=0,
+        alias="FRESHNESS_SLO_SEC",
+        description="Adaptive batching: target time from a message being read to being stored.",
+    )
+
+    writer: Literal["insert", "copy"] = Field(
+        default="insert",
+        alias="WRITER",
+        description="DB write path for a batch: binary COPY or multi-row INSERT.",
+    )
+
+    consumer_mode: Literal["sequential", "pipeline", "partition"] = Field(
+        default="sequential",
+        alias="CONSUMER_MODE",
+        description=(
+            "sequential: fetch/decode/flush in one loop; pipeline: staged tasks; "
+            "partition: one buffer and writer per assigned partition."
+        ),
+    )
+
+    writer_concurrency: int = Field(
+        default=4,
+        ge=1,
+        alias="WRITER_CONCURRENCY",
+        description="Pipeline mode: concurrent DB writer tasks (each holds one connection).",
+    )
+
+    pipeline_queue_size: int = Field(
+        default=8,
+        ge=1,
+        alias="PIPELINE_QUEUE_SIZE",
+        description=(
+            "Pipeline mode: max fetched chunks / pending batches between stages. "
+            "Partition mode: fetched chunks queued per partition before it is paused."
+        ),
+    )
+
+    latest_projection: bool = Field(
+        default=False,
+        alias="LATEST_PROJECTION",
+        description="Push the newest row per device to Redis after each flush.",
+    )
+
+    alias_cache_size: int = Field(
+        default=100_000,
+        ge=0,
+        alias="ALIAS_CACHE_SIZE",
+        description="Latest projection: device aliases kept in memory (LRU); 0 disables the cache.",
+    )
+
+    alias_cache_ttl: float = Field(
+        default=300.0,
+        ge=0,
+        alias="ALIAS_CACHE_TTL",
+        description="Latest projection: seconds before a cached alias is read again, so renames show up.",
+    )
+
+    metrics_port: int = Field(
+        default=9100,
+        ge=0,
+        alias="METRICS_PORT",
+        description="Port of the Prometheus /metrics listener; 0 disables it.",
+    )
+
     # Pydantic Settings config
     model_config = SettingsConfigDict(
         # project root .env
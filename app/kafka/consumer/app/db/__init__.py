@@ -1,8 +1,11 @@
 from .postgres import get_db, async_session_maker
 from .redis import redis_client
+from .writer import get_writer, to_db_row
 
 __all__ = [
     "get_db",
     "redis_client",
     "async_session_maker",
+    "get_writer",
+    "to_db_row",
 ]
@@ -0,0 +1,119 @@
+# db/writer.py
+from __future__ import annotations
+
+from typing import Awaitable, Callable, List, Literal
+
+import asyncpg
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import TelemetryEvent
+from ..schemas import TelemetryItem
+
+WriterName = Literal["insert", "copy"]
+
+# Column order of the COPY records built from row dicts
+TELEMETRY_COLUMNS = (
+    "event_id",
+    "device_uuid",
+    "x_coord",
+    "y_coord",
+    "device_time",
+    "system_time_utc",
+)
+
+# Conflict target of the idempotency index (V017)
+DEDUP_INDEX_ELEMENTS = ("event_id", "system_time_utc")
+
+# Per-connection COPY target; emptied by every flush and at commit
+STAGE_TABLE = "telemetry_event_stage"
+
+_CREATE_STAGE_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} (
+    event_id        UUID,
+    device_uuid     UUID             NOT NULL,
+    x_coord         DOUBLE PRECISION NOT NULL,
+    y_coord         DOUBLE PRECISION NOT NULL,
+    device_time     TIMESTAMPTZ      NOT NULL,
+    system_time_utc TIMESTAMPTZ      NOT NULL
+) ON COMMIT DELETE ROWS
+"""
+
+_COLUMN_LIST = ", ".join(TELEMETRY_COLUMNS)
+
+# Move staged rows in one statement; duplicates are skipped, and the
+# statement-level triggers only see the rows actually inserted
+_MOVE_STAGE_SQL = f"""
+WITH staged AS (
+    DELETE FROM {STAGE_TABLE} RETURNING {_COLUMN_LIST}
+)
+INSERT INTO app.telemetry_event ({_COLUMN_LIST})
+SELECT {_COLUMN_LIST} FROM staged
+ON CONFLICT ({", ".join(DEDUP_INDEX_ELEMENTS)}) DO NOTHING
+"""
+
+
+def to_db_row(item: TelemetryItem) -> dict:
+    """Map TelemetryItem -> TelemetryEvent row dict."""
+    return {
+        "event_id": item.event_id,
+        "device_uuid": item.device_uuid,
+        "x_coord": item.x_coord,
+        "y_coord": item.y_coord,
+        "device_time": item.device_time,
+        "system_time_utc": item.system_time_utc,
+    }
+
+
+async def write_rows_insert(db: AsyncSession, rows: List[dict]) -> None:
+    """Multi-row INSERT ... VALUES ... ON CONFLICT DO NOTHING through SQLAlchemy."""
+    stmt = insert(TelemetryEvent).values(rows).on_conflict_do_nothing(
+        index_elements=list(DEDUP_INDEX_ELEMENTS),
+    )
+    await db.execute(stmt)
+
+
+async def write_rows_copy(db: AsyncSession, rows: List[dict]) -> None:
+    """
+    Binary COPY through the session's asyncpg connection.
+
+    Skips SQL compilation and bind parameters entirely. COPY has no
+    ON CONFLICT, so rows are copied into a per-connection temp table and
+    moved into app.telemetry_event by one INSERT ... SELECT ... ON CONFLICT
+    DO NOTHING, which fires the statement-level triggers like INSERT does.
+
+    COPY driver errors are re-raised as SQLAlchemy DBAPIError so callers
+    keep a single SQLAlchemyError handler for both writers.
+    """
+    conn = await db.connection()
+    # Through SQLAlchemy first: this opens the session transaction, which
+    # the driver-level COPY then joins (it would autocommit otherwise)
+    await conn.exec_driver_sql(_CREATE_STAGE_SQL)
+
+    raw = await conn.get_raw_connection()
+    if not raw.driver_connection.is_in_transaction():
+        # an autocommitted COPY would survive the caller's rollback and be
+        # replayed (duplicated) by the seek-back retry
+        raise DBAPIError(f"COPY {STAGE_TABLE}", None, RuntimeError("no open transaction"))
+
+    records = [tuple(row[c] for c in TELEMETRY_COLUMNS) for row in rows]
+
+    try:
+        await raw.driver_connection.copy_records_to_table(
+            STAGE_TABLE, columns=TELEMETRY_COLUMNS, records=records,
+        )
+    except (asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+        raise DBAPIError(f"COPY {STAGE_TABLE}", None, exc) from exc
+
+    await conn.exec_driver_sql(_MOVE_STAGE_SQL)
+
+
+WRITERS: dict[str, Callable[[AsyncSession, List[dict]], Awaitable[None]]] = {
+    "insert": write_rows_insert,
+    "copy": write_rows_copy,
+}
+
+
+def get_writer(name: WriterName) -> Callable[[AsyncSession, List[dict]], Awaitable[None]]:
+    return WRITERS[name]
@@ -0,0 +1,186 @@
+# latest.py
+"""
+Latest-position projection written by the consumer.
+
+After a batch is committed, the newest row per device is pushed to
+telemetry:latest:{device_uuid}, the key GET /telemetry/latest reads, so the
+snapshot trails the DB by one flush instead of one outbox poll.
+
+Writes use the same version-guarded Lua script as the redis outbox worker
+(version = system_time_utc in ms): concurrent consumers, the worker and
+redelivered batches can never move a snapshot backwards.
+
+Best effort: rows and offsets are already committed, so a Redis failure is
+logged and counted, not retried; the outbox worker still drains
+app.telemetry_latest_outbox and repairs the snapshot on its next pass.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from .config import get_settings
+from .db import async_session_maker, redis_client
+from .metrics import LATEST_ERRORS, LATEST_UPDATES
+from .models import DeviceRegistry
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+TELEMETRY_LATEST = "telemetry:latest"
+LUA_SET_IF_NEWER = """
+local data_key = KEYS[1]
+local ver_key  = KEYS[2]
+local incoming = tonumber(ARGV[1])
+local current  = tonumber(redis.call('GET', ver_key) or '0')
+
+if incoming > current then
+  redis.call('SET', data_key, ARGV[2])
+  redis.call('SET', ver_key, ARGV[1])
+  return 1
+end
+return 0
+"""
+
+# EVALSHA, reloaded by the pipeline on NOSCRIPT (e.g. after a Redis restart)
+_set_if_newer = redis_client.register_script(LUA_SET_IF_NEWER)
+
+
+class AliasCache:
+    """
+    LRU of device_uuid -> alias with a TTL, so the projection does not read
+    device_registry per flush yet picks up a rename within `ttl` seconds.
+    Unknown devices are cached as None like any other alias.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, Tuple[float, Optional[str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def missing(self, device_uuids: Iterable[UUID]) -> List[UUID]:
+        """Devices with no live entry; expired entries are dropped."""
+        now = time.monotonic()
+        missing = []
+        for device_uuid in device_uuids:
+            entry = self._entries.get(device_uuid)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(device_uuid)
+                continue
+            self._entries.pop(device_uuid, None)
+            missing.append(device_uuid)
+        return missing
+
+    def get(self, device_uuid: UUID) -> Optional[str]:
+        entry = self._entries.get(device_uuid)
+        return entry[1] if entry is not None else None
+
+    def set(self, device_uuid: UUID, alias: Optional[str]) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[device_uuid] = (time.monotonic() + self.ttl, alias)
+        self._entries.move_to_end(device_uuid)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# the payload carries the alias like the worker's
+_aliases = AliasCache(maxsize=settings.alias_cache_size, ttl=settings.alias_cache_ttl)
+
+
+def _redis_keys(device_uuid: str) -> tuple[str, str]:
+    data_key = f"{TELEMETRY_LATEST}:{device_uuid}"
+    ver_key = f"{data_key}:ver"
+    return data_key, ver_key
+
+
+def newest_per_device(rows: Iterable[dict]) -> Dict[UUID, dict]:
+    """Reduce a batch to the row with the newest system_time_utc per device."""
+    newest: Dict[UUID, dict] = {}
+    for row in rows:
+        current = newest.get(row["device_uuid"])
+        if current is None or row["system_time_utc"] > current["system_time_utc"]:
+            newest[row["device_uuid"]] = row
+    return newest
+
+
+async def _load_aliases(device_uuids: Iterable[UUID]) -> Dict[UUID, Optional[str]]:
+    """Aliases of `device_uuids`, reading the ones not cached from Postgres."""
+    device_uuids = list(device_uuids)
+    missing = _aliases.missing(device_uuids)
+    aliases = {u: _aliases.get(u) for u in device_uuids}
+    if not missing:
+        return aliases
+
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(DeviceRegistry.device_uuid, DeviceRegistry.alias)
+            .where(DeviceRegistry.device_uuid.in_(missing))
+        )
+        found = dict(result.tuples().all())
+
+    for device_uuid in missing:
+        aliases[device_uuid] = found.get(device_uuid)
+        _aliases.set(device_uuid, aliases[device_uuid])
+    return aliases
+
+
+def _row_to_payload(row: dict, alias: Optional[str]) -> dict:
+    return {
+        "device_uuid": str(row["device_uuid"]),
+        "alias": alias,
+        "x_coord": row["x_coord"],
+        "y_coord": row["y_coord"],
+        "device_time": row["device_time"].isoformat(),
+        "system_time_utc": row["system_time_utc"].isoformat(),
+    }
+
+
+async def project_latest(rows: List[dict]) -> int:
+    """
+    Push the newest committed row per device to Redis.
+
+    Returns:
+        Number of devices whose snapshot moved forward (Lua returned 1).
+    """
+    if not settings.latest_projection or not rows:
+        return 0
+
+    newest = newest_per_device(rows)
+
+    try:
+        aliases = await _load_aliases(newest.keys())
+
+        pipe = redis_client.pipeline(transaction=False)
+        for device_uuid, row in newest.items():
+            data_key, ver_key = _redis_keys(str(device_uuid))
+            version = int(row["system_time_utc"].timestamp() * 1000)
+            payload_json = json.dumps(
+                _row_to_payload(row, aliases[device_uuid]), separators=(",", ":"), default=str)
+            await _set_if_newer(keys=[data_key, ver_key],
+                                args=[version, payload_json], client=pipe)
+
+        results = await pipe.execute()
+    except (RedisError, SQLAlchemyError):
+        LATEST_ERRORS.inc()
+        logger.warning(
+            "Failed to project latest telemetry for %d devices", len(newest),
+            exc_info=True,
+        )
+        return 0
+
+    updated = sum(1 for x in results if int(x) == 1)
+    LATEST_UPDATES.inc(updated)
+    logger.debug("Latest projection: updated=%d devices=%d", updated, len(newest))
+    return updated
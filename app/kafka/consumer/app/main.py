@@ -5,78 +5,156 @@ import logging
 import signal
 from typing import Dict, List
 
+from aiokafka.errors import KafkaError
 from aiokafka.structs import TopicPartition
-from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from .mq.kafka_consumer import init_consumer, close_consumer, get_consumer
-from .db import async_session_maker
-from .models import TelemetryEvent
-from .schemas import TelemetryItem
+from .mq import (
+    init_consumer,
+    close_consumer,
+    get_consumer,
+    decode_batch,
+    DeadLetter,
+    init_dead_letter_producer,
+    close_dead_letter_producer,
+    send_dead_letters,
+)
+from .batching import AdaptiveBatcher
+from .metrics import FLUSH_RETRIES, run_lag_monitor, start_metrics_server
+from .partitioned import PartitionRouter, run_partitioned
+from .pipeline import OffsetTracker, run_pipeline
+from .sink import retry_delay, write_batch
 from .config import get_settings
 
 
 BATCH_SIZE = 1000
-FLUSH_INTERVAL_SEC = 1.0
-RETRY_BACKOFF_SEC = 1.0
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
-def to_db_row(item: TelemetryItem) -> dict:
-    """Map TelemetryItem -> TelemetryEvent row dict."""
-    return {
-        "device_uuid": item.device_uuid,
-        "x_coord": item.x_coord,
-        "y_coord": item.y_coord,
-        "device_time": item.device_time,
-        "system_time_utc": item.system_time_utc,
-    }
-
-
 async def flush_batch(
     *,
     consumer,
     rows: List[dict],
+    dead: List[DeadLetter],
     first_offsets: Dict[TopicPartition, int],
     last_offsets: Dict[TopicPartition, int],
-) -> None:
+) -> bool:
     """
-    1) Insert rows into DB (single transaction)
-    2) Commit Kafka offsets only after DB commit
-    If DB fails, seek back to first_offsets to retry the same batch.
+    1) Insert rows into DB (single transaction; rows the DB rejects are
+       bisected out to the dead-letter topic)
+    2) Dead-letter poison messages only after the DB commit, so a failed
+       write that is retried does not publish them again
+    3) Commit Kafka offsets
+    If the DB or DLQ fails, seek back to first_offsets to retry the same batch.
     """
-    if not rows:
-        return
+    if not first_offsets:
+        return True
 
-    async with async_session_maker() as db:
-        try:
-            await db.execute(insert(TelemetryEvent).values(rows))
-            await db.commit()
-
-            # Commit offsets explicitly (next offset = last_offset + 1)
-            commit_map = {tp: last_off + 1 for tp,
-                          last_off in last_offsets.items()}
-            await consumer.commit(commit_map)
-
-            logger.info(
-                "Flushed %d rows, committed offsets: %s",
-                len(rows),
-                {f"{tp.topic}:{tp.partition}": off for tp,
-                    off in commit_map.items()},
-            )
-
-        except SQLAlchemyError:
-            await db.rollback()
-            logger.exception(
-                "DB flush failed; offsets not committed. Seeking back to retry batch.")
-
-            # Retry by rewinding consumer position to the start of the batch per partition
-            for tp, off in first_offsets.items():
-                consumer.seek(tp, off)
+    try:
+        await write_batch(rows)
+        await send_dead_letters(dead)
+
+        # Commit offsets explicitly (next offset = last_offset + 1)
+        commit_map = {tp: last_off + 1 for tp,
+                      last_off in last_offsets.items()}
+        await consumer.commit(commit_map)
+
+        logger.info(
+            "Flushed %d rows, committed offsets: %s",
+            len(rows),
+            {f"{tp.topic}:{tp.partition}": off for tp,
+                off in commit_map.items()},
+        )
+        return True
+
+    except (SQLAlchemyError, KafkaError):
+        FLUSH_RETRIES.inc()
+        logger.exception(
+            "Batch flush failed; offsets not committed. Seeking back to retry batch.")
+
+        # Retry by rewinding consumer position to the start of the batch per partition
+        for tp, off in first_offsets.items():
+            consumer.seek(tp, off)
+        return False
+
+
+async def run_sequential(consumer, stop_event: asyncio.Event) -> None:
+    """Fetch, validate and flush in one loop; a flush blocks fetching."""
+    loop = asyncio.get_running_loop()
 
-            await asyncio.sleep(RETRY_BACKOFF_SEC)
+    rows: List[dict] = []
+    dead: List[DeadLetter] = []
+    first_offsets: Dict[TopicPartition, int] = {}
+    last_offsets: Dict[TopicPartition, int] = {}
+    failures = 0
+    batcher = AdaptiveBatcher.from_settings()
+    started_at = 0.0    # when the first message of the current batch arrived
+
+    def reset() -> None:
+        rows.clear()
+        dead.clear()
+        first_offsets.clear()
+        last_offsets.clear()
+
+    while not stop_event.is_set():
+        # don't sit in getmany past the flush deadline of a pending batch
+        timeout_ms = 200
+        if first_offsets:
+            remaining = started_at + batcher.max_wait - loop.time()
+            timeout_ms = min(timeout_ms, max(int(remaining * 1000), 0))
+
+        # getmany returns: {TopicPartition: [ConsumerRecord, ...], ...}
+        records_map = await consumer.getmany(timeout_ms=timeout_ms, max_records=200)
+
+        if records_map and not first_offsets:
+            started_at = loop.time()
+
+        if records_map:
+            for tp, records in records_map.items():
+                rejected = []
+                for msg, row in zip(records, decode_batch(records, rejected)):
+                    # bad messages are dead-lettered and committed past with the batch
+                    if row is not None:
+                        rows.append(row)
+
+                    first_offsets.setdefault(tp, msg.offset)
+                    last_offsets[tp] = msg.offset
+
+                dead.extend(DeadLetter.from_record(msg, err) for msg, err in rejected)
+
+        now = loop.time()
+        should_flush = (len(rows) >= batcher.batch_size) or (
+            first_offsets and now >= started_at + batcher.max_wait)
+
+        if should_flush:
+            row_count = len(rows)
+            ok = await flush_batch(
+                consumer=consumer,
+                rows=rows,
+                dead=dead,
+                first_offsets=first_offsets,
+                last_offsets=last_offsets,
+            )
+            reset()
+
+            if ok:
+                done = loop.time()
+                batcher.on_flush(rows=row_count, age=done - started_at, duration=done - now)
+                failures = 0
+            else:
+                batcher.on_failure()
+                failures += 1
+                await asyncio.sleep(retry_delay(failures))
+    # Final flush on shutdown
+    await flush_batch(
+        consumer=consumer,
+        rows=rows,
+        dead=dead,
+        first_offsets=first_offsets,
+        last_offsets=last_offsets,
+    )
 
 
 async def main() -> None:
@@ -93,70 +171,25 @@ async def main() -> None:
         except NotImplementedError:
             signal.signal(sig, lambda *_: request_shutdown())
 
-    await init_consumer()
+    router = PartitionRouter() if settings.consumer_mode == "partition" else None
+    tracker = OffsetTracker() if settings.consumer_mode == "pipeline" else None
+    start_metrics_server()
+    await init_dead_letter_producer()
+    await init_consumer(listener=router or tracker)
     consumer = get_consumer()
-
-    rows: List[dict] = []
-    first_offsets: Dict[TopicPartition, int] = {}
-    last_offsets: Dict[TopicPartition, int] = {}
-
-    next_flush_at = loop.time() + FLUSH_INTERVAL_SEC
+    lag_task = asyncio.create_task(run_lag_monitor(consumer, stop_event))
 
     try:
-        while not stop_event.is_set():
-            # getmany returns: {TopicPartition: [ConsumerRecord, ...], ...}
-            records_map = await consumer.getmany(timeout_ms=200, max_records=200)
-
-            if records_map:
-                for tp, records in records_map.items():
-                    for msg in records:
-                        payload = msg.value  # already dict via value_deserializer
-
-                        try:
-                            item = TelemetryItem.model_validate(payload)
-                        except Exception:
-                            logger.exception(
-                                "Invalid TelemetryItem payload; skipping",
-                                extra={
-                                    "topic": msg.topic, "partition": msg.partition, "offset": msg.offset},
-                            )
-                            # Commit past this bad message so you don't get stuck.
-                            # Note: commit expects next offset.
-                            await consumer.commit({TopicPartition(msg.topic, msg.partition): msg.offset + 1})
-                            continue
-
-                        rows.append(to_db_row(item))
-
-                        msg_tp = TopicPartition(msg.topic, msg.partition)
-                        first_offsets.setdefault(msg_tp, msg.offset)
-                        last_offsets[msg_tp] = msg.offset
-
-            now = loop.time()
-            should_flush = (len(rows) >= settings.batch_size) or (
-                rows and now >= next_flush_at)
-
-            if should_flush:
-                await flush_batch(
-                    consumer=consumer,
-                    rows=rows,
-                    first_offsets=first_offsets,
-                    last_offsets=last_offsets,
-                )
-                rows.clear()
-                first_offsets.clear()
-                last_offsets.clear()
-                next_flush_at = now + FLUSH_INTERVAL_SEC
-        # Final flush on shutdown
-        if rows:
-            await flush_batch(
-                consumer=consumer,
-                rows=rows,
-                first_offsets=first_offsets,
-                last_offsets=last_offsets,
-            )
-
+        if router is not None:
+            await run_partitioned(consumer, router, stop_event)
+        elif tracker is not None:
+            await run_pipeline(consumer, tracker, stop_event)
+        else:
+            await run_sequential(consumer, stop_event)
     finally:
+        lag_task.cancel()
         await close_consumer()
+        await close_dead_letter_producer()
 
 
 if __name__ == "__main__":
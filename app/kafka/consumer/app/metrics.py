@@ -0,0 +1,128 @@
+# metrics.py
+"""
+Prometheus metrics for the consumer, served on METRICS_PORT (/metrics).
+
+    telemetry_consumer_lag{topic,partition}           highwater - committed offset
+    telemetry_consumer_batch_rows                     histogram of rows per flush
+    telemetry_consumer_flush_seconds                  histogram of DB flush time
+    telemetry_consumer_rows_written_total             rows stored (rate() = rows/sec)
+    telemetry_consumer_flush_retries_total            transient batch failures retried
+    telemetry_consumer_dead_letters_total{stage}      messages sent to the DLQ
+    telemetry_consumer_batch_target_rows{topic,partition}       adaptive batch size in use
+    telemetry_consumer_flush_max_wait_seconds{topic,partition}  adaptive max wait in use
+    telemetry_consumer_latest_updates_total           Redis latest snapshots moved forward
+    telemetry_consumer_latest_errors_total            failed Redis latest projections
+
+Lag is refreshed by a background task rather than at scrape time, since
+reading committed offsets needs a broker round trip.
+
+The adaptive gauges are per batcher: one per partition in partitioned
+mode, a single topic="all",partition="all" series in the other modes.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Set, Tuple
+
+from aiokafka import AIOKafkaConsumer
+from aiokafka.errors import KafkaError
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+LAG_REFRESH_SEC = 5.0
+
+CONSUMER_LAG = Gauge(
+    "telemetry_consumer_lag",
+    "Messages between the partition highwater and the committed offset.",
+    ["topic", "partition"],
+)
+BATCH_ROWS = Histogram(
+    "telemetry_consumer_batch_rows",
+    "Rows per DB flush.",
+    buckets=(1, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+FLUSH_SECONDS = Histogram(
+    "telemetry_consumer_flush_seconds",
+    "Duration of a successful DB flush, including poison-row bisection.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+ROWS_WRITTEN = Counter(
+    "telemetry_consumer_rows_written_total",
+    "Rows stored in app.telemetry_event.",
+)
+FLUSH_RETRIES = Counter(
+    "telemetry_consumer_flush_retries_total",
+    "Batches that failed transiently and are retried.",
+)
+DEAD_LETTERS = Counter(
+    "telemetry_consumer_dead_letters_total",
+    "Messages sent to the dead-letter topic.",
+    ["stage"],
+)
+BATCH_TARGET_ROWS = Gauge(
+    "telemetry_consumer_batch_target_rows",
+    "Batch size the adaptive controller currently flushes at.",
+    ["topic", "partition"],
+)
+FLUSH_MAX_WAIT_SECONDS = Gauge(
+    "telemetry_consumer_flush_max_wait_seconds",
+    "Longest a partial batch currently waits before it is flushed.",
+    ["topic", "partition"],
+)
+LATEST_UPDATES = Counter(
+    "telemetry_consumer_latest_updates_total",
+    "Device snapshots in Redis moved forward by the latest projection.",
+)
+LATEST_ERRORS = Counter(
+    "telemetry_consumer_latest_errors_total",
+    "Flushes whose latest projection to Redis failed.",
+)
+
+
+def start_metrics_server() -> None:
+    """Serve /metrics from a daemon thread; METRICS_PORT=0 disables it."""
+    port = get_settings().metrics_port
+    if not port:
+        return
+    start_http_server(port)
+    logger.info("Metrics listening on :%d", port)
+
+
+async def _refresh_lag(consumer: AIOKafkaConsumer, seen: Set[Tuple[str, str]]) -> None:
+    current: Set[Tuple[str, str]] = set()
+
+    for tp in consumer.assignment():
+        highwater = consumer.highwater(tp)
+        if highwater is None:
+            # nothing fetched for this partition yet
+            continue
+
+        committed = await consumer.committed(tp)
+        labels = (tp.topic, str(tp.partition))
+        CONSUMER_LAG.labels(*labels).set(max(highwater - (committed or 0), 0))
+        current.add(labels)
+
+    # drop partitions moved to another consumer by a rebalance
+    for labels in seen - current:
+        CONSUMER_LAG.remove(*labels)
+    seen.clear()
+    seen.update(current)
+
+
+async def run_lag_monitor(consumer: AIOKafkaConsumer, stop_event: asyncio.Event) -> None:
+    seen: Set[Tuple[str, str]] = set()
+
+    while not stop_event.is_set():
+        try:
+            await _refresh_lag(consumer, seen)
+        except KafkaError:
+            logger.warning("Failed to refresh consumer lag", exc_info=True)
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=LAG_REFRESH_SEC)
+        except asyncio.TimeoutError:
+            pass
@@ -1,7 +1,21 @@
 from .kafka_consumer import init_consumer, close_consumer, get_consumer
+from .codec import decode_value
+from .decoder import decode_batch
+from .dead_letter import (
+    DeadLetter,
+    init_dead_letter_producer,
+    close_dead_letter_producer,
+    send_dead_letters,
+)
 
 __all__ = [
     "init_consumer",
     "close_consumer",
-    "get_consumer"
+    "get_consumer",
+    "decode_value",
+    "decode_batch",
+    "DeadLetter",
+    "init_dead_letter_producer",
+    "close_dead_letter_producer",
+    "send_dead_letters",
 ]
@@ -0,0 +1,162 @@
+# mq/dead_letter.py
+"""
+Dead-letter producer for telemetry the consumer cannot store.
+
+Poison messages (decode / validation failures) are forwarded with their
+original value; rows rejected by Postgres are re-encoded as JSON. Error
+metadata travels in headers, so the DLQ can be replayed onto the main
+topic unchanged once the cause is fixed:
+
+    dlq.stage       decode | write
+    dlq.error       error text (truncated)
+    dlq.source      topic:partition:offset of the original message, if known
+    dlq.failed_at   ISO-8601 UTC timestamp
+
+The topic is not auto-created (MSK has auto.create.topics.enable off):
+kafka/init creates it next to the main topic, and the producer refuses to
+start if it does not exist rather than failing every batch that has
+something to dead-letter.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import ssl
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from aiokafka import AIOKafkaProducer
+from aiokafka.structs import ConsumerRecord
+
+from ..config import get_settings
+from ..metrics import DEAD_LETTERS
+from .kafka_consumer import MSKTokenProvider
+
+logger = logging.getLogger(__name__)
+
+MAX_ERROR_LEN = 1000
+
+_producer: Optional[AIOKafkaProducer] = None
+_init_lock = asyncio.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetter:
+    stage: str
+    error: str
+    value: bytes
+    key: Optional[bytes] = None
+    source: Optional[ConsumerRecord] = None
+
+    @classmethod
+    def from_record(cls, msg: ConsumerRecord, error: str) -> DeadLetter:
+        return cls(stage="decode", error=error, value=msg.value, key=msg.key, source=msg)
+
+    @classmethod
+    def from_row(cls, row: dict, error: str) -> DeadLetter:
+        return cls(
+            stage="write",
+            error=error,
+            value=json.dumps(row, default=str).encode("utf-8"),
+            key=str(row["device_uuid"]).encode("utf-8"),
+        )
+
+    def headers(self) -> List[tuple]:
+        headers = [
+            ("dlq.stage", self.stage.encode()),
+            ("dlq.error", self.error[:MAX_ERROR_LEN].encode("utf-8", "replace")),
+            ("dlq.failed_at", datetime.now(timezone.utc).isoformat().encode()),
+        ]
+        if self.source is not None:
+            src = f"{self.source.topic}:{self.source.partition}:{self.source.offset}"
+            headers.append(("dlq.source", src.encode()))
+        return headers
+
+
+async def init_dead_letter_producer() -> Optional[AIOKafkaProducer]:
+    global _producer
+
+    settings = get_settings()
+    if not settings.kafka.dead_letter_topic or _producer is not None:
+        return _producer
+
+    async with _init_lock:
+        if _producer is not None:
+            return _producer
+
+        producer_config = {
+            "bootstrap_servers": settings.kafka_bootstrap_servers,
+            "client_id": f"{settings.kafka.client_id}-dlq",
+            "acks": "all",
+            "enable_idempotence": True,
+        }
+
+        if settings.kafka.use_msk_auth:
+            producer_config.update({
+                "security_protocol": "SASL_SSL",
+                "sasl_mechanism": "OAUTHBEARER",
+                "sasl_oauth_token_provider": MSKTokenProvider(settings.aws_region),
+                "ssl_context": ssl.create_default_context(),
+            })
+
+        producer = AIOKafkaProducer(**producer_config)
+        try:
+            await producer.start()
+            # raises UnknownTopicOrPartitionError if the topic is missing
+            await producer.partitions_for(settings.kafka.dead_letter_topic)
+        except Exception:
+            logger.exception(
+                "Dead-letter producer failed to start for topic %s",
+                settings.kafka.dead_letter_topic,
+            )
+            try:
+                await producer.stop()
+            except Exception:
+                pass
+            raise
+
+        _producer = producer
+        return _producer
+
+
+async def close_dead_letter_producer() -> None:
+    global _producer
+
+    if _producer is None:
+        return
+
+    async with _init_lock:
+        if _producer is None:
+            return
+        try:
+            await _producer.stop()
+        finally:
+            _producer = None
+
+
+async def send_dead_letters(letters: List[DeadLetter]) -> None:
+    """
+    Publish dead letters and wait for the broker acks.
+
+    Call before committing the offsets (or the DB transaction) that covers
+    them, so a failure here (KafkaError) leaves the batch to be retried.
+    Without a DLQ topic the letters are only logged.
+    """
+    if not letters:
+        return
+
+    topic = get_settings().kafka.dead_letter_topic
+    if _producer is None or not topic:
+        logger.warning("Dead-letter topic disabled; dropping %d rejected messages", len(letters))
+        return
+
+    futures = [
+        await _producer.send(topic, value=dl.value, key=dl.key, headers=dl.headers())
+        for dl in letters
+    ]
+    await asyncio.gather(*futures)
+    for dl in letters:
+        DEAD_LETTERS.labels(dl.stage).inc()
+    logger.warning("Sent %d messages to dead-letter topic %s", len(letters), topic)
@@ -0,0 +1,111 @@
+# mq/decoder.py
+"""
+Batch decoding of telemetry messages into telemetry_event row dicts.
+
+Replaces the per-message decode -> TelemetryItem -> to_db_row path:
+
+json:   the chunk's JSON values are joined into one array and validated by
+        a single TypeAdapter.validate_json call (parsing and validation in
+        pydantic-core) straight into TelemetryRow dicts.
+struct: the fixed binary layout is typed by construction, so the unpacked
+        fields are used as the row as-is.
+
+Invalid records are isolated: they come back as None at their position so
+callers still skip and commit past them.
+"""
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from aiokafka.structs import ConsumerRecord
+from pydantic import TypeAdapter, ValidationError
+
+from ..schemas import TelemetryRow
+from .codec import decode_value, is_json_value
+
+logger = logging.getLogger(__name__)
+
+_rows_adapter = TypeAdapter(List[TelemetryRow])
+_row_adapter = TypeAdapter(TelemetryRow)
+
+
+Rejected = List[Tuple[ConsumerRecord, str]]
+
+
+def _log_invalid(msg: ConsumerRecord, reason: str, rejected: Optional[Rejected]) -> None:
+    logger.error(
+        "Invalid TelemetryItem payload; skipping: %s",
+        reason,
+        extra={"topic": msg.topic, "partition": msg.partition, "offset": msg.offset},
+    )
+    if rejected is not None:
+        rejected.append((msg, reason))
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in exc.errors(include_url=False)
+    )
+
+
+def _validate_json(
+    records: Sequence[ConsumerRecord],
+    positions: List[int],
+    rows: List[Optional[dict]],
+    rejected: Optional[Rejected],
+) -> None:
+    """Validate JSON values as one array; fall back per record if that fails."""
+    joined = b"[" + b",".join(records[i].value for i in positions) + b"]"
+    try:
+        validated = _rows_adapter.validate_json(joined)
+    except ValidationError:
+        validated = None
+
+    # a value holding more than one object would shift every later row
+    if validated is None or len(validated) != len(positions):
+        validated = []
+        for i in positions:
+            try:
+                validated.append(_row_adapter.validate_json(records[i].value))
+            except ValidationError as exc:
+                _log_invalid(records[i], _describe(exc), rejected)
+                validated.append(None)
+
+    for i, row in zip(positions, validated):
+        if row is not None:
+            # older producers send no idempotency key
+            row.setdefault("event_id", None)
+            rows[i] = row
+
+
+def decode_batch(
+    records: Sequence[ConsumerRecord],
+    rejected: Optional[Rejected] = None,
+) -> List[Optional[dict]]:
+    """
+    Decode and validate a chunk of records.
+
+    Returns one row dict per record, in order; None marks a record that
+    failed to decode or validate (already logged, and appended to
+    `rejected` with its reason when a list is given).
+    """
+    rows: List[Optional[dict]] = [None] * len(records)
+    json_positions: List[int] = []
+
+    for i, msg in enumerate(records):
+        value = msg.value
+        if is_json_value(value):
+            json_positions.append(i)
+            continue
+
+        try:
+            rows[i] = decode_value(value)
+        except Exception as exc:
+            _log_invalid(msg, repr(exc), rejected)
+
+    if json_positions:
+        _validate_json(records, json_positions, rows, rejected)
+
+    return rows
@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import ssl
 from typing import Optional
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
 from aiokafka.abc import AbstractTokenProvider
 from aws_msk_iam_sasl_signer import MSKAuthTokenProvider
 
@@ -25,7 +24,9 @@ class MSKTokenProvider(AbstractTokenProvider):
         return token
 
 
-async def init_consumer() -> AIOKafkaConsumer:
+async def init_consumer(
+    listener: Optional[ConsumerRebalanceListener] = None,
+) -> AIOKafkaConsumer:
     global _consumer
 
     if _consumer is not None:
@@ -45,7 +46,6 @@ async def init_consumer() -> AIOKafkaConsumer:
             "group_id": settings.kafka.group_id,
             "auto_offset_reset": settings.kafka.auto_offset_reset,
             "enable_auto_commit": False,
-            "value_deserializer": lambda v: json.loads(v.decode("utf-8")),
             "request_timeout_ms": 40000,
             "session_timeout_ms": 30000,
             "heartbeat_interval_ms": 10000,
@@ -62,8 +62,12 @@ async def init_consumer() -> AIOKafkaConsumer:
                 "ssl_context": ssl.create_default_context(),
             })
 
-        # create consumer
-        consumer = AIOKafkaConsumer(*topics, **consumer_config)
+        # create consumer; a rebalance listener needs an explicit subscribe()
+        if listener is None:
+            consumer = AIOKafkaConsumer(*topics, **consumer_config)
+        else:
+            consumer = AIOKafkaConsumer(**consumer_config)
+            consumer.subscribe(topics=topics, listener=listener)
 
         try:
             await consumer.start()
@@ -0,0 +1,252 @@
+# partitioned.py
+"""
+Per-partition consumer mode:
+
+    fetch -> PartitionRouter -> one PartitionWriter per TopicPartition
+                                (queue -> buffer -> own DB session)
+
+Each assigned partition has its own buffer, writer task and session, so
+write concurrency follows the partition count and a failing batch only
+stalls (and retries) its own partition. Offsets are committed per
+partition as soon as that partition's rows are stored. A partition whose
+writer falls behind is paused at the consumer; the others keep flowing.
+
+PartitionRouter is the ConsumerRebalanceListener: revoked partitions get
+one last flush attempt and are abandoned uncommitted if it fails (the
+next owner re-reads them); newly assigned partitions get a fresh writer.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
+from aiokafka.errors import KafkaError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+from sqlalchemy.exc import SQLAlchemyError
+
+from .batching import AdaptiveBatcher
+from .config import get_settings
+from .metrics import FLUSH_RETRIES
+from .mq import DeadLetter, decode_batch, send_dead_letters
+from .sink import retry_delay, write_batch
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FETCH_TIMEOUT_MS = 200
+FETCH_MAX_RECORDS = 500
+
+
+class PartitionWriter:
+    """Buffers, writes and commits the records of a single partition."""
+
+    def __init__(self, router: PartitionRouter, tp: TopicPartition) -> None:
+        self.tp = tp
+        self.queue: asyncio.Queue[Optional[List[ConsumerRecord]]] = asyncio.Queue()
+        self.paused = False
+
+        self._router = router
+        self._closing = False
+        self._rows: List[dict] = []
+        self._dead: List[DeadLetter] = []
+        # last offset in the buffer, including messages skipped as invalid
+        self._last_offset: Optional[int] = None
+        # loop time when the first message of the buffer arrived
+        self._started_at = 0.0
+        # partitions see different rates, so each tunes its own batches
+        self._batcher = AdaptiveBatcher.from_settings(labels=(tp.topic, str(tp.partition)))
+        self._task = asyncio.create_task(
+            self._run(), name=f"writer-{tp.topic}-{tp.partition}",
+        )
+
+    @property
+    def _consumer(self) -> AIOKafkaConsumer:
+        return self._router.consumer
+
+    def submit(self, records: List[ConsumerRecord]) -> None:
+        if self._task.done():
+            # surface an unexpected writer crash instead of queueing forever
+            self._task.result()
+
+        self.queue.put_nowait(records)
+        if not self.paused and self.queue.qsize() >= settings.pipeline_queue_size:
+            self._consumer.pause(self.tp)
+            self.paused = True
+
+    def _maybe_resume(self) -> None:
+        if self._closing or not self.paused:
+            return
+        if self.queue.qsize() <= settings.pipeline_queue_size // 2:
+            self._consumer.resume(self.tp)
+            self.paused = False
+
+    async def _flush(self) -> bool:
+        """
+        Write the buffer (poison rows go to the dead-letter topic), then
+        commit its offsets.
+
+        Transient failures are retried in place while the partition is
+        owned; once closing, a failed write abandons the buffer and leaves
+        its offsets uncommitted.
+        """
+        if self._last_offset is None:
+            return True
+
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            started = loop.time()
+            try:
+                await send_dead_letters(self._dead)
+                self._dead.clear()
+                await write_batch(self._rows)
+                done = loop.time()
+                self._batcher.on_flush(
+                    rows=len(self._rows), age=done - self._started_at, duration=done - started,
+                )
+                break
+            except (SQLAlchemyError, KafkaError):
+                attempt += 1
+                self._batcher.on_failure()
+                FLUSH_RETRIES.inc()
+                logger.exception(
+                    "Batch write failed for %s:%d (attempt %d); %d rows",
+                    self.tp.topic, self.tp.partition, attempt, len(self._rows),
+                )
+
+            if self._closing:
+                logger.warning(
+                    "Abandoning %d buffered rows for %s:%d; offsets not committed",
+                    len(self._rows), self.tp.topic, self.tp.partition,
+                )
+                self._rows.clear()
+                self._dead.clear()
+                self._last_offset = None
+                return False
+            await asyncio.sleep(retry_delay(attempt))
+
+        row_count = len(self._rows)
+        commit_offset = self._last_offset + 1
+        self._rows.clear()
+        self._last_offset = None
+
+        try:
+            await self._consumer.commit({self.tp: commit_offset})
+        except KafkaError:
+            # rows are stored; a later commit (or the next owner) covers them
+            logger.exception(
+                "Offset commit failed for %s:%d", self.tp.topic, self.tp.partition,
+            )
+            return True
+
+        logger.info(
+            "Flushed %d rows, committed %s:%d -> %d",
+            row_count, self.tp.topic, self.tp.partition, commit_offset,
+        )
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # an empty buffer has no flush deadline
+            timeout = None
+            if self._last_offset is not None:
+                timeout = max(self._started_at + self._batcher.max_wait - loop.time(), 0.001)
+
+            try:
+                records = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                records = []
+
+            if records is None:
+                break
+
+            if records and self._last_offset is None:
+                self._started_at = loop.time()
+
+            rejected = []
+            for msg, row in zip(records, decode_batch(records, rejected)):
+                if row is not None:
+                    self._rows.append(row)
+                self._last_offset = msg.offset
+            self._dead.extend(DeadLetter.from_record(msg, err) for msg, err in rejected)
+            self._maybe_resume()
+
+            if self._last_offset is None:
+                continue
+
+            if (
+                len(self._rows) >= self._batcher.batch_size
+                or loop.time() >= self._started_at + self._batcher.max_wait
+            ):
+                if not await self._flush():
+                    # abandoned: never commit past the dropped rows
+                    return
+
+        await self._flush()
+
+    async def close(self) -> None:
+        """Write what is queued (one attempt) and stop the writer task."""
+        self._closing = True
+        self.queue.put_nowait(None)
+        try:
+            await self._task
+        except Exception:
+            logger.exception(
+                "Partition writer crashed for %s:%d", self.tp.topic, self.tp.partition,
+            )
+        finally:
+            self._batcher.close()
+
+
+class PartitionRouter(ConsumerRebalanceListener):
+    """Keeps one PartitionWriter per assigned partition across rebalances."""
+
+    def __init__(self) -> None:
+        # bound after init_consumer(); writers only use it once records flow
+        self.consumer: Optional[AIOKafkaConsumer] = None
+        self.writers: Dict[TopicPartition, PartitionWriter] = {}
+
+    async def on_partitions_revoked(self, revoked) -> None:
+        # still the owner here, so buffered rows can be flushed and committed
+        await self.close_partitions(revoked)
+
+    async def on_partitions_assigned(self, assigned) -> None:
+        for tp in assigned:
+            if tp not in self.writers:
+                self.writers[tp] = PartitionWriter(self, tp)
+        logger.info(
+            "Partition writers: %s",
+            sorted(f"{tp.topic}:{tp.partition}" for tp in self.writers),
+        )
+
+    async def close_partitions(self, tps: Iterable[TopicPartition]) -> None:
+        writers = [self.writers.pop(tp) for tp in list(tps) if tp in self.writers]
+        await asyncio.gather(*(w.close() for w in writers))
+
+    def dispatch(self, records_map: Dict[TopicPartition, List[ConsumerRecord]]) -> None:
+        for tp, records in records_map.items():
+            writer = self.writers.get(tp)
+            if writer is None:
+                # revoked between fetch and dispatch; the new owner reads it
+                continue
+            writer.submit(records)
+
+
+async def run_partitioned(
+    consumer: AIOKafkaConsumer,
+    router: PartitionRouter,
+    stop_event: asyncio.Event,
+) -> None:
+    router.consumer = consumer
+    try:
+        while not stop_event.is_set():
+            records_map = await consumer.getmany(
+                timeout_ms=FETCH_TIMEOUT_MS, max_records=FETCH_MAX_RECORDS,
+            )
+            router.dispatch(records_map)
+    finally:
+        await router.close_partitions(router.writers)
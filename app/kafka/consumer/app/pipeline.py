@@ -0,0 +1,272 @@
+# pipeline.py
+"""
+Staged consumer pipeline:
+
+    fetch -> raw queue -> decode/batch -> batch queue -> N writers
+
+Each stage runs as its own task connected by bounded queues, so Kafka
+fetches and decoding continue while writers wait on Postgres, and a slow
+database backs pressure up to the fetcher.
+
+Offsets are tracked per partition in dispatch order and committed only up
+to the highest offset below which every batch has been written, so
+parallel writers finishing out of order never commit past unwritten rows.
+
+OffsetTracker is also the ConsumerRebalanceListener: a revoked partition's
+pending ranges are dropped, so batches still in flight for it never commit
+on behalf of the next owner (or over the position re-read after it comes
+back); their rows are simply written again by whoever reads them next.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Set, Tuple
+
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
+from aiokafka.errors import KafkaError
+from aiokafka.structs import TopicPartition
+from sqlalchemy.exc import SQLAlchemyError
+
+from .batching import AdaptiveBatcher
+from .config import get_settings
+from .metrics import FLUSH_RETRIES
+from .mq import DeadLetter, decode_batch, send_dead_letters
+from .sink import retry_delay, write_batch
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FETCH_TIMEOUT_MS = 200
+FETCH_MAX_RECORDS = 500
+
+
+@dataclass
+class Batch:
+    rows: List[dict] = field(default_factory=list)
+    # poison messages to dead-letter before the offsets are committed
+    dead: List[DeadLetter] = field(default_factory=list)
+    # per partition: (first offset, last offset) covered by this batch,
+    # including messages skipped as invalid
+    offsets: Dict[TopicPartition, Tuple[int, int]] = field(default_factory=dict)
+    # per partition: this batch's [first, last, done] entry in the tracker
+    ranges: Dict[TopicPartition, list] = field(default_factory=dict)
+    # loop time when the first message of this batch was decoded
+    started_at: float = 0.0
+
+    def add_offset(self, tp: TopicPartition, offset: int) -> None:
+        first, _ = self.offsets.get(tp, (offset, offset))
+        self.offsets[tp] = (first, offset)
+
+
+class OffsetTracker(ConsumerRebalanceListener):
+    """Commits, per partition, only offsets contiguous with written batches."""
+
+    def __init__(self) -> None:
+        # per partition, ranges in dispatch order: [first, last, done]
+        self._pending: Dict[TopicPartition, Deque[list]] = {}
+        self._assigned: Set[TopicPartition] = set()
+        self._lock = asyncio.Lock()
+
+    async def on_partitions_revoked(self, revoked) -> None:
+        async with self._lock:
+            for tp in revoked:
+                self._assigned.discard(tp)
+                self._pending.pop(tp, None)
+
+    async def on_partitions_assigned(self, assigned) -> None:
+        self._assigned.update(assigned)
+
+    def register(self, batch: Batch) -> None:
+        for tp, (first, last) in batch.offsets.items():
+            if tp not in self._assigned:
+                # fetched before its revoke: the rows are still written,
+                # the offsets are the new owner's to commit
+                continue
+            r = [first, last, False]
+            self._pending.setdefault(tp, deque()).append(r)
+            batch.ranges[tp] = r
+
+    def _mark_done(self, batch: Batch) -> Dict[TopicPartition, int]:
+        commit_map: Dict[TopicPartition, int] = {}
+
+        for tp, r in batch.ranges.items():
+            # a range dropped by a revoke is no longer in _pending
+            r[2] = True
+            ranges = self._pending.get(tp)
+            if not ranges:
+                continue
+
+            # Advance over the contiguous written prefix
+            while ranges and ranges[0][2]:
+                commit_map[tp] = ranges.popleft()[1] + 1
+
+        return commit_map
+
+    async def complete(self, consumer: AIOKafkaConsumer, batch: Batch) -> None:
+        async with self._lock:
+            commit_map = self._mark_done(batch)
+            if not commit_map:
+                return
+
+            try:
+                await consumer.commit(commit_map)
+            except KafkaError:
+                # e.g. partition revoked by a rebalance: rows are stored,
+                # the new owner may redeliver them (at-least-once)
+                logger.exception("Offset commit failed")
+                return
+
+        logger.info(
+            "Committed offsets: %s",
+            {f"{tp.topic}:{tp.partition}": off for tp, off in commit_map.items()},
+        )
+
+
+async def fetch_stage(
+    consumer: AIOKafkaConsumer,
+    raw_q: asyncio.Queue,
+    stop_event: asyncio.Event,
+) -> None:
+    try:
+        while not stop_event.is_set():
+            records_map = await consumer.getmany(
+                timeout_ms=FETCH_TIMEOUT_MS, max_records=FETCH_MAX_RECORDS,
+            )
+            for records in records_map.values():
+                await raw_q.put(records)
+    finally:
+        await raw_q.put(None)
+
+
+async def decode_stage(
+    raw_q: asyncio.Queue,
+    batch_q: asyncio.Queue,
+    tracker: OffsetTracker,
+    writer_count: int,
+    batcher: AdaptiveBatcher,
+) -> None:
+    loop = asyncio.get_running_loop()
+    batch = Batch()
+
+    async def dispatch() -> None:
+        nonlocal batch
+        if batch.offsets:
+            tracker.register(batch)
+            await batch_q.put(batch)
+        batch = Batch()
+
+    while True:
+        # an empty batch has no flush deadline
+        timeout = None
+        if batch.offsets:
+            timeout = max(batch.started_at + batcher.max_wait - loop.time(), 0.001)
+
+        try:
+            records = await asyncio.wait_for(raw_q.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await dispatch()
+            continue
+
+        if records is None:
+            break
+
+        if not batch.offsets:
+            batch.started_at = loop.time()
+
+        rejected = []
+        for msg, row in zip(records, decode_batch(records, rejected)):
+            if row is not None:
+                batch.rows.append(row)
+            batch.add_offset(TopicPartition(msg.topic, msg.partition), msg.offset)
+        batch.dead.extend(DeadLetter.from_record(msg, err) for msg, err in rejected)
+
+        if (
+            len(batch.rows) >= batcher.batch_size
+            or loop.time() >= batch.started_at + batcher.max_wait
+        ):
+            await dispatch()
+
+    # Shutdown: hand over the partial batch, then stop every writer
+    await dispatch()
+    for _ in range(writer_count):
+        await batch_q.put(None)
+
+
+async def _write_with_retry(
+    batch: Batch,
+    stop_event: asyncio.Event,
+    batcher: AdaptiveBatcher,
+) -> bool:
+    """
+    Write a batch, retrying in place until it succeeds or shutdown starts.
+
+    Poison rows never get here as failures: write_batch bisects them out
+    to the dead-letter topic. What is retried are transient DB / DLQ errors.
+
+    Seeking back is not an option here: later batches may already be
+    written, and the tracker holds their commits until this one lands.
+    """
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    while True:
+        started = loop.time()
+        try:
+            await send_dead_letters(batch.dead)
+            batch.dead.clear()
+            await write_batch(batch.rows)
+            done = loop.time()
+            batcher.on_flush(
+                rows=len(batch.rows), age=done - batch.started_at, duration=done - started,
+            )
+            return True
+        except (SQLAlchemyError, KafkaError):
+            attempt += 1
+            batcher.on_failure()
+            FLUSH_RETRIES.inc()
+            logger.exception("Batch write failed (attempt %d); retrying %d rows",
+                             attempt, len(batch.rows))
+
+        if stop_event.is_set():
+            # Leave offsets uncommitted; rows are redelivered on restart
+            return False
+        await asyncio.sleep(retry_delay(attempt))
+
+
+async def write_stage(
+    consumer: AIOKafkaConsumer,
+    batch_q: asyncio.Queue,
+    tracker: OffsetTracker,
+    stop_event: asyncio.Event,
+    batcher: AdaptiveBatcher,
+) -> None:
+    while True:
+        batch = await batch_q.get()
+        if batch is None:
+            return
+
+        if await _write_with_retry(batch, stop_event, batcher):
+            await tracker.complete(consumer, batch)
+            logger.debug("Flushed %d rows", len(batch.rows))
+
+
+async def run_pipeline(
+    consumer: AIOKafkaConsumer,
+    tracker: OffsetTracker,
+    stop_event: asyncio.Event,
+) -> None:
+    writer_count = settings.writer_concurrency
+    raw_q: asyncio.Queue = asyncio.Queue(maxsize=settings.pipeline_queue_size)
+    batch_q: asyncio.Queue = asyncio.Queue(maxsize=settings.pipeline_queue_size)
+    batcher = AdaptiveBatcher.from_settings()
+
+    await asyncio.gather(
+        fetch_stage(consumer, raw_q, stop_event),
+        decode_stage(raw_q, batch_q, tracker, writer_count, batcher),
+        *(
+            write_stage(consumer, batch_q, tracker, stop_event, batcher)
+            for _ in range(writer_count)
+        ),
+    )
@@ -1,6 +1,6 @@
 # schemas/__init__.py
 from .device_registry import DeviceRegistryItem
-from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem
+from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem, TelemetryRow
 from .telemetry_latest import TelemetryLatestItem
 
 __all__ = [
@@ -8,5 +8,6 @@ __all__ = [
     "TelemetryItem",
     "TelemetryCreate",
     "TelemetryCountItem",
+    "TelemetryRow",
     "TelemetryLatestItem",
 ]
@@ -3,6 +3,8 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
+from typing_extensions import NotRequired, TypedDict
+
 from pydantic import BaseModel, Field
 from .base import ORMModel
 
@@ -63,6 +65,29 @@ class TelemetryItem(ORMModel):
         ),
         examples=["2025-11-17T12:34:56Z"],
     )
+    event_id: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Idempotency key assigned at ingest and carried through Kafka; "
+            "a redelivered event with the same key is stored only once. "
+            "Null for events written without one."
+        ),
+    )
+
+
+class TelemetryRow(TypedDict):
+    """
+    A telemetry_event row as validated in bulk by the consumer.
+    Same fields and types as TelemetryItem, but validates straight to a dict.
+    """
+
+    device_uuid: UUID
+    x_coord: float
+    y_coord: float
+    device_time: datetime
+    system_time_utc: datetime
+    # missing in messages from producers that predate the idempotency key
+    event_id: NotRequired[Optional[UUID]]
 
 
 class TelemetryCountItem(BaseModel):
@@ -0,0 +1,124 @@
+# sink.py
+"""
+Batch writes with poison-row isolation, shared by every consumer mode.
+
+Retry tiers:
+    1. the whole batch in one transaction (the normal path);
+    2. on a row-level error (SQLSTATE class 22 data / 23 integrity), the
+       batch is bisected under savepoints within a single transaction, so
+       good rows are stored and only the offending rows are rejected;
+    3. rejected rows go to the dead-letter topic before the transaction
+       commits, and the caller moves on.
+
+After the commit, the newest stored row per device is projected to Redis
+(see latest.py).
+
+Anything else (connection loss, timeouts, ...) is transient: write_batch
+raises and the caller retries the same batch with exponential backoff.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import List, Tuple
+
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import get_settings
+from .db import async_session_maker, get_writer
+from .latest import project_latest
+from .metrics import BATCH_ROWS, FLUSH_SECONDS, ROWS_WRITTEN
+from .mq import DeadLetter, send_dead_letters
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RETRY_BACKOFF_SEC = 1.0
+RETRY_BACKOFF_MAX_SEC = 30.0
+
+# SQLSTATE classes caused by the rows themselves, not the database
+ROW_ERROR_CLASSES = ("22", "23")
+
+write_rows = get_writer(settings.writer)
+
+
+def retry_delay(attempt: int) -> float:
+    """Backoff before retry number `attempt` (1-based) of a transient failure."""
+    return min(RETRY_BACKOFF_SEC * 2 ** (attempt - 1), RETRY_BACKOFF_MAX_SEC)
+
+
+def is_row_error(exc: SQLAlchemyError) -> bool:
+    sqlstate = getattr(getattr(exc, "orig", None), "sqlstate", None)
+    return isinstance(exc, DBAPIError) and str(sqlstate or "")[:2] in ROW_ERROR_CLASSES
+
+
+def _observe_flush(stored: int, started: float) -> None:
+    FLUSH_SECONDS.observe(time.perf_counter() - started)
+    BATCH_ROWS.observe(stored)
+    ROWS_WRITTEN.inc(stored)
+
+
+async def _write_bisect(db: AsyncSession, rows: List[dict]) -> List[Tuple[dict, str]]:
+    """
+    Write rows under a savepoint, splitting on row-level errors.
+
+    Returns:
+        (row, error) for every rejected row.
+    """
+    try:
+        async with db.begin_nested():
+            await write_rows(db, rows)
+        return []
+    except SQLAlchemyError as exc:
+        if not is_row_error(exc):
+            raise
+        if len(rows) == 1:
+            return [(rows[0], str(exc.orig))]
+
+    mid = len(rows) // 2
+    return await _write_bisect(db, rows[:mid]) + await _write_bisect(db, rows[mid:])
+
+
+async def write_batch(rows: List[dict]) -> None:
+    """
+    Store rows, isolating poison rows into the dead-letter topic.
+
+    Raises:
+        SQLAlchemyError: transient DB failure; nothing was stored.
+        KafkaError: dead letters could not be published; nothing was stored.
+    """
+    if not rows:
+        return
+
+    started = time.perf_counter()
+
+    async with async_session_maker() as db:
+        try:
+            await write_rows(db, rows)
+            await db.commit()
+            _observe_flush(len(rows), started)
+            await project_latest(rows)
+            return
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            if not is_row_error(exc):
+                raise
+            logger.warning(
+                "Batch of %d rows rejected (%s); bisecting", len(rows), exc.orig,
+            )
+
+        try:
+            rejected = await _write_bisect(db, rows)
+            await send_dead_letters([DeadLetter.from_row(row, err) for row, err in rejected])
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+
+    rejected_ids = {id(row) for row, _ in rejected}
+    stored = [row for row in rows if id(row) not in rejected_ids]
+
+    _observe_flush(len(stored), started)
+    logger.warning("Stored %d rows, dead-lettered %d", len(stored), len(rejected))
+    await project_latest(stored)
@@ -0,0 +1,76 @@
+# tests/test_batching.py
+import pytest
+
+from app.batching import WAIT_PER_FLUSH, AdaptiveBatcher
+
+
+def _batcher(**overrides):
+    params = dict(
+        batch_size=1000, min_size=250, max_size=2000,
+        min_wait=0.05, max_wait=1.0, slo=1.0, adaptive=True,
+    )
+    params.update(overrides)
+    return AdaptiveBatcher(**params)
+
+
+def test_full_batch_within_slo_grows_additively():
+    batcher = _batcher()
+
+    batcher.on_flush(rows=1000, age=0.2, duration=0.05)
+
+    assert batcher.batch_size == 1250
+
+
+def test_full_batch_missing_slo_halves():
+    batcher = _batcher()
+
+    batcher.on_flush(rows=1000, age=1.5, duration=0.05)
+
+    assert batcher.batch_size == 500
+
+
+def test_partial_batch_keeps_size():
+    """A timer-flushed partial batch says nothing about the size."""
+    batcher = _batcher()
+
+    batcher.on_flush(rows=10, age=1.5, duration=0.05)
+
+    assert batcher.batch_size == 1000
+
+
+def test_size_stays_within_bounds():
+    batcher = _batcher()
+
+    for _ in range(20):
+        batcher.on_flush(rows=batcher.batch_size, age=0.1, duration=0.01)
+    assert batcher.batch_size == 2000
+
+    for _ in range(20):
+        batcher.on_failure()
+    assert batcher.batch_size == 250
+
+
+def test_max_wait_follows_flush_latency_under_slo():
+    batcher = _batcher()
+
+    batcher.on_flush(rows=10, age=0.1, duration=0.02)
+    assert batcher.max_wait == pytest.approx(0.02 * WAIT_PER_FLUSH)
+
+    # slow flushes: the wait is capped so wait + flush still fits the SLO
+    for _ in range(50):
+        batcher.on_flush(rows=10, age=0.1, duration=0.6)
+    assert batcher.max_wait == pytest.approx(0.4, abs=0.01)
+
+    # never below the floor, even when flushes alone exceed the SLO
+    for _ in range(50):
+        batcher.on_flush(rows=10, age=0.1, duration=2.0)
+    assert batcher.max_wait == pytest.approx(0.05)
+
+
+def test_fixed_mode_ignores_feedback():
+    batcher = _batcher(adaptive=False, batch_size=100)
+
+    batcher.on_flush(rows=100, age=5.0, duration=1.0)
+    batcher.on_failure()
+
+    assert (batcher.batch_size, batcher.max_wait) == (100, 1.0)
@@ -0,0 +1,60 @@
+# tests/test_codec.py
+import struct
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.mq.codec import STRUCT_V1, STRUCT_V2, decode_value, encode_json, encode_struct
+from app.schemas import TelemetryItem
+
+
+def _item(event_id=None):
+    return TelemetryItem(
+        device_uuid=uuid4(),
+        x_coord=1.2345,
+        y_coord=-6.789,
+        device_time=datetime(2025, 11, 17, 12, 34, 56, 123456, tzinfo=timezone.utc),
+        system_time_utc=datetime(2025, 11, 17, 12, 35, 0, 654321, tzinfo=timezone.utc),
+        event_id=event_id,
+    )
+
+
+@pytest.mark.parametrize(
+    ("event_id", "version", "size"),
+    [(None, STRUCT_V1, 49), (uuid4(), STRUCT_V2, 65)],
+)
+def test_struct_round_trip(event_id, version, size):
+    """Items without an event_id encode as v1, with one as v2; both decode back exactly."""
+    item = _item(event_id)
+
+    data = encode_struct(item)
+
+    assert (data[0], len(data)) == (version, size)
+    assert TelemetryItem.model_validate(decode_value(data)) == item
+
+
+def test_json_round_trip():
+    """JSON values still decode, so consumers read both formats during a switch."""
+    item = _item(uuid4())
+
+    assert TelemetryItem.model_validate(decode_value(encode_json(item))) == item
+
+
+def test_naive_datetimes_are_taken_as_utc():
+    item = _item().model_copy(update={"device_time": datetime(2025, 1, 1, 0, 0, 0)})
+
+    decoded = decode_value(encode_struct(item))
+
+    assert decoded["device_time"] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"\x7fgarbage", bytes([STRUCT_V1]) + b"\x00" * 10, bytes([STRUCT_V2]) + b"\x00" * 48],
+)
+def test_invalid_values_are_rejected(data):
+    """Empty, unknown-version and truncated values raise instead of decoding junk."""
+    with pytest.raises((ValueError, struct.error)):
+        decode_value(data)
+
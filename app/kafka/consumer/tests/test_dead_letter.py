@@ -0,0 +1,90 @@
+# tests/test_dead_letter.py
+import asyncio
+
+import pytest
+from aiokafka.errors import UnknownTopicOrPartitionError
+
+from app.mq import dead_letter
+from app.mq.dead_letter import DeadLetter
+
+
+class FakeProducer:
+    """AIOKafkaProducer against a cluster where only `topics` exist."""
+
+    instances = []
+
+    def __init__(self, topics=(), **config):
+        self.topics = set(topics)
+        self.stopped = False
+        self.sent = []
+        FakeProducer.instances.append(self)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        self.stopped = True
+
+    async def partitions_for(self, topic):
+        if topic not in self.topics:
+            raise UnknownTopicOrPartitionError()
+        return {0}
+
+    async def send(self, topic, value=None, key=None, headers=None):
+        future = asyncio.get_running_loop().create_future()
+        if topic in self.topics:
+            self.sent.append((topic, value, dict(headers)))
+            future.set_result(None)
+        else:
+            future.set_exception(UnknownTopicOrPartitionError())
+        return future
+
+
+@pytest.fixture(autouse=True)
+def fake_producer(monkeypatch):
+    FakeProducer.instances.clear()
+    monkeypatch.setattr(dead_letter, "_producer", None)
+    yield
+    monkeypatch.setattr(dead_letter, "_producer", None)
+
+
+def _use_cluster(monkeypatch, *topics):
+    monkeypatch.setattr(
+        dead_letter, "AIOKafkaProducer", lambda **config: FakeProducer(topics, **config),
+    )
+
+
+@pytest.mark.asyncio
+async def test_missing_topic_fails_startup(monkeypatch):
+    """Without the DLQ topic the producer does not start, instead of failing batches later."""
+    _use_cluster(monkeypatch, "telemetry")
+
+    with pytest.raises(UnknownTopicOrPartitionError):
+        await dead_letter.init_dead_letter_producer()
+
+    assert FakeProducer.instances[0].stopped
+    assert dead_letter._producer is None
+
+
+@pytest.mark.asyncio
+async def test_send_to_missing_topic_raises(monkeypatch):
+    """A failed DLQ send surfaces, so the caller retries the batch and does not commit it."""
+    _use_cluster(monkeypatch)
+    monkeypatch.setattr(dead_letter, "_producer", FakeProducer())
+
+    with pytest.raises(UnknownTopicOrPartitionError):
+        await dead_letter.send_dead_letters([DeadLetter(stage="decode", error="bad", value=b"x")])
+
+
+@pytest.mark.asyncio
+async def test_dead_letters_are_sent_with_headers(monkeypatch):
+    topic = dead_letter.get_settings().kafka.dead_letter_topic
+    _use_cluster(monkeypatch, topic)
+    producer = await dead_letter.init_dead_letter_producer()
+
+    await dead_letter.send_dead_letters([DeadLetter(stage="write", error="23505", value=b"{}")])
+
+    [(sent_topic, value, headers)] = producer.sent
+    assert (sent_topic, value) == (topic, b"{}")
+    assert headers["dlq.stage"] == b"write"
+    assert headers["dlq.error"] == b"23505"
@@ -0,0 +1,74 @@
+# tests/test_decoder.py
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from aiokafka.structs import ConsumerRecord
+
+from app.mq.codec import encode_json, encode_struct
+from app.mq.decoder import decode_batch
+from app.schemas import TelemetryItem
+
+
+def _item(event_id=None):
+    now = datetime(2025, 11, 17, 12, 35, tzinfo=timezone.utc)
+    return TelemetryItem(
+        device_uuid=uuid4(), x_coord=1.5, y_coord=-2.5,
+        device_time=now, system_time_utc=now, event_id=event_id,
+    )
+
+
+def _record(offset, value):
+    return ConsumerRecord(
+        "telemetry", 0, offset, 0, 0, None, value, None, 0, len(value), (),
+    )
+
+
+def _records(*values):
+    return [_record(i, v) for i, v in enumerate(values)]
+
+
+def test_mixed_json_and_struct_chunk_keeps_order():
+    items = [_item(), _item(uuid4()), _item(uuid4())]
+    records = _records(encode_json(items[0]), encode_struct(items[1]), encode_json(items[2]))
+
+    rows = decode_batch(records)
+
+    assert [TelemetryItem.model_validate(r) for r in rows] == items
+    assert rows[0]["event_id"] is None
+
+
+def test_invalid_record_is_isolated_by_fallback():
+    """One bad JSON value fails the batch pass; the per-record fallback keeps the rest."""
+    good = _item()
+    missing = json.dumps({"device_uuid": str(uuid4()), "x_coord": 1.0}).encode()
+    records = _records(encode_json(good), missing, b"\x7fjunk", encode_json(good))
+    rejected = []
+
+    rows = decode_batch(records, rejected)
+
+    assert rows[1] is None and rows[2] is None
+    assert TelemetryItem.model_validate(rows[0]) == good
+    assert TelemetryItem.model_validate(rows[3]) == good
+    assert [msg.offset for msg, _ in rejected] == [2, 1]
+    assert "y_coord" in rejected[1][1]
+
+
+def test_value_with_several_objects_does_not_shift_rows():
+    """Two objects in one value would misalign the joined array; each record is validated alone."""
+    a, b = _item(), _item()
+    records = _records(encode_json(a) + b"," + encode_json(b), encode_json(b))
+
+    rows = decode_batch(records)
+
+    assert rows[0] is None
+    assert TelemetryItem.model_validate(rows[1]) == b
+
+
+def test_json_with_leading_whitespace_is_accepted():
+    item = _item()
+    records = _records(b"  \n" + encode_json(item), b"\t" + encode_json(item))
+
+    rows = decode_batch(records)
+
+    assert [TelemetryItem.model_validate(r) for r in rows] == [item, item]
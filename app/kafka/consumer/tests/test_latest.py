@@ -0,0 +1,123 @@
+# tests/test_latest.py
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from app import latest
+from app.latest import AliasCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(latest.time, "monotonic", clock)
+    return clock
+
+
+class FakeRegistry:
+    """async_session_maker stand-in answering the alias query from a dict."""
+
+    def __init__(self, aliases):
+        self.aliases = aliases
+        self.queries = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.queries += 1
+        registry = self
+
+        class Result:
+            def tuples(self):
+                return self
+
+            def all(self):
+                return list(registry.aliases.items())
+
+        return Result()
+
+
+def test_alias_cache_expires_and_evicts(clock):
+    cache = AliasCache(maxsize=2, ttl=60)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    cache.set(a, "a")
+    cache.set(b, None)
+
+    assert cache.missing([a, b]) == []
+
+    cache.set(c, "c")  # a is least recently used
+    assert cache.missing([a, b, c]) == [a]
+
+    clock.now += 61
+    assert cache.missing([b, c]) == [b, c]
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_renamed_device_alias_is_refreshed_after_ttl(clock, monkeypatch):
+    device_uuid = uuid4()
+    registry = FakeRegistry({device_uuid: "old"})
+    monkeypatch.setattr(latest, "async_session_maker", registry)
+    monkeypatch.setattr(latest, "_aliases", AliasCache(maxsize=10, ttl=60))
+
+    assert await latest._load_aliases([device_uuid]) == {device_uuid: "old"}
+    registry.aliases[device_uuid] = "new"
+    assert await latest._load_aliases([device_uuid]) == {device_uuid: "old"}
+    assert registry.queries == 1
+
+    clock.now += 61
+    assert await latest._load_aliases([device_uuid]) == {device_uuid: "new"}
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_still_returns_aliases(monkeypatch):
+    device_uuid = uuid4()
+    registry = FakeRegistry({device_uuid: "dev"})
+    monkeypatch.setattr(latest, "async_session_maker", registry)
+    monkeypatch.setattr(latest, "_aliases", AliasCache(maxsize=0, ttl=60))
+
+    assert await latest._load_aliases([device_uuid]) == {device_uuid: "dev"}
+    await latest._load_aliases([device_uuid])
+    assert registry.queries == 2
+
+
+@pytest.mark.asyncio
+async def test_projection_keeps_newest_row(monkeypatch):
+    """The newest row per device wins, and an older batch never moves it back."""
+    device_uuid = uuid4()
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(latest, "redis_client", fake)
+    monkeypatch.setattr(latest.settings, "latest_projection", True)
+    monkeypatch.setattr(latest, "async_session_maker", FakeRegistry({device_uuid: "dev"}))
+    monkeypatch.setattr(latest, "_aliases", AliasCache(maxsize=10, ttl=60))
+
+    t0 = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+    def row(seconds, x):
+        ts = t0 + timedelta(seconds=seconds)
+        return {"device_uuid": device_uuid, "x_coord": x, "y_coord": 0.0,
+                "device_time": ts, "system_time_utc": ts}
+
+    assert await latest.project_latest([row(1, 1.0), row(2, 2.0)]) == 1
+    assert await latest.project_latest([row(0, 9.0)]) == 0
+
+    payload = json.loads(await fake.get(f"telemetry:latest:{device_uuid}"))
+    assert (payload["x_coord"], payload["alias"]) == (2.0, "dev")
@@ -0,0 +1,108 @@
+# tests/test_metrics.py
+import pytest
+from aiokafka.structs import TopicPartition
+from prometheus_client import REGISTRY
+
+from app import metrics, partitioned
+from app.batching import AdaptiveBatcher
+from app.partitioned import PartitionRouter
+
+
+def _gauges(topic, partition):
+    labels = {"topic": topic, "partition": partition}
+    return (
+        REGISTRY.get_sample_value("telemetry_consumer_batch_target_rows", labels),
+        REGISTRY.get_sample_value("telemetry_consumer_flush_max_wait_seconds", labels),
+    )
+
+
+def _batcher(labels):
+    return AdaptiveBatcher(
+        batch_size=1000, min_size=250, max_size=2000,
+        min_wait=0.05, max_wait=1.0, slo=1.0, labels=labels,
+    )
+
+
+def test_batchers_publish_under_their_own_partition():
+    """A slow partition backing off does not hide a fast one growing."""
+    fast, slow = _batcher(("metrics-t", "0")), _batcher(("metrics-t", "1"))
+
+    fast.on_flush(rows=1000, age=0.2, duration=0.05)
+    slow.on_flush(rows=1000, age=1.5, duration=0.3)
+
+    assert _gauges("metrics-t", "0") == (1250, pytest.approx(0.2))
+    assert _gauges("metrics-t", "1") == (500, pytest.approx(0.7))
+
+    fast.close()
+    slow.close()
+
+
+def test_close_drops_the_partition_series():
+    batcher = _batcher(("metrics-t", "2"))
+    assert _gauges("metrics-t", "2") == (1000, 1.0)
+
+    batcher.close()
+    # closing twice (or a never-published batcher) is harmless
+    batcher.close()
+
+    assert _gauges("metrics-t", "2") == (None, None)
+
+
+def test_shared_batcher_publishes_one_series():
+    batcher = AdaptiveBatcher.from_settings()
+
+    assert batcher.labels == ("all", "all")
+    assert _gauges("all", "all")[0] == batcher.batch_size
+
+
+@pytest.mark.asyncio
+async def test_revoked_partition_writer_drops_its_gauges(monkeypatch):
+    async def noop(*args):
+        pass
+
+    monkeypatch.setattr(partitioned, "write_batch", noop)
+    monkeypatch.setattr(partitioned, "send_dead_letters", noop)
+    tp = TopicPartition("metrics-t", 7)
+    router = PartitionRouter()
+
+    await router.on_partitions_assigned({tp})
+    assert _gauges("metrics-t", "7")[0] is not None
+
+    await router.on_partitions_revoked({tp})
+    assert _gauges("metrics-t", "7") == (None, None)
+
+
+class FakeConsumer:
+    def __init__(self, highwater, committed):
+        self._highwater = highwater
+        self._committed = committed
+
+    def assignment(self):
+        return set(self._highwater)
+
+    def highwater(self, tp):
+        return self._highwater[tp]
+
+    async def committed(self, tp):
+        return self._committed.get(tp)
+
+
+@pytest.mark.asyncio
+async def test_lag_refresh_sets_and_drops_partitions():
+    p0, p1 = TopicPartition("lag-t", 0), TopicPartition("lag-t", 1)
+    seen = set()
+
+    await metrics._refresh_lag(FakeConsumer({p0: 120, p1: 40}, {p0: 100}), seen)
+
+    def lag(partition):
+        return REGISTRY.get_sample_value(
+            "telemetry_consumer_lag", {"topic": "lag-t", "partition": partition},
+        )
+
+    # never committed: the whole partition is lag
+    assert (lag("0"), lag("1")) == (20, 40)
+
+    # p1 moved to another consumer; p0 caught up
+    await metrics._refresh_lag(FakeConsumer({p0: 120}, {p0: 120}), seen)
+
+    assert (lag("0"), lag("1")) == (0, None)
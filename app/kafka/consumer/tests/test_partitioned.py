@@ -0,0 +1,152 @@
+# tests/test_partitioned.py
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from aiokafka.structs import ConsumerRecord, TopicPartition
+from sqlalchemy.exc import OperationalError
+
+from app import partitioned
+from app.mq.codec import encode_struct
+from app.partitioned import PartitionRouter
+from app.schemas import TelemetryItem
+
+TP = TopicPartition("telemetry", 0)
+
+
+class FakeConsumer:
+    def __init__(self):
+        self.events = []
+        self.commits = []
+
+    def pause(self, tp):
+        self.events.append(("pause", tp))
+
+    def resume(self, tp):
+        self.events.append(("resume", tp))
+
+    async def commit(self, offsets):
+        self.commits.append(dict(offsets))
+
+
+def _record(offset, tp=TP):
+    now = datetime.now(timezone.utc)
+    value = encode_struct(TelemetryItem(
+        device_uuid=uuid4(), x_coord=1.0, y_coord=2.0,
+        device_time=now, system_time_utc=now,
+    ))
+    return ConsumerRecord(
+        tp.topic, tp.partition, offset, 0, 0, None, value, None, 0, len(value), (),
+    )
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Capture write_batch calls instead of writing to Postgres."""
+    batches = []
+
+    async def write_batch(rows):
+        batches.append(list(rows))
+
+    async def send_dead_letters(dead):
+        pass
+
+    monkeypatch.setattr(partitioned, "write_batch", write_batch)
+    monkeypatch.setattr(partitioned, "send_dead_letters", send_dead_letters)
+    return batches
+
+
+async def _router():
+    router = PartitionRouter()
+    router.consumer = FakeConsumer()
+    await router.on_partitions_assigned({TP})
+    return router
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_and_committed(written):
+    router = await _router()
+    router.writers[TP]._batcher.batch_size = 2
+
+    router.dispatch({TP: [_record(0), _record(1)]})
+    await _settle()
+
+    assert [len(b) for b in written] == [2]
+    assert router.consumer.commits == [{TP: 2}]
+    await router.close_partitions([TP])
+
+
+@pytest.mark.asyncio
+async def test_slow_partition_is_paused_then_resumed(written, monkeypatch):
+    """A writer stuck on the DB pauses its partition at the queue bound, and resumes once drained."""
+    monkeypatch.setattr(partitioned.settings, "pipeline_queue_size", 2)
+    release = asyncio.Event()
+
+    async def slow_write(rows):
+        await release.wait()
+        written.append(list(rows))
+
+    monkeypatch.setattr(partitioned, "write_batch", slow_write)
+    router = await _router()
+    router.writers[TP]._batcher.batch_size = 1
+
+    router.dispatch({TP: [_record(0)]})
+    await _settle()  # writer now blocked flushing offset 0
+    router.dispatch({TP: [_record(1)]})
+    router.dispatch({TP: [_record(2)]})
+    assert router.consumer.events == [("pause", TP)]
+
+    release.set()
+    await _settle()
+
+    assert router.consumer.events == [("pause", TP), ("resume", TP)]
+    await router.close_partitions([TP])
+    assert sum(len(b) for b in written) == 3
+    assert router.consumer.commits[-1] == {TP: 3}
+
+
+@pytest.mark.asyncio
+async def test_revoke_flushes_buffer_and_commits(written):
+    """Revoked partitions get a last flush while still owned."""
+    router = await _router()
+
+    router.dispatch({TP: [_record(5), _record(6)]})
+    await _settle()
+    assert written == []
+
+    await router.on_partitions_revoked({TP})
+
+    assert [len(b) for b in written] == [2]
+    assert router.consumer.commits == [{TP: 7}]
+    assert TP not in router.writers
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_on_revoke_leaves_offsets_uncommitted(monkeypatch):
+    async def failing_write(rows):
+        raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(partitioned, "write_batch", failing_write)
+    router = await _router()
+
+    router.dispatch({TP: [_record(0)]})
+    await _settle()
+    await router.on_partitions_revoked({TP})
+
+    assert router.consumer.commits == []
+
+
+@pytest.mark.asyncio
+async def test_records_for_unassigned_partition_are_dropped(written):
+    router = await _router()
+
+    router.dispatch({TopicPartition("telemetry", 1): [_record(0, TopicPartition("telemetry", 1))]})
+
+    assert list(router.writers) == [TP]
+    await router.close_partitions([TP])
@@ -0,0 +1,96 @@
+# tests/test_sequential.py
+import pytest
+from aiokafka.errors import KafkaTimeoutError
+from aiokafka.structs import TopicPartition
+from sqlalchemy.exc import OperationalError
+
+from app import main
+from app.main import flush_batch
+from app.mq import DeadLetter
+
+TP = TopicPartition("telemetry", 0)
+
+
+class Sink:
+    """
+    Stand-in for write_batch, send_dead_letters and the consumer; records
+    calls in order and raises queued errors in turn.
+    """
+
+    def __init__(self):
+        self.log = []
+        self.write_errors = []
+        self.dead_letter_errors = []
+
+    async def write_batch(self, rows):
+        if self.write_errors:
+            raise self.write_errors.pop(0)
+        self.log.append(("write", len(rows)))
+
+    async def send_dead_letters(self, dead):
+        if self.dead_letter_errors:
+            raise self.dead_letter_errors.pop(0)
+        self.log.append(("dead", len(dead)))
+
+    async def commit(self, offsets):
+        self.log.append(("commit", dict(offsets)))
+
+    def seek(self, tp, offset):
+        self.log.append(("seek", tp, offset))
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    sink = Sink()
+    monkeypatch.setattr(main, "write_batch", sink.write_batch)
+    monkeypatch.setattr(main, "send_dead_letters", sink.send_dead_letters)
+    return sink
+
+
+async def _flush(sink):
+    return await flush_batch(
+        consumer=sink,
+        rows=[{"n": 1}, {"n": 2}],
+        dead=[DeadLetter(stage="decode", error="bad payload", value=b"\x00")],
+        first_offsets={TP: 10},
+        last_offsets={TP: 12},
+    )
+
+
+@pytest.mark.asyncio
+async def test_dead_letters_follow_the_db_commit(sink):
+    assert await _flush(sink)
+
+    assert sink.log == [("write", 2), ("dead", 1), ("commit", {TP: 13})]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_sends_no_dead_letters(sink):
+    """The retried batch decodes the same poison messages again."""
+    sink.write_errors.append(OperationalError("INSERT", {}, Exception("connection lost")))
+
+    assert not await _flush(sink)
+    assert sink.log == [("seek", TP, 10)]
+
+
+@pytest.mark.asyncio
+async def test_retried_batch_dead_letters_once(sink):
+    sink.write_errors.extend([
+        OperationalError("INSERT", {}, Exception("connection lost")),
+        OperationalError("INSERT", {}, Exception("connection lost")),
+    ])
+
+    assert not await _flush(sink)
+    assert not await _flush(sink)
+    assert await _flush(sink)
+
+    assert [entry for entry in sink.log if entry[0] == "dead"] == [("dead", 1)]
+
+
+@pytest.mark.asyncio
+async def test_failed_dead_letter_leaves_offsets_uncommitted(sink):
+    sink.dead_letter_errors.append(KafkaTimeoutError())
+
+    assert not await _flush(sink)
+    # rows are stored; the redelivered batch rewrites them idempotently
+    assert sink.log == [("write", 2), ("seek", TP, 10)]
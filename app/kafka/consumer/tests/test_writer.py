@@ -0,0 +1,132 @@
+# tests/test_writer.py
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+from app.db.writer import write_rows_copy
+
+settings = get_settings()
+
+
+class FakeDriverConnection:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def is_in_transaction(self):
+        return "BEGIN" in self.calls
+
+    async def copy_records_to_table(self, table, *, columns, records):
+        self.calls.append("COPY")
+
+
+class FakeConnection:
+    """AsyncConnection stand-in that opens the transaction on the first execute."""
+
+    def __init__(self, begins=True):
+        self.calls = []
+        self.begins = begins
+
+    async def exec_driver_sql(self, sql):
+        if self.begins and "BEGIN" not in self.calls:
+            self.calls.append("BEGIN")
+        self.calls.append(sql.split()[0])
+
+    async def get_raw_connection(self):
+        return type("Raw", (), {"driver_connection": FakeDriverConnection(self.calls)})()
+
+
+class FakeSession:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def connection(self):
+        return self.conn
+
+
+def _rows(count):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "event_id": uuid4(), "device_uuid": uuid4(), "x_coord": 1.0, "y_coord": 2.0,
+            "device_time": now, "system_time_utc": now,
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_copy_runs_inside_the_session_transaction():
+    conn = FakeConnection()
+
+    await write_rows_copy(FakeSession(conn), _rows(2))
+
+    assert conn.calls == ["BEGIN", "CREATE", "COPY", "WITH"]
+
+
+@pytest.mark.asyncio
+async def test_copy_refuses_to_autocommit():
+    conn = FakeConnection(begins=False)
+
+    with pytest.raises(DBAPIError):
+        await write_rows_copy(FakeSession(conn), _rows(2))
+
+    assert "COPY" not in conn.calls
+
+
+@pytest_asyncio.fixture
+async def session_maker():
+    engine = create_async_engine(settings.postgres_url, connect_args={"timeout": 2})
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 FROM app.telemetry_event LIMIT 1"))
+    except Exception:
+        await engine.dispose()
+        pytest.skip("PostgreSQL with the app schema is not reachable")
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _stored(maker, rows):
+    async with maker() as db:
+        result = await db.execute(
+            text("SELECT count(*) FROM app.telemetry_event WHERE event_id = ANY(:ids)"),
+            {"ids": [row["event_id"] for row in rows]},
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_copy_leaves_no_rows(session_maker):
+    """A failed flush rolls back, so the seek-back replay cannot duplicate rows."""
+    rows = _rows(3)
+
+    async with session_maker() as db:
+        await write_rows_copy(db, rows)
+        await db.rollback()
+
+    assert await _stored(session_maker, rows) == 0
+
+
+@pytest.mark.asyncio
+async def test_committed_copy_stores_rows(session_maker):
+    rows = _rows(3)
+
+    async with session_maker() as db:
+        await write_rows_copy(db, rows)
+        await db.commit()
+
+    try:
+        assert await _stored(session_maker, rows) == 3
+    finally:
+        async with session_maker() as db:
+            await db.execute(
+                text("DELETE FROM app.telemetry_event WHERE event_id = ANY(:ids)"),
+                {"ids": [row["event_id"] for row in rows]},
+            )
+            await db.commit()
@@ -5,17 +5,28 @@ set -euo pipefail
 : "${TOPIC_NAME:?Need TOPIC_NAME}"
 : "${PARTITIONS:=3}"
 : "${REPLICATION_FACTOR:=3}"
+# dead-letter topic of the consumer; empty skips it
+: "${DLQ_TOPIC_NAME=${TOPIC_NAME}.dlq}"
+: "${DLQ_PARTITIONS:=1}"
 
 export CLASSPATH="/opt/aws-msk-iam-auth.jar:${CLASSPATH:-}"
 
-echo "Creating topic: ${TOPIC_NAME}"
-/opt/kafka/bin/kafka-topics.sh \
-  --bootstrap-server "${BOOTSTRAP_SERVERS}" \
-  --command-config /opt/kafka/config/client.properties \
-  --create \
-  --if-not-exists \
-  --topic "${TOPIC_NAME}" \
-  --partitions "${PARTITIONS}" \
-  --replication-factor "${REPLICATION_FACTOR}"
+create_topic() {
+  echo "Creating topic: $1"
+  /opt/kafka/bin/kafka-topics.sh \
+    --bootstrap-server "${BOOTSTRAP_SERVERS}" \
+    --command-config /opt/kafka/config/client.properties \
+    --create \
+    --if-not-exists \
+    --topic "$1" \
+    --partitions "$2" \
+    --replication-factor "${REPLICATION_FACTOR}"
+}
+
+create_topic "${TOPIC_NAME}" "${PARTITIONS}"
+
+if [[ -n "${DLQ_TOPIC_NAME}" ]]; then
+  create_topic "${DLQ_TOPIC_NAME}" "${DLQ_PARTITIONS}"
+fi
 
 echo "Done."
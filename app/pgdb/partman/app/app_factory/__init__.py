@@ -0,0 +1,11 @@
+from .func import (
+    list_partitions,
+    create_future_partitions,
+    drop_expired_partitions,
+)
+
+__all__ = [
+    "list_partitions",
+    "create_future_partitions",
+    "drop_expired_partitions",
+]
@@ -0,0 +1,219 @@
+# app_factory/func.py
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = "app"
+PARENT_TABLE = "telemetry_event"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+# Range bounds of every child partition of app.telemetry_event.
+# The DEFAULT partition has no FROM/TO bounds and is filtered out.
+LIST_PARTITIONS_SQL = text(r"""
+SELECT
+    c.relname            AS name,
+    b[1]::timestamptz    AS lower_bound,
+    b[2]::timestamptz    AS upper_bound
+FROM pg_inherits AS i
+JOIN pg_class AS c
+  ON c.oid = i.inhrelid
+CROSS JOIN LATERAL regexp_match(
+    pg_get_expr(c.relpartbound, c.oid),
+    'FROM \(''([^'']+)''\) TO \(''([^'']+)''\)'
+) AS b
+WHERE i.inhparent = 'app.telemetry_event'::regclass
+  AND b IS NOT NULL
+ORDER BY lower_bound
+""")
+
+# Running total maintained by the telemetry_event count triggers (V016)
+DECREMENT_COUNT_SQL = text("""
+UPDATE app.telemetry_event_count
+SET row_count = row_count - :n,
+    updated_at = NOW()
+WHERE shard = 0
+""")
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    lower_bound: datetime
+    upper_bound: datetime
+
+
+def _period_step(interval: str) -> timedelta:
+    return timedelta(hours=1) if interval == "hourly" else timedelta(days=1)
+
+
+def _period_start(ts: datetime, interval: str) -> datetime:
+    """Floor a timestamp to the start of its daily/hourly period (UTC)."""
+    ts = ts.astimezone(timezone.utc)
+    if interval == "hourly":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _partition_name(start: datetime, interval: str) -> str:
+    fmt = "%Y%m%d%H" if interval == "hourly" else "%Y%m%d"
+    return f"{PARTITION_PREFIX}{start.strftime(fmt)}"
+
+
+async def _create_partition(
+    session: AsyncSession,
+    name: str,
+    lower: datetime,
+    upper: datetime,
+) -> int:
+    """
+    Create the partition for [lower, upper).
+
+    Rows of that range already in the DEFAULT partition (e.g. after the job
+    fell behind) would make a plain CREATE ... PARTITION OF fail, so the
+    partition is then built detached, the rows are moved into it, and it is
+    attached. Inserts into DEFAULT wait on its lock meanwhile; the count
+    triggers are statement-level on the parent and do not fire for the move.
+
+    Returns:
+        Number of rows moved out of DEFAULT.
+    """
+    # DDL takes no bind parameters; bounds are generated here, not user input
+    bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    in_range = "system_time_utc >= :lower AND system_time_utc < :upper"
+    params = {"lower": lower, "upper": upper}
+
+    await session.execute(text(
+        f'LOCK TABLE {SCHEMA}."{DEFAULT_PARTITION}" IN EXCLUSIVE MODE'
+    ))
+    has_rows = (await session.execute(text(
+        f'SELECT EXISTS (SELECT 1 FROM {SCHEMA}."{DEFAULT_PARTITION}" WHERE {in_range})'
+    ), params)).scalar_one()
+
+    if not has_rows:
+        await session.execute(text(
+            f'CREATE TABLE IF NOT EXISTS {SCHEMA}."{name}" '
+            f"PARTITION OF {SCHEMA}.{PARENT_TABLE} {bounds}"
+        ))
+        return 0
+
+    await session.execute(text(
+        f'CREATE TABLE {SCHEMA}."{name}" '
+        f"(LIKE {SCHEMA}.{PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    moved = (await session.execute(text(
+        f"WITH moved AS ("
+        f'  DELETE FROM {SCHEMA}."{DEFAULT_PARTITION}" WHERE {in_range} RETURNING *'
+        f') INSERT INTO {SCHEMA}."{name}" SELECT * FROM moved'
+    ), params)).rowcount
+    await session.execute(text(
+        f'ALTER TABLE {SCHEMA}.{PARENT_TABLE} ATTACH PARTITION {SCHEMA}."{name}" {bounds}'
+    ))
+    return moved
+
+
+async def list_partitions(session: AsyncSession) -> list[Partition]:
+    result = await session.execute(LIST_PARTITIONS_SQL)
+    return [
+        Partition(
+            name=row.name,
+            lower_bound=row.lower_bound,
+            upper_bound=row.upper_bound,
+        )
+        for row in result
+    ]
+
+
+async def create_future_partitions(
+    session: AsyncSession,
+    *,
+    interval: str,
+    premake: int,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Make sure partitions exist from the current period (or the oldest
+    period with rows in the DEFAULT partition) up to `premake` periods ahead.
+
+    Periods already covered by an existing partition (e.g. daily
+    partitions from the migration while running hourly) are skipped,
+    so ranges never overlap. Rows a period already has in the DEFAULT
+    partition are moved into its new partition.
+
+    Returns:
+        Names of the partitions created.
+    """
+    now = now or datetime.now(timezone.utc)
+    step = _period_step(interval)
+    current = _period_start(now, interval)
+    existing = await list_partitions(session)
+
+    # Rows that fell into DEFAULT while the job was not running: start at
+    # their period so they get moved too
+    oldest = (await session.execute(text(
+        f'SELECT MIN(system_time_utc) FROM {SCHEMA}."{DEFAULT_PARTITION}"'
+    ))).scalar_one()
+    start = min(current, _period_start(oldest, interval)) if oldest else current
+    periods = (current - start) // step + premake + 1
+
+    created: list[str] = []
+    for i in range(periods):
+        lower = start + i * step
+        upper = lower + step
+
+        if any(p.lower_bound < upper and lower < p.upper_bound for p in existing):
+            continue
+
+        name = _partition_name(lower, interval)
+        moved = await _create_partition(session, name, lower, upper)
+        existing.append(Partition(name, lower, upper))
+        created.append(name)
+
+        logger.info("Created partition %s [%s, %s) moved_from_default=%d",
+                    name, lower, upper, moved)
+
+    return created
+
+
+async def drop_expired_partitions(
+    session: AsyncSession,
+    *,
+    retention: timedelta,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Detach and drop partitions whose whole range is older than `retention`.
+
+    Returns:
+        Names of the partitions dropped.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - retention
+
+    dropped: list[str] = []
+    for p in await list_partitions(session):
+        if p.upper_bound > cutoff:
+            continue
+
+        await session.execute(text(
+            f'ALTER TABLE {SCHEMA}.{PARENT_TABLE} DETACH PARTITION {SCHEMA}."{p.name}"'
+        ))
+        # DROP fires no DELETE trigger: take the rows off the running count
+        row_count = (await session.execute(
+            text(f'SELECT COUNT(*) FROM {SCHEMA}."{p.name}"')
+        )).scalar_one()
+        await session.execute(DECREMENT_COUNT_SQL, {"n": row_count})
+        await session.execute(text(f'DROP TABLE {SCHEMA}."{p.name}"'))
+        dropped.append(p.name)
+
+        logger.info("Dropped partition %s [%s, %s) rows=%d",
+                    p.name, p.lower_bound, p.upper_bound, row_count)
+
+    return dropped
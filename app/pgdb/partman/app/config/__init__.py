@@ -0,0 +1,9 @@
+# config/__init__.py
+from .setting import get_settings, Settings
+from .logging import setup_logging
+
+__all__ = [
+    "get_settings",
+    "Settings",
+    "setup_logging",
+]
@@ -0,0 +1,5 @@
+from .postgres import async_session_maker
+
+__all__ = [
+    "async_session_maker",
+]
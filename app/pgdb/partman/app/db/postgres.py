@@ -0,0 +1,34 @@
+# db/postgres.py
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Async SQLAlchemy engine
+engine: AsyncEngine = create_async_engine(
+    settings.postgres_url,
+    echo=settings.debug,                    # SQL logging in debug mode only
+    pool_pre_ping=True,                     # Long idle gaps between passes
+    pool_size=1,                            # One maintenance pass at a time
+    max_overflow=0,
+    pool_timeout=3,                         # Seconds to wait for a connection from the pool
+    pool_recycle=1800,                      # Recycle connections every 30 minutes
+    connect_args={
+        "timeout": 5,                       # Connection attempt timeout (asyncpg)
+        "server_settings": {"jit": "off"},  # Disable PostgreSQL JIT
+    },
+)
+
+# Session factory that creates AsyncSession instances
+async_session_maker = async_sessionmaker(
+    engine,
+    expire_on_commit=False,       # Keep instance attributes after commit
+    autoflush=False,              # Explicit flush control
+    class_=AsyncSession,
+)
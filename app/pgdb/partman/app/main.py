@@ -0,0 +1,58 @@
+# main.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy import text
+
+from .config import get_settings, setup_logging
+from .db import async_session_maker
+from .app_factory import create_future_partitions, drop_expired_partitions
+
+setup_logging()
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def run_maintenance() -> None:
+    """One pass: pre-create future partitions, then drop expired ones."""
+    async with async_session_maker() as session:
+        # Partitions must be owned by the same role as the parent table
+        await session.execute(text(f'SET LOCAL ROLE "{settings.owner_role}"'))
+
+        created = await create_future_partitions(
+            session,
+            interval=settings.partition_interval,
+            premake=settings.premake,
+        )
+        dropped = await drop_expired_partitions(
+            session,
+            retention=timedelta(days=settings.retention_days),
+        )
+        await session.commit()
+
+    logger.info(
+        "Partition maintenance done. created=%d dropped=%d",
+        len(created), len(dropped),
+    )
+
+
+async def main() -> None:
+
+    while True:
+        try:
+            await run_maintenance()
+        except Exception:
+            logger.exception("Partition maintenance error")
+
+        if settings.run_once:
+            return
+
+        await asyncio.sleep(settings.poll_interval)
+
+
+if __name__ == "__main__":
+    print("Starting partition maintenance job.")
+    asyncio.run(main())
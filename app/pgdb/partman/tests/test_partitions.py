@@ -0,0 +1,176 @@
+# tests/test_partitions.py
+import re
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.app_factory.func import (
+    DECREMENT_COUNT_SQL,
+    LIST_PARTITIONS_SQL,
+    _period_start,
+    create_future_partitions,
+    drop_expired_partitions,
+)
+
+NOW = datetime(2025, 11, 17, 13, 45, 12, 345678, tzinfo=timezone.utc)
+DAY = timedelta(days=1)
+
+
+def _day(offset):
+    return datetime(2025, 11, 17, tzinfo=timezone.utc) + offset * DAY
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in modelling app.telemetry_event: bounded child
+    partitions with a row count each, plus the DEFAULT partition's rows.
+    """
+
+    def __init__(self, partitions=(), default_rows=(), counts=None):
+        self.partitions = {name: (lower, upper) for name, lower, upper in partitions}
+        self.default_rows = list(default_rows)
+        self.counts = dict(counts or {})
+        self.statements = []
+        self.decremented = []
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.statements.append(sql)
+
+        if stmt is LIST_PARTITIONS_SQL:
+            return [
+                SimpleNamespace(name=name, lower_bound=lower, upper_bound=upper)
+                for name, (lower, upper) in sorted(self.partitions.items(), key=lambda p: p[1])
+            ]
+        if stmt is DECREMENT_COUNT_SQL:
+            self.decremented.append(params["n"])
+            return None
+        if sql.startswith("SELECT MIN(system_time_utc)"):
+            return _scalar(min(self.default_rows, default=None))
+        if sql.startswith("SELECT EXISTS"):
+            return _scalar(any(self._in(ts, params) for ts in self.default_rows))
+        if sql.startswith("WITH moved AS"):
+            moved = [ts for ts in self.default_rows if self._in(ts, params)]
+            self.default_rows = [ts for ts in self.default_rows if not self._in(ts, params)]
+            return SimpleNamespace(rowcount=len(moved))
+        if sql.startswith("SELECT COUNT(*)"):
+            return _scalar(self.counts.get(_name(sql), 0))
+        if "PARTITION OF" in sql or "ATTACH PARTITION" in sql:
+            lower, upper = re.search(r"FROM \('([^']+)'\) TO \('([^']+)'\)", sql).groups()
+            self.partitions[_name(sql)] = (
+                datetime.fromisoformat(lower), datetime.fromisoformat(upper),
+            )
+        elif "DETACH PARTITION" in sql:
+            del self.partitions[_name(sql)]
+        return None
+
+    @staticmethod
+    def _in(ts, params):
+        return params["lower"] <= ts < params["upper"]
+
+    def ran(self, prefix):
+        return [sql for sql in self.statements if sql.startswith(prefix)]
+
+
+def _scalar(value):
+    return SimpleNamespace(scalar_one=lambda: value)
+
+
+def _name(sql):
+    return re.findall(r'app\."([^"]+)"', sql)[-1]
+
+
+@pytest.mark.parametrize(("interval", "expected"), [
+    ("daily", datetime(2025, 11, 17, tzinfo=timezone.utc)),
+    ("hourly", datetime(2025, 11, 17, 13, tzinfo=timezone.utc)),
+])
+def test_period_start_floors_to_interval(interval, expected):
+    assert _period_start(NOW, interval) == expected
+
+
+def test_period_start_uses_utc():
+    """A non-UTC timestamp lands in its UTC period, not its local one."""
+    local = datetime(2025, 11, 18, 1, 0, tzinfo=timezone(timedelta(hours=5)))
+
+    assert _period_start(local, "daily") == datetime(2025, 11, 17, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_creates_current_and_premade_periods():
+    session = FakeSession()
+
+    created = await create_future_partitions(session, interval="daily", premake=2, now=NOW)
+
+    assert created == ["telemetry_event_p20251117", "telemetry_event_p20251118", "telemetry_event_p20251119"]
+    assert session.partitions["telemetry_event_p20251118"] == (_day(1), _day(2))
+    # nothing in DEFAULT: plain CREATE ... PARTITION OF, no move
+    assert not session.ran("WITH moved AS")
+
+
+@pytest.mark.asyncio
+async def test_existing_ranges_are_skipped_not_overlapped():
+    """Hourly periods inside an existing daily partition are not created."""
+    session = FakeSession(partitions=[("telemetry_event_p20251117", _day(0), _day(1))])
+
+    created = await create_future_partitions(session, interval="hourly", premake=11, now=NOW)
+
+    # 13:00 .. 00:00 are covered by the daily partition; only the next day is created
+    assert created == ["telemetry_event_p2025111800"]
+    assert session.partitions["telemetry_event_p2025111800"] == (_day(1), _day(1) + timedelta(hours=1))
+
+
+@pytest.mark.asyncio
+async def test_default_rows_are_moved_into_their_new_partition():
+    """A job that fell behind starts at the oldest DEFAULT row and drains it."""
+    stale = [_day(-2) + timedelta(hours=3), _day(-2) + timedelta(hours=4), _day(0) + timedelta(hours=1)]
+    session = FakeSession(default_rows=stale)
+
+    created = await create_future_partitions(session, interval="daily", premake=0, now=NOW)
+
+    assert created == ["telemetry_event_p20251115", "telemetry_event_p20251116", "telemetry_event_p20251117"]
+    assert session.default_rows == []
+    # periods with rows are built detached and attached; the empty one is not
+    assert len(session.ran("WITH moved AS")) == 2
+    assert len(session.ran("ALTER TABLE app.telemetry_event ATTACH")) == 2
+
+
+@pytest.mark.asyncio
+async def test_drops_only_fully_expired_and_decrements_count():
+    session = FakeSession(
+        partitions=[
+            ("telemetry_event_p20251115", _day(-2), _day(-1)),
+            ("telemetry_event_p20251116", _day(-1), _day(0)),
+            ("telemetry_event_p20251117", _day(0), _day(1)),
+        ],
+        counts={"telemetry_event_p20251115": 40, "telemetry_event_p20251116": 2},
+    )
+
+    dropped = await drop_expired_partitions(session, retention=DAY, now=NOW)
+
+    # cutoff is the 16th 13:45: the 16th itself still holds rows within retention
+    assert dropped == ["telemetry_event_p20251115"]
+    assert session.decremented == [40]
+    assert session.ran('DROP TABLE app."telemetry_event_p20251115"')
+    assert "telemetry_event_p20251116" in session.partitions
+
+
+@pytest.mark.asyncio
+async def test_drop_accounting_sums_every_dropped_partition():
+    session = FakeSession(
+        partitions=[
+            ("telemetry_event_p20251114", _day(-3), _day(-2)),
+            ("telemetry_event_p20251115", _day(-2), _day(-1)),
+        ],
+        counts={"telemetry_event_p20251114": 7, "telemetry_event_p20251115": 5},
+    )
+
+    dropped = await drop_expired_partitions(session, retention=timedelta(hours=1), now=NOW)
+
+    assert dropped == ["telemetry_event_p20251114", "telemetry_event_p20251115"]
+    assert session.decremented == [7, 5]
+    # counted after DETACH, so no insert lands in it after the count
+    statements = session.statements
+    assert statements.index(next(s for s in statements if "DETACH" in s)) < statements.index(
+        next(s for s in statements if s.startswith("SELECT COUNT(*)"))
+    )
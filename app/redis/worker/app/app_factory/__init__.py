@@ -1,7 +1,29 @@
-from .func import fetch_all_latest, sync_latest_rows_to_redis, sync_telemetry_count
+from .func import (
+    fetch_all_latest,
+    prune_processed_outbox,
+    reconcile_telemetry_count,
+    sync_latest_rows_to_redis,
+    sync_outbox_batch,
+    sync_telemetry_count,
+)
+from .stream import (
+    claim_stale_entries,
+    consumer_name,
+    ensure_groups,
+    read_entries,
+    store_entries,
+)
 
 __all__ = [
+    "claim_stale_entries",
+    "consumer_name",
+    "ensure_groups",
     "fetch_all_latest",
+    "prune_processed_outbox",
+    "read_entries",
+    "reconcile_telemetry_count",
+    "store_entries",
     "sync_latest_rows_to_redis",
+    "sync_outbox_batch",
     "sync_telemetry_count",
 ]
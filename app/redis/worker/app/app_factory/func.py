@@ -4,11 +4,17 @@ from __future__ import annotations
 import json
 import logging
 from typing import Sequence, Iterable
+from uuid import UUID
 
-from sqlalchemy import select, update, func
+from sqlalchemy import delete, select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import TelemetryLatest, TelemetryEvent
+from ..models import (
+    TelemetryEvent,
+    TelemetryEventCount,
+    TelemetryLatest,
+    TelemetryLatestOutbox,
+)
 from ..db.redis import redis_client
 
 logger = logging.getLogger(__name__)
@@ -52,6 +58,126 @@ async def fetch_all_latest(session: AsyncSession) -> Sequence[TelemetryLatest]:
     return result.scalars().all()
 
 
+async def claim_outbox_batch(
+    session: AsyncSession,
+    limit: int = BATCH_SIZE,
+) -> Sequence[TelemetryLatestOutbox]:
+    """
+    Lock the oldest NEW outbox rows for this transaction.
+
+    Served by the partial index idx_outbox_new_created_at; SKIP LOCKED lets
+    several workers drain the outbox without blocking each other.
+    """
+    stmt = (
+        select(TelemetryLatestOutbox)
+        .where(TelemetryLatestOutbox.status == "NEW")
+        .order_by(TelemetryLatestOutbox.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+def collapse_newest_per_device(
+    rows: Iterable[TelemetryLatestOutbox],
+) -> dict[UUID, int]:
+    """Reduce outbox rows to the newest version per device."""
+    newest: dict[UUID, int] = {}
+    for r in rows:
+        if r.version > newest.get(r.device_uuid, 0):
+            newest[r.device_uuid] = r.version
+    return newest
+
+
+async def fetch_latest_for_devices(
+    session: AsyncSession,
+    device_uuids: Iterable[UUID],
+) -> Sequence[TelemetryLatest]:
+    device_uuids = list(device_uuids)
+    if not device_uuids:
+        return []
+
+    stmt = select(TelemetryLatest).where(
+        TelemetryLatest.device_uuid.in_(device_uuids)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def delete_outbox_rows(
+    session: AsyncSession,
+    rows: Iterable[TelemetryLatestOutbox],
+) -> None:
+    """
+    Remove synced outbox rows. Nothing reads them once Redis is updated;
+    keeping them only grows the table and the index the claim scans.
+    """
+    outbox_ids = [r.outbox_id for r in rows]
+    if not outbox_ids:
+        return
+
+    stmt = (
+        delete(TelemetryLatestOutbox)
+        .where(TelemetryLatestOutbox.outbox_id.in_(outbox_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(stmt)
+
+
+async def prune_processed_outbox(session: AsyncSession, limit: int = BATCH_SIZE) -> int:
+    """
+    Delete up to `limit` rows left PROCESSED by earlier worker versions,
+    which marked rows instead of deleting them.
+
+    Returns:
+        Number of rows deleted.
+    """
+    doomed = (
+        select(TelemetryLatestOutbox.outbox_id)
+        .where(TelemetryLatestOutbox.status == "PROCESSED")
+        .limit(limit)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        delete(TelemetryLatestOutbox)
+        .where(TelemetryLatestOutbox.outbox_id.in_(doomed))
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def sync_outbox_batch(session: AsyncSession, limit: int = BATCH_SIZE) -> int:
+    """
+    Incremental sync: claim a batch of NEW outbox rows, push the latest
+    snapshot of each touched device to Redis and delete the batch.
+
+    The claim, the Redis writes and the delete share one transaction; if
+    Redis fails the transaction rolls back and the rows stay NEW for the
+    next tick (the Lua version guard makes the retry idempotent).
+
+    Returns:
+        Number of outbox rows claimed.
+    """
+    claimed = await claim_outbox_batch(session, limit)
+    if not claimed:
+        return 0
+
+    # Outbox payloads carry no alias and Redis is versioned by
+    # system_time_utc, so re-read the current snapshot for touched devices.
+    newest = collapse_newest_per_device(claimed)
+    rows = await fetch_latest_for_devices(session, newest.keys())
+    await sync_latest_rows_to_redis(session, rows)
+
+    await delete_outbox_rows(session, claimed)
+    await session.commit()
+
+    logger.debug("Outbox batch synced. claimed=%d devices=%d",
+                 len(claimed), len(newest))
+    return len(claimed)
+
+
 def _row_to_payload(row: TelemetryLatest) -> dict:
     return {
         "device_uuid": str(row.device_uuid),
@@ -65,12 +191,16 @@ def _row_to_payload(row: TelemetryLatest) -> dict:
 
 async def sync_latest_rows_to_redis(session: AsyncSession, rows: Iterable[TelemetryLatest]) -> int:
     """
-    Full refresh: writes every device latest row to Redis.
+    Writes the given device latest rows to Redis.
     Version guard ensures Redis never regresses.
 
     Returns:
         Number of rows that actually updated Redis (Lua returned 1).
     """
+    rows = list(rows)
+    if not rows:
+        return 0
+
     sha = await _get_lua_sha()
     pipe = redis_client.pipeline(transaction=False)
 
@@ -82,7 +212,7 @@ async def sync_latest_rows_to_redis(session: AsyncSession, rows: Iterable[Teleme
         payload_json = json.dumps(_row_to_payload(
             r), separators=(",", ":"), default=str)
 
-        logger.debug(f"{payload_json}")
+        logger.debug("Queued latest payload %s", payload_json)
 
         pipe.evalsha(sha, 2, data_key, ver_key, str(version), payload_json)
 
@@ -96,12 +226,14 @@ async def sync_latest_rows_to_redis(session: AsyncSession, rows: Iterable[Teleme
 
 async def sync_telemetry_count(session: AsyncSession) -> int:
     """
-    Read total telemetry event count from Postgres and write it to Redis.
+    Read the trigger-maintained telemetry event count from Postgres and
+    write it to Redis. Sums a fixed number of shard rows, so the cost does
+    not grow with telemetry_event.
 
     Returns:
         The telemetry_count written to Redis.
     """
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    stmt = select(func.coalesce(func.sum(TelemetryEventCount.row_count), 0))
     result = await session.execute(stmt)
     telemetry_count = int(result.scalar_one())
 
@@ -111,3 +243,40 @@ async def sync_telemetry_count(session: AsyncSession) -> int:
     logger.debug("Synced telemetry count to Redis: %s=%d",
                  TELEMETRY_COUNT_KEY, telemetry_count)
     return telemetry_count
+
+
+async def reconcile_telemetry_count(session: AsyncSession) -> int:
+    """
+    Correct counter drift against an exact COUNT(*).
+
+    The exact count and the shard sum are read from one REPEATABLE READ
+    snapshot, so rows committed meanwhile are excluded from both. The
+    difference is then added to shard 0 in a separate transaction, which
+    is safe alongside concurrent trigger increments.
+
+    Returns:
+        The correction applied (0 when the counter was exact).
+    """
+    await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    exact = int((await session.execute(
+        select(func.count()).select_from(TelemetryEvent)
+    )).scalar_one())
+    counted = int((await session.execute(
+        select(func.coalesce(func.sum(TelemetryEventCount.row_count), 0))
+    )).scalar_one())
+    await session.commit()
+
+    delta = exact - counted
+    if delta:
+        await session.execute(
+            update(TelemetryEventCount)
+            .where(TelemetryEventCount.shard == 0)
+            .values(
+                row_count=TelemetryEventCount.row_count + delta,
+                updated_at=func.now(),
+            )
+        )
+        await session.commit()
+        logger.warning("Telemetry count drift corrected. delta=%d", delta)
+
+    return delta
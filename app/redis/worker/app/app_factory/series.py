@@ -0,0 +1,108 @@
+# app_factory/series.py
+"""
+Recent telemetry series read by the API's listing endpoint
+(see the API's cache/telemetry_series.py for the layout and read side).
+
+    telemetry:series:{uuid}        ZSET, member = TelemetryItem JSON,
+                                   score = system_time_utc in microseconds
+    telemetry:series:{uuid}:since  coverage: the ZSET holds every event
+                                   with score >= since
+
+With INGEST_MODE=stream only this worker adds to the series, after the
+rows have committed, so a listing never shows an event that is still
+queued or that ends up dead-lettered.
+"""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from uuid import UUID
+
+from ..config import get_settings
+from ..db import redis_client
+
+settings = get_settings()
+
+TELEMETRY_SERIES = "telemetry:series"
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Same script as the API's LUA_SERIES_ADD
+# KEYS[1] series, KEYS[2] since
+# ARGV[1] horizon score (older events are dropped), ARGV[2] max events,
+# ARGV[3] ttl seconds, ARGV[4..] score, member pairs
+LUA_SERIES_ADD = """
+local series, cover = KEYS[1], KEYS[2]
+local horizon = tonumber(ARGV[1])
+local max_len = tonumber(ARGV[2])
+
+-- a new series covers from its oldest event; an existing one never moves back
+local since = tonumber(redis.call('GET', cover))
+local is_new = not since
+for i = 4, #ARGV, 2 do
+  local score = tonumber(ARGV[i])
+  if is_new and (not since or score < since) then since = score end
+  redis.call('ZADD', series, ARGV[i], ARGV[i + 1])
+end
+
+redis.call('ZREMRANGEBYSCORE', series, '-inf', '(' .. ARGV[1])
+if horizon > since then since = horizon end
+
+local excess = redis.call('ZCARD', series) - max_len
+if excess > 0 then
+  local cut = redis.call('ZRANGE', series, excess - 1, excess - 1, 'WITHSCORES')
+  redis.call('ZREMRANGEBYRANK', series, 0, excess - 1)
+  local after_cut = tonumber(cut[2]) + 1
+  if after_cut > since then since = after_cut end
+end
+
+redis.call('SET', cover, string.format('%d', since), 'EX', ARGV[3])
+redis.call('EXPIRE', series, ARGV[3])
+return redis.call('ZCARD', series)
+"""
+
+_series_add = redis_client.register_script(LUA_SERIES_ADD)
+
+
+def series_keys(device_uuid: UUID) -> tuple[str, str]:
+    series_key = f"{TELEMETRY_SERIES}:{device_uuid}"
+    return series_key, f"{series_key}:since"
+
+
+def to_score(ts: datetime) -> int:
+    """UTC timestamp -> integer microseconds since the epoch."""
+    return (ts - EPOCH) // timedelta(microseconds=1)
+
+
+def to_member(row: dict) -> str:
+    """telemetry_event row -> TelemetryItem JSON as parsed by the API."""
+    return json.dumps({
+        "device_uuid": str(row["device_uuid"]),
+        "x_coord": row["x_coord"],
+        "y_coord": row["y_coord"],
+        "system_time_utc": row["system_time_utc"].isoformat(),
+        "device_time": row["device_time"].isoformat(),
+        "event_id": str(row["event_id"]),
+    })
+
+
+async def add_rows_to_series(pipe, rows: List[dict]) -> None:
+    """Queue one series update per device for committed rows on a pipeline."""
+    horizon = to_score(datetime.now(timezone.utc)) - settings.telemetry_series_seconds * 1_000_000
+
+    by_device: Dict[UUID, list] = defaultdict(list)
+    for row in rows:
+        by_device[row["device_uuid"]] += [to_score(row["system_time_utc"]), to_member(row)]
+
+    for device_uuid, pairs in by_device.items():
+        await _series_add(
+            keys=list(series_keys(device_uuid)),
+            args=[
+                horizon,
+                settings.telemetry_series_max_events,
+                settings.telemetry_series_seconds,
+                *pairs,
+            ],
+            client=pipe,
+        )
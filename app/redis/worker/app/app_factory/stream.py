@@ -0,0 +1,273 @@
+# app_factory/stream.py
+"""
+Redis Stream -> Postgres writer for INGEST_MODE=stream.
+
+The API XADDs telemetry to STREAM__SHARDS streams ("{key}:{n}"). Every
+worker joins one consumer group on all shards, so entries are spread
+across workers, and:
+
+    1. XREADGROUP a batch from all shards (its own pending entries first,
+       after a restart or a failed write, then new ones);
+    2. INSERT ... ON CONFLICT DO NOTHING on (event_id, system_time_utc) in
+       one transaction; rows the DB rejects are bisected out under
+       savepoints;
+    3. after commit, XACK + XDEL the batch, XADD malformed / rejected
+       entries to the "{key}:dead" stream, add the stored rows to the
+       recent series the API lists from (see series.py) and INCR the
+       listing cache generation of every device written
+       (telemetry:gen:{uuid}, see the API's cache/list_generation.py), in
+       one pipeline. If that pipeline fails the entries stay pending and
+       the whole step is repeated.
+
+Entries left pending by a crashed worker are taken over with XAUTOCLAIM
+once idle for STREAM__CLAIM_IDLE_MS. A batch redelivered after its commit
+(crash before XACK) is skipped by the idempotency index (V017). A pending
+entry whose fields are gone (XDELed or trimmed, e.g. by the API's MAXLEN
+cap) comes back empty: it is XACKed so it leaves the PEL, nothing stored.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import socket
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from redis.exceptions import ResponseError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db import async_session_maker, redis_client
+from ..models import TelemetryEvent
+from .series import add_rows_to_series
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# (stream key, entry id, fields)
+Entry = Tuple[str, str, Dict[str, str]]
+
+# Listing cache generation per device, read by the API
+TELEMETRY_GEN = "telemetry:gen"
+
+# Conflict target of the idempotency index (V017)
+DEDUP_INDEX_ELEMENTS = ["event_id", "system_time_utc"]
+
+# SQLSTATE classes caused by the rows themselves, not the database
+ROW_ERROR_CLASSES = ("22", "23")
+
+
+def stream_keys() -> List[str]:
+    return [f"{settings.stream.key}:{n}" for n in range(settings.stream.shards)]
+
+
+def dead_stream_key() -> str:
+    return f"{settings.stream.key}:dead"
+
+
+def consumer_name() -> str:
+    """Unique per process, so a restarted worker never reuses a PEL."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+async def ensure_groups() -> None:
+    """Create the consumer group (and the shard stream) on every shard if missing."""
+    for key in stream_keys():
+        try:
+            await redis_client.xgroup_create(key, settings.stream.group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+
+def _flatten(response) -> Tuple[List[Entry], Dict[str, List[str]]]:
+    """Split a read into entries and, per key, ids of deleted pending entries."""
+    entries: List[Entry] = []
+    deleted: Dict[str, List[str]] = defaultdict(list)
+    for key, messages in response or []:
+        for entry_id, fields in messages:
+            if fields:
+                entries.append((key, entry_id, fields))
+            else:
+                deleted[key].append(entry_id)
+    return entries, deleted
+
+
+async def _ack_deleted(deleted: Dict[str, List[str]]) -> None:
+    if not deleted:
+        return
+
+    pipe = redis_client.pipeline(transaction=False)
+    for key, entry_ids in deleted.items():
+        pipe.xack(key, settings.stream.group, *entry_ids)
+    await pipe.execute()
+    logger.info(
+        "Acknowledged %d deleted pending stream entries",
+        sum(len(ids) for ids in deleted.values()),
+    )
+
+
+async def read_entries(consumer: str, *, pending: bool) -> List[Entry]:
+    """
+    Read a batch across all shards.
+
+    pending=True re-reads this consumer's unacknowledged entries (no block);
+    otherwise new entries are read, blocking up to STREAM__BLOCK_MS.
+    """
+    keys = stream_keys()
+    per_shard = max(1, settings.stream.batch_size // len(keys))
+    response = await redis_client.xreadgroup(
+        settings.stream.group,
+        consumer,
+        {key: "0" if pending else ">" for key in keys},
+        count=per_shard,
+        block=None if pending else settings.stream.block_ms,
+    )
+    entries, deleted = _flatten(response)
+    await _ack_deleted(deleted)
+    return entries
+
+
+async def claim_stale_entries(consumer: str) -> List[Entry]:
+    """XAUTOCLAIM entries idle longer than STREAM__CLAIM_IDLE_MS (one page per shard)."""
+    entries: List[Entry] = []
+    deleted: Dict[str, List[str]] = {}
+    for key in stream_keys():
+        result = await redis_client.xautoclaim(
+            key,
+            settings.stream.group,
+            consumer,
+            min_idle_time=settings.stream.claim_idle_ms,
+            start_id="0-0",
+            count=settings.stream.batch_size,
+        )
+        # Redis 7 drops deleted ids from the PEL itself (result[2]);
+        # older servers return them with no fields
+        claimed, gone = _flatten([(key, result[1])])
+        entries.extend(claimed)
+        deleted.update(gone)
+    await _ack_deleted(deleted)
+    return entries
+
+
+def decode_entry(fields: Dict[str, str]) -> dict:
+    """
+    Stream entry fields -> telemetry_event row.
+
+    Raises:
+        KeyError / ValueError: malformed entry.
+    """
+    return {
+        "event_id": UUID(fields["event_id"]),
+        "device_uuid": UUID(fields["device_uuid"]),
+        "x_coord": float(fields["x_coord"]),
+        "y_coord": float(fields["y_coord"]),
+        "device_time": datetime.fromisoformat(fields["device_time"]),
+        "system_time_utc": datetime.fromisoformat(fields["system_time_utc"]),
+    }
+
+
+def _is_row_error(exc: SQLAlchemyError) -> bool:
+    sqlstate = getattr(getattr(exc, "orig", None), "sqlstate", None)
+    return isinstance(exc, DBAPIError) and str(sqlstate or "")[:2] in ROW_ERROR_CLASSES
+
+
+async def _insert_rows(session: AsyncSession, rows: List[dict]) -> None:
+    stmt = insert(TelemetryEvent).values(rows).on_conflict_do_nothing(
+        index_elements=DEDUP_INDEX_ELEMENTS,
+    )
+    await session.execute(stmt)
+
+
+async def _insert_bisect(session: AsyncSession, rows: List[Tuple[Entry, dict]]) -> List[Tuple[Entry, str]]:
+    """Insert under a savepoint, splitting on row-level errors; returns rejected entries."""
+    try:
+        async with session.begin_nested():
+            await _insert_rows(session, [row for _, row in rows])
+        return []
+    except SQLAlchemyError as exc:
+        if not _is_row_error(exc):
+            raise
+        if len(rows) == 1:
+            return [(rows[0][0], str(exc.orig))]
+
+    mid = len(rows) // 2
+    return await _insert_bisect(session, rows[:mid]) + await _insert_bisect(session, rows[mid:])
+
+
+async def _acknowledge(
+    entries: Iterable[Entry],
+    dead: List[Tuple[Entry, str]],
+    stored: List[dict],
+) -> None:
+    by_key: Dict[str, List[str]] = defaultdict(list)
+    for key, entry_id, _ in entries:
+        by_key[key].append(entry_id)
+
+    pipe = redis_client.pipeline(transaction=False)
+    await add_rows_to_series(pipe, stored)
+    for device_uuid in {row["device_uuid"] for row in stored}:
+        pipe.incr(f"{TELEMETRY_GEN}:{device_uuid}")
+    for (key, entry_id, fields), error in dead:
+        pipe.xadd(
+            dead_stream_key(),
+            {**fields, "source": f"{key}/{entry_id}", "error": error},
+            maxlen=settings.stream.dead_maxlen or None,
+            approximate=True,
+        )
+    for key, entry_ids in by_key.items():
+        pipe.xack(key, settings.stream.group, *entry_ids)
+        # nothing else reads the shard; keep it from growing
+        pipe.xdel(key, *entry_ids)
+    await pipe.execute()
+
+
+async def store_entries(entries: List[Entry]) -> int:
+    """
+    Store a batch in Postgres, then acknowledge it.
+
+    Raises:
+        SQLAlchemyError / RedisError: nothing was acknowledged; the entries
+        stay pending and are read again.
+
+    Returns:
+        Number of rows written (redelivered duplicates included).
+    """
+    rows: List[Tuple[Entry, dict]] = []
+    dead: List[Tuple[Entry, str]] = []
+
+    for entry in entries:
+        try:
+            rows.append((entry, decode_entry(entry[2])))
+        except (KeyError, ValueError) as exc:
+            dead.append((entry, f"decode: {exc!r}"))
+
+    rejected: List[Tuple[Entry, str]] = []
+    if rows:
+        # an exception closes the session, which rolls the transaction back
+        async with async_session_maker() as session:
+            try:
+                await _insert_rows(session, [row for _, row in rows])
+                await session.commit()
+            except SQLAlchemyError as exc:
+                await session.rollback()
+                if not _is_row_error(exc):
+                    raise
+                rejected = await _insert_bisect(session, rows)
+                await session.commit()
+
+    dead.extend(rejected)
+    # entry ids are per shard: compare (key, id)
+    rejected_ids = {entry[:2] for entry, _ in rejected}
+    stored = [row for entry, row in rows if entry[:2] not in rejected_ids]
+    await _acknowledge(entries, dead, stored)
+
+    if dead:
+        logger.warning(
+            "Dead-lettered %d stream entries to %s", len(dead), dead_stream_key(),
+        )
+    return len(rows) - len(rejected)
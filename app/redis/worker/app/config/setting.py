@@ -61,6 +61,23 @@ class RedisSettings(BaseModel):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+# ==============================
+# Redis Stream
+# ==============================
+class StreamSettings(BaseModel):
+    """Redis Stream ingest configuration (python -m app.stream)."""
+
+    key: str = "telemetry:stream"       # shard n is "{key}:{n}"
+    shards: int = Field(default=4, ge=1)  # must match the API
+    group: str = "telemetry-writers"
+
+    batch_size: int = Field(default=1000, ge=1)   # entries read per shard per call
+    block_ms: int = Field(default=1000, ge=1)     # XREADGROUP block when idle (0 would block forever)
+    claim_idle_ms: int = Field(default=30_000, ge=1)   # reclaim entries pending this long
+    claim_interval: float = Field(default=10.0, gt=0)  # seconds between XAUTOCLAIM sweeps
+    dead_maxlen: int = Field(default=100_000, ge=0)     # approximate cap of the dead stream; 0: none
+
+
 # ==============================
 # Application Settings
 # ==============================
@@ -130,6 +147,37 @@ class Settings(BaseSettings):
         description="The second of polling interval.",
     )
 
+    outbox_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        alias="OUTBOX_BATCH_SIZE",
+        description="Max outbox rows claimed per transaction.",
+    )
+
+    count_reconcile_interval: float = Field(
+        default=0.0,
+        ge=0,
+        alias="COUNT_RECONCILE_INTERVAL",
+        description="Seconds between exact telemetry count reconciliations (0 disables).",
+    )
+
+    # ------------------------------
+    # Recent telemetry series (API listing)
+    # ------------------------------
+    telemetry_series_seconds: int = Field(
+        default=3600,
+        ge=1,
+        alias="TELEMETRY_SERIES_SECONDS",
+        description="Seconds of recent telemetry kept per device in Redis; must match the API.",
+    )
+
+    telemetry_series_max_events: int = Field(
+        default=1000,
+        ge=1,
+        alias="TELEMETRY_SERIES_MAX_EVENTS",
+        description="Max recent telemetry events kept per device in Redis; must match the API.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
@@ -164,6 +212,7 @@ class Settings(BaseSettings):
     # ------------------------------
     postgres: PostgresSettings = PostgresSettings()
     redis: RedisSettings = RedisSettings()
+    stream: StreamSettings = StreamSettings()
 
     # Properties
     @property
@@ -3,11 +3,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 from .config import get_settings, setup_logging
 from .db import async_session_maker
-from .models import TelemetryLatestOutbox
-from .app_factory import fetch_all_latest, sync_latest_rows_to_redis, sync_telemetry_count
+from .app_factory import (
+    fetch_all_latest,
+    prune_processed_outbox,
+    reconcile_telemetry_count,
+    sync_latest_rows_to_redis,
+    sync_outbox_batch,
+    sync_telemetry_count,
+)
 
 POLL_INTERVAL_SEC = 0.5
 
@@ -16,16 +23,72 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
+async def full_refresh() -> None:
+    """Seed Redis with every device latest row (startup only)."""
+    async with async_session_maker() as session:
+        rows = await fetch_all_latest(session)
+        updated = await sync_latest_rows_to_redis(session, rows)
+        logger.info("Full refresh done. updated=%d total=%d",
+                    updated, len(rows))
+
+
+async def drain_outbox() -> int:
+    """Process outbox batches until the backlog is smaller than one batch."""
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            claimed = await sync_outbox_batch(session, settings.outbox_batch_size)
+        total += claimed
+        if claimed < settings.outbox_batch_size:
+            return total
+
+
+async def prune_outbox() -> int:
+    """Delete rows earlier worker versions left PROCESSED, batch by batch."""
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            deleted = await prune_processed_outbox(session, settings.outbox_batch_size)
+        total += deleted
+        if deleted < settings.outbox_batch_size:
+            return total
+
+
+async def maybe_reconcile_count(last_run: float) -> float:
+    """Run the exact count reconciliation when its interval has elapsed."""
+    interval = settings.count_reconcile_interval
+    now = time.monotonic()
+    if interval <= 0 or now - last_run < interval:
+        return last_run
+
+    async with async_session_maker() as session:
+        await reconcile_telemetry_count(session)
+    return now
+
+
 async def main() -> None:
 
+    last_reconcile = float("-inf")
+
+    try:
+        await full_refresh()
+    except Exception:
+        logger.exception("Full refresh error")
+
     while True:
         try:
+            last_reconcile = await maybe_reconcile_count(last_reconcile)
+
             async with async_session_maker() as session:
                 telemetry_count = await sync_telemetry_count(session)
-                logger.debug(f"Sync telemetry count {telemetry_count}.")
+                logger.debug("Sync telemetry count %d.", telemetry_count)
+
+            processed = await drain_outbox()
+            logger.debug("Processed %d outbox rows.", processed)
 
-                rows = await fetch_all_latest(session)
-                await sync_latest_rows_to_redis(session, rows)
+            pruned = await prune_outbox()
+            if pruned:
+                logger.info("Pruned %d processed outbox rows.", pruned)
 
         except Exception:
             logger.exception("Worker error")
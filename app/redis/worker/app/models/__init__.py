@@ -2,6 +2,7 @@
 from .base import Base
 from .device_registry import DeviceRegistry
 from .telemetry_event import TelemetryEvent
+from .telemetry_event_count import TelemetryEventCount
 from .telemetry_latest import TelemetryLatest
 from .telemetry_latest_outbox import TelemetryLatestOutbox
 
@@ -9,6 +10,7 @@ __all__ = [
     "Base",
     "DeviceRegistry",
     "TelemetryEvent",
+    "TelemetryEventCount",
     "TelemetryLatest",
     "TelemetryLatestOutbox",
 ]
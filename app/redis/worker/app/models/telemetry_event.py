@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID as UUID_Type
 
 from sqlalchemy import BigInteger, DateTime, Float
@@ -57,6 +58,12 @@ class TelemetryEvent(Base):
         doc="Server-side UTC timestamp when telemetry was ingested.",
     )
 
+    event_id: Mapped[Optional[UUID_Type]] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="Idempotency key assigned at ingest; unique with system_time_utc.",
+    )
+
     def __repr__(self) -> str:
         return (
             f"<TelemetryEvent id={self.id} device_uuid={self.device_uuid} "
@@ -50,6 +50,12 @@ class TelemetryLatestOutbox(Base):
         doc="Type of outbox message.",
     )
 
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        doc="Monotonic version of the change (source telemetry_event.id).",
+    )
+
     system_time_utc: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -101,6 +107,6 @@ class TelemetryLatestOutbox(Base):
         return (
             f"<TelemetryLatestOutbox outbox_id={self.outbox_id} "
             f"telemetry_event_id={self.telemetry_event_id} device_uuid={self.device_uuid} "
-            f"status={self.status} attempts={self.attempts} "
+            f"version={self.version} status={self.status} attempts={self.attempts} "
             f"system_time_utc={self.system_time_utc} created_at={self.created_at}>"
         )
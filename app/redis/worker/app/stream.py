@@ -0,0 +1,91 @@
+# stream.py
+"""
+Redis Stream ingest worker (python -m app.stream).
+
+Runs next to the outbox worker (python -m app.main) from the same image;
+scale it out by running more replicas, each joins the same consumer group.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import time
+
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+
+from .config import get_settings, setup_logging
+from .app_factory import (
+    claim_stale_entries,
+    consumer_name,
+    ensure_groups,
+    read_entries,
+    store_entries,
+)
+
+RETRY_BACKOFF_SEC = 1.0
+RETRY_BACKOFF_MAX_SEC = 30.0
+
+setup_logging()
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    stop_event = asyncio.Event()
+
+    def request_shutdown() -> None:
+        logger.info("Shutdown requested")
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, request_shutdown)
+        except NotImplementedError:
+            signal.signal(sig, lambda *_: request_shutdown())
+
+    consumer = consumer_name()
+    await ensure_groups()
+    logger.info("Stream worker %s joined group %s", consumer, settings.stream.group)
+
+    # own pending entries are read first: none at start, but a failed
+    # write leaves its batch pending under this consumer
+    pending = False
+    last_claim = float("-inf")
+    failures = 0
+
+    while not stop_event.is_set():
+        try:
+            entries = []
+            if time.monotonic() - last_claim >= settings.stream.claim_interval:
+                entries = await claim_stale_entries(consumer)
+                last_claim = time.monotonic()
+                if entries:
+                    logger.info("Claimed %d stale stream entries", len(entries))
+
+            if not entries:
+                entries = await read_entries(consumer, pending=pending)
+                if pending and not entries:
+                    pending = False
+                    continue
+
+            if entries:
+                stored = await store_entries(entries)
+                logger.debug("Stored %d rows from %d stream entries", stored, len(entries))
+            failures = 0
+
+        except (RedisError, SQLAlchemyError):
+            failures += 1
+            pending = True
+            delay = min(RETRY_BACKOFF_SEC * 2 ** (failures - 1), RETRY_BACKOFF_MAX_SEC)
+            logger.exception("Stream batch failed; retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    logger.info("Stream worker %s stopped", consumer)
+
+
+if __name__ == "__main__":
+    print("Starting stream worker.")
+    asyncio.run(main())
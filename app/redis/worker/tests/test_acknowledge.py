@@ -0,0 +1,114 @@
+# tests/test_acknowledge.py
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from app.app_factory import stream
+from app.app_factory.series import series_keys, to_score
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(stream, "redis_client", fake)
+    monkeypatch.setattr(stream.settings.stream, "shards", 1)
+    await stream.ensure_groups()
+    return fake
+
+
+class FakeSession:
+    """async_session_maker() stand-in; every insert succeeds."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def _fields(device_uuid):
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "event_id": str(uuid4()), "device_uuid": str(device_uuid),
+        "x_coord": "1.5", "y_coord": "2.5", "device_time": now, "system_time_utc": now,
+    }
+
+
+@pytest.mark.asyncio
+async def test_acknowledge_bumps_generation_of_written_devices(fake):
+    """The API's listing cache keys embed telemetry:gen:{uuid}; the worker bumps it after commit."""
+    [key] = stream.stream_keys()
+    written, untouched = uuid4(), uuid4()
+    for _ in range(2):
+        await fake.xadd(key, _fields(written))
+    entries = await stream.read_entries("c1", pending=False)
+
+    await stream._acknowledge(entries, [], [stream.decode_entry(fields) for _, _, fields in entries])
+
+    assert await fake.get(f"{stream.TELEMETRY_GEN}:{written}") == "1"
+    assert await fake.get(f"{stream.TELEMETRY_GEN}:{untouched}") is None
+    # stored entries are acknowledged and removed from the shard
+    assert await fake.xlen(key) == 0
+    assert (await fake.xpending(key, stream.settings.stream.group))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_acknowledge_adds_committed_rows_to_series(fake):
+    """With INGEST_MODE=stream the worker, not the API, fills the listing series."""
+    [key] = stream.stream_keys()
+    device = uuid4()
+    await fake.xadd(key, _fields(device))
+    entries = await stream.read_entries("c1", pending=False)
+    [row] = [stream.decode_entry(fields) for _, _, fields in entries]
+
+    await stream._acknowledge(entries, [], [row])
+
+    series_key, since_key = series_keys(device)
+    [(member, score)] = await fake.zrange(series_key, 0, -1, withscores=True)
+    assert int(score) == to_score(row["system_time_utc"])
+    assert json.loads(member)["event_id"] == str(row["event_id"])
+    assert int(await fake.get(since_key)) == to_score(row["system_time_utc"])
+
+
+@pytest.mark.asyncio
+async def test_dead_lettered_entries_never_reach_series(fake, monkeypatch):
+    [key] = stream.stream_keys()
+    good, bad = uuid4(), uuid4()
+    await fake.xadd(key, _fields(good))
+    await fake.xadd(key, {**_fields(bad), "x_coord": "not-a-float"})
+    monkeypatch.setattr(stream, "async_session_maker", FakeSession)
+    entries = await stream.read_entries("c1", pending=False)
+
+    assert await stream.store_entries(entries) == 1
+
+    assert await fake.zcard(series_keys(good)[0]) == 1
+    assert await fake.exists(*series_keys(bad)) == 0
+    assert await fake.xlen(stream.dead_stream_key()) == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_entries_go_to_dead_stream(fake):
+    [key] = stream.stream_keys()
+    await fake.xadd(key, {"device_uuid": "not-a-uuid"})
+    entries = await stream.read_entries("c1", pending=False)
+    (_, entry_id, _), = entries
+
+    await stream._acknowledge(entries, [(entries[0], "decode: bad uuid")], [])
+
+    [(_, fields)] = await fake.xrange(stream.dead_stream_key())
+    assert fields["source"] == f"{key}/{entry_id}"
+    assert fields["error"] == "decode: bad uuid"
+    assert await fake.xlen(key) == 0
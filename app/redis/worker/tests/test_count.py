@@ -0,0 +1,99 @@
+# tests/test_count.py
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+
+from app.app_factory import func
+from app.app_factory.func import (
+    TELEMETRY_COUNT_KEY,
+    reconcile_telemetry_count,
+    sync_telemetry_count,
+)
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(func, "redis_client", fake)
+    return fake
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in modelling app.telemetry_event_count: one
+    row_count per shard, plus the exact number of telemetry_event rows.
+    """
+
+    def __init__(self, shards, exact=0):
+        self.shards = dict(shards)
+        self.exact = exact
+        self.isolation_level = None
+        self.log = []
+
+    async def connection(self, execution_options=None):
+        self.isolation_level = (execution_options or {}).get("isolation_level")
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.log.append(sql.split()[0])
+
+        if sql.startswith("SELECT count(*)"):
+            return _scalar(self.exact)
+        if sql.startswith("SELECT coalesce(sum("):
+            return _scalar(sum(self.shards.values()))
+        if sql.startswith("UPDATE app.telemetry_event_count"):
+            params = stmt.compile().params
+            self.shards[params["shard_1"]] += params["row_count_1"]
+            return None
+        raise AssertionError(f"unexpected statement: {sql}")
+
+    async def commit(self):
+        self.log.append("COMMIT")
+
+
+def _scalar(value):
+    return SimpleNamespace(scalar_one=lambda: value)
+
+
+@pytest.mark.asyncio
+async def test_sync_writes_the_sum_across_shards(fake):
+    # shard 0 holds the initial count; deletes can leave a shard negative
+    session = FakeSession({0: 1000, 3: 25, 7: -4, 15: 9})
+
+    assert await sync_telemetry_count(session) == 1030
+    assert await fake.get(TELEMETRY_COUNT_KEY) == "1030"
+
+
+@pytest.mark.asyncio
+async def test_sync_with_no_shard_rows_writes_zero(fake):
+    assert await sync_telemetry_count(FakeSession({})) == 0
+    assert await fake.get(TELEMETRY_COUNT_KEY) == "0"
+
+
+@pytest.mark.asyncio
+async def test_reconcile_exact_counter_is_left_alone():
+    session = FakeSession({0: 10, 5: 2}, exact=12)
+
+    assert await reconcile_telemetry_count(session) == 0
+    assert session.log == ["SELECT", "SELECT", "COMMIT"]
+    assert session.shards == {0: 10, 5: 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("exact", "delta"), [(20, 8), (5, -7)])
+async def test_reconcile_applies_drift_to_shard_zero(fake, exact, delta):
+    session = FakeSession({0: 10, 5: 2}, exact=exact)
+
+    assert await reconcile_telemetry_count(session) == delta
+
+    # both reads share one snapshot; the correction is its own transaction
+    assert session.isolation_level == "REPEATABLE READ"
+    assert session.log == ["SELECT", "SELECT", "COMMIT", "UPDATE", "COMMIT"]
+    assert session.shards == {0: 10 + delta, 5: 2}
+
+    # the next sync publishes the corrected total
+    assert await sync_telemetry_count(session) == exact
+    assert await fake.get(TELEMETRY_COUNT_KEY) == str(exact)
@@ -0,0 +1,162 @@
+# tests/test_outbox.py
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+
+from app import main
+from app.app_factory import func
+from app.app_factory.func import (
+    collapse_newest_per_device,
+    sync_latest_rows_to_redis,
+    sync_outbox_batch,
+)
+
+T0 = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(func, "redis_client", fake)
+    monkeypatch.setattr(func, "_lua_sha", None)
+    return fake
+
+
+def _latest(device_uuid, seconds, x=0.0):
+    ts = T0 + timedelta(seconds=seconds)
+    return SimpleNamespace(
+        device_uuid=device_uuid, alias=None, x_coord=x, y_coord=0.0,
+        device_time=ts, system_time_utc=ts,
+    )
+
+
+def _outbox(outbox_id, device_uuid, version):
+    return SimpleNamespace(outbox_id=outbox_id, device_uuid=device_uuid, version=version)
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in: answers the claim and the latest lookup in
+    order and records every statement, commit and rollback.
+    """
+
+    def __init__(self, claimed, latest):
+        self.results = [claimed, latest]
+        self.stmts = []
+        self.sql = []
+        self.log = []
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.stmts.append(stmt)
+        self.sql.append(sql)
+        self.log.append(sql.split()[0])
+        rows = self.results.pop(0) if self.results else []
+
+        class Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return rows
+
+        return Result()
+
+    async def commit(self):
+        self.log.append("COMMIT")
+
+    async def rollback(self):
+        self.log.append("ROLLBACK")
+
+
+def test_collapse_keeps_newest_version_per_device():
+    a, b = uuid4(), uuid4()
+    rows = [_outbox(1, a, 5), _outbox(2, b, 3), _outbox(3, a, 9), _outbox(4, a, 7)]
+
+    assert collapse_newest_per_device(rows) == {a: 9, b: 3}
+
+
+@pytest.mark.asyncio
+async def test_stale_version_never_overwrites_newer(fake):
+    device = uuid4()
+
+    assert await sync_latest_rows_to_redis(None, [_latest(device, 10, x=2.0)]) == 1
+    # an older snapshot (e.g. a lagging worker's batch) is ignored
+    assert await sync_latest_rows_to_redis(None, [_latest(device, 5, x=1.0)]) == 0
+
+    data_key, ver_key = func._redis_keys(str(device))
+    assert json.loads(await fake.get(data_key))["x_coord"] == 2.0
+    assert int(await fake.get(ver_key)) == int((T0 + timedelta(seconds=10)).timestamp() * 1000)
+
+
+@pytest.mark.asyncio
+async def test_claimed_rows_deleted_in_the_claiming_transaction(fake):
+    device = uuid4()
+    claimed = [_outbox(1, device, 1), _outbox(2, device, 2)]
+    session = FakeSession(claimed, [_latest(device, 10)])
+
+    assert await sync_outbox_batch(session, limit=10) == 2
+
+    # claim, re-read, delete, then a single commit
+    assert session.log == ["SELECT", "SELECT", "DELETE", "COMMIT"]
+    assert list(session.stmts[2].compile().params.values()) == [[1, 2]]
+    assert await fake.exists(func._redis_keys(str(device))[0])
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_leaves_claimed_rows(fake, monkeypatch):
+    """Nothing is deleted or committed: the rows stay NEW for the next tick."""
+    device = uuid4()
+    session = FakeSession([_outbox(1, device, 1)], [_latest(device, 10)])
+
+    async def redis_down():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(func, "_get_lua_sha", redis_down)
+
+    with pytest.raises(ConnectionError):
+        await sync_outbox_batch(session, limit=10)
+
+    assert "DELETE" not in session.log and "COMMIT" not in session.log
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_rows_locked_by_other_workers():
+    session = FakeSession([], [])
+
+    assert await func.claim_outbox_batch(session, limit=10) == []
+
+    [sql] = session.sql
+    assert "WHERE app.telemetry_latest_outbox.status = %(status_1)s" in sql
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+@pytest.mark.asyncio
+async def test_drain_outbox_stops_on_short_batch(monkeypatch):
+    monkeypatch.setattr(main.settings, "outbox_batch_size", 100)
+    batches = [100, 100, 37, 100]
+    calls = []
+
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def sync_batch(session, limit):
+        calls.append(limit)
+        return batches.pop(0)
+
+    monkeypatch.setattr(main, "async_session_maker", Session)
+    monkeypatch.setattr(main, "sync_outbox_batch", sync_batch)
+
+    assert await main.drain_outbox() == 237
+    # one session per batch; the short third batch ends the drain
+    assert calls == [100, 100, 100]
@@ -0,0 +1,52 @@
+# tests/test_stream.py
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from app.app_factory import stream
+from app.app_factory.stream import read_entries, claim_stale_entries
+
+
+@pytest_asyncio.fixture
+async def fake(monkeypatch):
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(stream, "redis_client", fake)
+    monkeypatch.setattr(stream.settings.stream, "shards", 1)
+    await stream.ensure_groups()
+    return fake
+
+
+async def _pending_ids(fake, key):
+    return [p["message_id"] for p in await fake.xpending_range(
+        key, stream.settings.stream.group, min="-", max="+", count=100,
+    )]
+
+
+@pytest.mark.asyncio
+async def test_deleted_pending_entries_are_acknowledged(fake):
+    """A pending entry whose fields were deleted is XACKed, not re-read forever."""
+    [key] = stream.stream_keys()
+    gone = await fake.xadd(key, {"event_id": "a"})
+    kept = await fake.xadd(key, {"event_id": "b"})
+    assert len(await read_entries("c1", pending=False)) == 2
+
+    await fake.xdel(key, gone)
+    entries = await read_entries("c1", pending=True)
+
+    assert [entry_id for _, entry_id, _ in entries] == [kept]
+    assert await _pending_ids(fake, key) == [kept]
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_deleted_entries(fake, monkeypatch):
+    monkeypatch.setattr(stream.settings.stream, "claim_idle_ms", 0)
+    [key] = stream.stream_keys()
+    gone = await fake.xadd(key, {"event_id": "a"})
+    kept = await fake.xadd(key, {"event_id": "b"})
+    await read_entries("crashed", pending=False)
+    await fake.xdel(key, gone)
+
+    entries = await claim_stale_entries("c2")
+
+    assert [entry_id for _, entry_id, _ in entries] == [kept]
+    assert await _pending_ids(fake, key) == [kept]
@@ -20,6 +20,7 @@ locals {
   kafka_consumer_env_pgdb_user      = aws_db_instance.postgres.username
   kafka_consumer_env_pgdb_pwd       = aws_db_instance.postgres.password
   kafka_consumer_env_kafka_topic    = var.kafka_topic
+  kafka_consumer_env_kafka_dlq      = var.kafka_dead_letter_topic
   kafka_consumer_env_kafka_group_id = var.svc_param.kafka_consumer_svc.container_env["group_id"]
   kafka_consumer_scale_cpu          = var.threshold_cpu
 }
@@ -76,6 +77,31 @@ data "aws_iam_policy_document" "consumer_msk" {
     ]
   }
 
+  # dead-letter topic
+  statement {
+    sid    = "KafkaTopicWriteDeadLetter"
+    effect = "Allow"
+    actions = [
+      "kafka-cluster:DescribeTopic",
+      "kafka-cluster:WriteData",
+    ]
+    resources = [
+      "arn:aws:kafka:${var.aws_region}:${data.aws_caller_identity.current.account_id}:topic/${aws_msk_cluster.kafka.cluster_name}/${aws_msk_cluster.kafka.cluster_uuid}/${local.kafka_consumer_env_kafka_dlq}"
+    ]
+  }
+
+  # idempotent producer (enable_idempotence)
+  statement {
+    sid    = "KafkaIdempotentWrite"
+    effect = "Allow"
+    actions = [
+      "kafka-cluster:WriteDataIdempotently",
+    ]
+    resources = [
+      "arn:aws:kafka:${var.aws_region}:${data.aws_caller_identity.current.account_id}:cluster/${aws_msk_cluster.kafka.cluster_name}/${aws_msk_cluster.kafka.cluster_uuid}"
+    ]
+  }
+
   # Group
   statement {
     sid    = "KafkaConsumerGroupAccess"
@@ -164,9 +190,12 @@ resource "aws_ecs_task_definition" "ecs_task_consumer" {
     pgdb_pwd        = local.kafka_consumer_env_pgdb_pwd
     pool_size       = local.kafka_consumer_env_pool_size
     max_overflow    = local.kafka_consumer_env_max_overflow
+    redis_host      = aws_elasticache_replication_group.redis.primary_endpoint_address
+    redis_port      = aws_elasticache_replication_group.redis.port
     kafka_bootstrap = aws_msk_cluster.kafka.bootstrap_brokers_sasl_iam
     kafka_group_id  = local.kafka_consumer_env_kafka_group_id
     kafka_topic     = local.kafka_consumer_env_kafka_topic
+    kafka_dlq_topic = local.kafka_consumer_env_kafka_dlq
   })
 
   tags = {
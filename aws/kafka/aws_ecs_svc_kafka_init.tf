@@ -11,6 +11,7 @@ locals {
   kafka_init_memory              = var.task_param.kafka_init.memory
   kafka_init_env_kafka_bootstrap = aws_msk_cluster.kafka.bootstrap_brokers_sasl_iam
   kafka_init_env_topic           = var.kafka_topic # topic
+  kafka_init_env_dlq_topic       = var.kafka_dead_letter_topic
 }
 
 # #################################
@@ -66,7 +67,8 @@ data "aws_iam_policy_document" "kafka_init" {
       "kafka-cluster:WriteData",
     ]
     resources = [
-      "arn:aws:kafka:${var.aws_region}:${data.aws_caller_identity.current.account_id}:topic/${aws_msk_cluster.kafka.cluster_name}/${aws_msk_cluster.kafka.cluster_uuid}/telemetry"
+      "arn:aws:kafka:${var.aws_region}:${data.aws_caller_identity.current.account_id}:topic/${aws_msk_cluster.kafka.cluster_name}/${aws_msk_cluster.kafka.cluster_uuid}/telemetry",
+      "arn:aws:kafka:${var.aws_region}:${data.aws_caller_identity.current.account_id}:topic/${aws_msk_cluster.kafka.cluster_name}/${aws_msk_cluster.kafka.cluster_uuid}/${local.kafka_init_env_dlq_topic}"
     ]
   }
 }
@@ -151,6 +153,7 @@ resource "aws_ecs_task_definition" "kafka_init" {
       environment = [
         { name = "BOOTSTRAP_SERVERS", value = local.kafka_init_env_kafka_bootstrap },
         { name = "TOPIC_NAME", value = local.kafka_init_env_topic },
+        { name = "DLQ_TOPIC_NAME", value = local.kafka_init_env_dlq_topic },
         { name = "PARTITIONS", value = "3" },
         { name = "REPLICATION_FACTOR", value = "3" }
       ]
@@ -0,0 +1,82 @@
+# aws_ecs_svc_partman.tf
+# Scheduled partition maintenance task, see ../modules/ecs_partman.
+
+# #################################
+# Module
+# #################################
+module "partman" {
+  source = "../modules/ecs_partman"
+
+  project    = var.project
+  env        = var.env
+  aws_region = var.aws_region
+
+  image      = "${local.ecr_repo}:${var.task_param.partman.image_suffix}"
+  task_param = var.task_param.partman
+  schedule   = var.partman_schedule
+
+  ecs_cluster_arn = aws_ecs_cluster.ecs_cluster.arn
+  vpc_id          = aws_vpc.main.id
+  subnet_ids      = [for subnet in aws_subnet.private : subnet.id]
+  log_kms_key_arn = aws_kms_key.cloudwatch_log.arn
+
+  pg = {
+    host     = aws_db_instance.postgres.address
+    db       = aws_db_instance.postgres.db_name
+    user     = aws_db_instance.postgres.username # member of the table owner role
+    password = aws_db_instance.postgres.password
+  }
+}
+
+# #################################
+# State: resources moved into the module
+# #################################
+moved {
+  from = aws_iam_role.ecs_task_execution_role_partman
+  to   = module.partman.aws_iam_role.ecs_task_execution_role_partman
+}
+
+moved {
+  from = aws_iam_role_policy_attachment.ecs_task_execution_role_policy_partman
+  to   = module.partman.aws_iam_role_policy_attachment.ecs_task_execution_role_policy_partman
+}
+
+moved {
+  from = aws_iam_role.ecs_task_role_partman
+  to   = module.partman.aws_iam_role.ecs_task_role_partman
+}
+
+moved {
+  from = aws_security_group.partman
+  to   = module.partman.aws_security_group.partman
+}
+
+moved {
+  from = aws_ecs_task_definition.partman
+  to   = module.partman.aws_ecs_task_definition.partman
+}
+
+moved {
+  from = aws_cloudwatch_log_group.partman
+  to   = module.partman.aws_cloudwatch_log_group.partman
+}
+
+moved {
+  from = aws_iam_role.events_run_task_partman
+  to   = module.partman.aws_iam_role.events_run_task_partman
+}
+
+moved {
+  from = aws_iam_role_policy.events_run_task_partman
+  to   = module.partman.aws_iam_role_policy.events_run_task_partman
+}
+
+moved {
+  from = aws_cloudwatch_event_rule.partman
+  to   = module.partman.aws_cloudwatch_event_rule.partman
+}
+
+moved {
+  from = aws_cloudwatch_event_target.partman
+  to   = module.partman.aws_cloudwatch_event_target.partman
+}
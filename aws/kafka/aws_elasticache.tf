@@ -29,6 +29,7 @@ resource "aws_security_group" "redis" {
     security_groups = [
       aws_security_group.fastapi.id,      # allow FastAPI tasks
       aws_security_group.redis-outbox.id, # allow Outbox worker tasks
+      aws_security_group.consumer.id,     # allow Kafka consumer tasks (latest projection)
     ]
   }
 
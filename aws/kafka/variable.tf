@@ -53,6 +53,12 @@ variable "kafka_topic" {
   default = "telemetry"
 }
 
+variable "kafka_dead_letter_topic" {
+  description = "Dead-letter topic of the consumer, created by kafka-init"
+  type        = string
+  default     = "telemetry.dlq"
+}
+
 variable "poll_interval" {
   description = "The second of polling interval"
   type        = number
@@ -129,6 +135,16 @@ variable "task_param" {
       memory        = 1024
       container_env = {}
     }
+    partman = {
+      image_suffix = "partman"
+      cpu          = 256
+      memory       = 512
+      container_env = {
+        partition_interval       = "daily"
+        partition_premake        = "7"
+        partition_retention_days = "30"
+      }
+    }
     kafka_init = {
       image_suffix  = "kafka-init"
       cpu           = 512
@@ -138,6 +154,12 @@ variable "task_param" {
   }
 }
 
+variable "partman_schedule" {
+  type        = string
+  description = "EventBridge schedule of the partition maintenance task"
+  default     = "rate(1 hour)"
+}
+
 # ##############################
 # AWS Elastiredis
 # ##############################
@@ -0,0 +1,186 @@
+# main.tf
+# Partition maintenance for app.telemetry_event (app/pgdb/partman), run as
+# a one-shot Fargate task on an EventBridge schedule. V015 only creates
+# partitions up to a week ahead; without this job new rows land in the
+# DEFAULT partition.
+#
+# Shared by every env (aws/<env>/aws_ecs_svc_partman.tf).
+
+# #################################
+# Variable
+# #################################
+locals {
+  partman_log_id = "/ecs/task/${var.project}-${var.env}-partman"
+}
+
+# #################################
+# IAM: Execution Role
+# #################################
+data "aws_iam_policy_document" "assume_role_ecs" {
+  statement {
+    effect = "Allow"
+    principals {
+      type        = "Service"
+      identifiers = ["ecs-tasks.amazonaws.com"]
+    }
+    actions = ["sts:AssumeRole"]
+  }
+}
+
+resource "aws_iam_role" "ecs_task_execution_role_partman" {
+  name               = "${var.project}-${var.env}-execution-role-partman"
+  assume_role_policy = data.aws_iam_policy_document.assume_role_ecs.json
+}
+
+resource "aws_iam_role_policy_attachment" "ecs_task_execution_role_policy_partman" {
+  role       = aws_iam_role.ecs_task_execution_role_partman.name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy"
+}
+
+# #################################
+# IAM: Task Role
+# #################################
+resource "aws_iam_role" "ecs_task_role_partman" {
+  name               = "${var.project}-${var.env}-task-role-partman"
+  assume_role_policy = data.aws_iam_policy_document.assume_role_ecs.json
+}
+
+# ##############################
+# Security Group
+# ##############################
+resource "aws_security_group" "partman" {
+  name        = "${var.project}-${var.env}-sg-partman"
+  description = "Security group partman"
+  vpc_id      = var.vpc_id
+
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name = "${var.project}-${var.env}-sg-partman"
+  }
+}
+
+# #################################
+# ECS: Task Definition
+# #################################
+resource "aws_ecs_task_definition" "partman" {
+  family                   = "${var.project}-${var.env}-task-partman"
+  requires_compatibilities = ["FARGATE"]
+  network_mode             = "awsvpc"
+  cpu                      = var.task_param.cpu
+  memory                   = var.task_param.memory
+  execution_role_arn       = aws_iam_role.ecs_task_execution_role_partman.arn
+  task_role_arn            = aws_iam_role.ecs_task_role_partman.arn
+
+  container_definitions = templatefile("${path.module}/container/partman.tftpl", {
+    image                    = var.image
+    cpu                      = var.task_param.cpu
+    memory                   = var.task_param.memory
+    awslogs_group            = local.partman_log_id
+    region                   = var.aws_region
+    env                      = var.env
+    pghost                   = var.pg.host
+    pgport                   = 5432
+    pgdatabase               = var.pg.db
+    pguser                   = var.pg.user
+    pgpwd                    = var.pg.password
+    partition_interval       = var.task_param.container_env.partition_interval
+    partition_premake        = var.task_param.container_env.partition_premake
+    partition_retention_days = var.task_param.container_env.partition_retention_days
+  })
+
+  tags = {
+    Name = "${var.project}-${var.env}-task-partman"
+  }
+
+  depends_on = [
+    aws_cloudwatch_log_group.partman,
+  ]
+}
+
+resource "aws_cloudwatch_log_group" "partman" {
+  name              = local.partman_log_id
+  retention_in_days = 7
+
+  kms_key_id = var.log_kms_key_arn
+
+  tags = {
+    Name = local.partman_log_id
+  }
+}
+
+# #################################
+# EventBridge: Schedule
+# #################################
+data "aws_iam_policy_document" "assume_role_events" {
+  statement {
+    effect = "Allow"
+    principals {
+      type        = "Service"
+      identifiers = ["events.amazonaws.com"]
+    }
+    actions = ["sts:AssumeRole"]
+  }
+}
+
+resource "aws_iam_role" "events_run_task_partman" {
+  name               = "${var.project}-${var.env}-events-role-partman"
+  assume_role_policy = data.aws_iam_policy_document.assume_role_events.json
+}
+
+data "aws_iam_policy_document" "events_run_task_partman" {
+  statement {
+    effect    = "Allow"
+    actions   = ["ecs:RunTask"]
+    resources = [aws_ecs_task_definition.partman.arn_without_revision]
+    condition {
+      test     = "ArnEquals"
+      variable = "ecs:cluster"
+      values   = [var.ecs_cluster_arn]
+    }
+  }
+
+  statement {
+    effect  = "Allow"
+    actions = ["iam:PassRole"]
+    resources = [
+      aws_iam_role.ecs_task_execution_role_partman.arn,
+      aws_iam_role.ecs_task_role_partman.arn,
+    ]
+  }
+}
+
+resource "aws_iam_role_policy" "events_run_task_partman" {
+  name   = "${var.project}-${var.env}-events-policy-partman"
+  role   = aws_iam_role.events_run_task_partman.id
+  policy = data.aws_iam_policy_document.events_run_task_partman.json
+}
+
+resource "aws_cloudwatch_event_rule" "partman" {
+  name                = "${var.project}-${var.env}-rule-partman"
+  description         = "Run telemetry_event partition maintenance"
+  schedule_expression = var.schedule
+}
+
+resource "aws_cloudwatch_event_target" "partman" {
+  rule     = aws_cloudwatch_event_rule.partman.name
+  arn      = var.ecs_cluster_arn
+  role_arn = aws_iam_role.events_run_task_partman.arn
+
+  ecs_target {
+    task_definition_arn = aws_ecs_task_definition.partman.arn
+    task_count          = 1
+    launch_type         = "FARGATE"
+
+    network_configuration {
+      subnets          = var.subnet_ids
+      security_groups  = [aws_security_group.partman.id]
+      assign_public_ip = false
+    }
+  }
+}
@@ -0,0 +1,12 @@
+# outputs.tf
+output "task_definition_arn" {
+  value = aws_ecs_task_definition.partman.arn
+}
+
+output "event_rule_name" {
+  value = aws_cloudwatch_event_rule.partman.name
+}
+
+output "security_group_id" {
+  value = aws_security_group.partman.id
+}
@@ -0,0 +1,72 @@
+# variables.tf
+
+# ##############################
+# General
+# ##############################
+variable "project" {
+  type = string
+}
+
+variable "env" {
+  type = string
+}
+
+variable "aws_region" {
+  type = string
+}
+
+# ##############################
+# Task
+# ##############################
+variable "image" {
+  type        = string
+  description = "Partman image (ECR repo:tag)"
+}
+
+variable "task_param" {
+  type = object({
+    cpu    = number
+    memory = number
+    container_env = object({
+      partition_interval       = string
+      partition_premake        = string
+      partition_retention_days = string
+    })
+  })
+  description = "Task size and partition settings (the env's task_param.partman)"
+}
+
+variable "schedule" {
+  type        = string
+  description = "EventBridge schedule of the partition maintenance task"
+}
+
+# ##############################
+# Env resources
+# ##############################
+variable "ecs_cluster_arn" {
+  type = string
+}
+
+variable "vpc_id" {
+  type = string
+}
+
+variable "subnet_ids" {
+  type        = list(string)
+  description = "Private subnets the task runs in"
+}
+
+variable "log_kms_key_arn" {
+  type = string
+}
+
+variable "pg" {
+  type = object({
+    host     = string
+    db       = string
+    user     = string # member of the table owner role
+    password = string
+  })
+  sensitive = true
+}
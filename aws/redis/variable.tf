@@ -89,9 +89,25 @@ variable "task_param" {
       memory        = 1024
       container_env = {}
     }
+    partman = {
+      image_suffix = "partman"
+      cpu          = 256
+      memory       = 512
+      container_env = {
+        partition_interval       = "daily"
+        partition_premake        = "7"
+        partition_retention_days = "30"
+      }
+    }
   }
 }
 
+variable "partman_schedule" {
+  type        = string
+  description = "EventBridge schedule of the partition maintenance task"
+  default     = "rate(1 hour)"
+}
+
 # ##############################
 # AWS Elasticache
 # ##############################
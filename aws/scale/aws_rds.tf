@@ -24,8 +24,9 @@ resource "aws_security_group" "postgres" {
     to_port     = 5432
     protocol    = "tcp"
     security_groups = [
-      aws_security_group.fastapi.id, # allow fastapi
-      aws_security_group.flyway.id,  # allow flyway
+      aws_security_group.fastapi.id,    # allow fastapi
+      aws_security_group.flyway.id,     # allow flyway
+      module.partman.security_group_id, # allow partition maintenance
     ]
     # cidr_blocks = ["0.0.0.0/0"]
   }